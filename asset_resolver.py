@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더링 중 네트워크 요청 차단 및 로컬 리소스 제공 (playwright 요청 가로채기)
+페이지를 가상 주소 http://render.local/ 에서 열고, 모든 요청을 가로채서
+    - render.local 요청: base_dir의 파일(styles.css, script.js, 폰트, 이미지)을 메모리 캐시에서 제공
+    - mirrors에 등록된 외부 주소: 지정한 로컬 파일로 제공 (폰트 CSS 등을 미리 받아 둔 경우)
+    - 그 밖의 외부 요청: 빈 응답으로 대체(stub)하거나 차단(block), 또는 그대로 허용(allow)
+격리된 렌더링 노드에서 폰트 CDN 요청이 시간 초과될 때까지 기다리지 않으므로
+networkidle 대기가 네트워크와 무관하게 일정해집니다.
+
+사용 예:
+    resolver = AssetResolver.for_html("index.html")
+    resolver.install(page)
+    page.goto(resolver.url_for("index.html"))
+"""
+
+import os
+import posixpath
+import threading
+from urllib.parse import unquote, urlparse
+
+VIRTUAL_HOST = "render.local"
+VIRTUAL_ORIGIN = f"http://{VIRTUAL_HOST}"
+
+EXTERNAL_POLICIES = ("stub", "block", "allow")
+
+# mimetypes가 모르는 형식 보완
+_CONTENT_TYPES = {
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".ttf": "font/ttf",
+    ".otf": "font/otf",
+    ".svg": "image/svg+xml",
+    ".webp": "image/webp",
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+}
+
+# 외부 요청을 대체할 빈 응답 (리소스 종류별)
+_STUB_RESPONSES = {
+    "stylesheet": ("text/css", b""),
+    "script": ("application/javascript", b""),
+    # 1x1 투명 GIF
+    "image": ("image/gif", b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00!\xf9\x04\x01\x00\x00\x00\x00"
+                           b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"),
+}
+
+# playwright 요청이 아닐 때(weasyprint 등) 확장자로 추정하는 리소스 종류
+_RESOURCE_TYPES = {
+    ".css": "stylesheet",
+    ".js": "script",
+    ".png": "image", ".jpg": "image", ".jpeg": "image", ".gif": "image",
+    ".svg": "image", ".webp": "image", ".ico": "image",
+    ".woff": "font", ".woff2": "font", ".ttf": "font", ".otf": "font",
+}
+
+# 파일 내용 메모리 캐시 {절대 경로: (mtime_ns, size, 바이트)} (프로세스 전체에서 공유)
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+def content_type_for(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in _CONTENT_TYPES:
+        return _CONTENT_TYPES[extension]
+    # mimetypes는 처음 사용할 때 시스템 형식 목록을 읽으므로 필요할 때만 가져옴
+    import mimetypes
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+def resource_type_for(url):
+    """URL 확장자로 추정한 리소스 종류 (playwright request.resource_type 대신 사용, 모르면 None)"""
+
+    extension = posixpath.splitext(urlparse(url).path)[1].lower()
+    return _RESOURCE_TYPES.get(extension)
+
+def is_within(path, base_dir):
+    """path가 base_dir 안의 경로인지 (심볼릭 링크를 따라간 실제 경로 기준)"""
+
+    base_dir = os.path.realpath(base_dir)
+    try:
+        return os.path.commonpath([os.path.realpath(path), base_dir]) == base_dir
+    except ValueError:
+        # 드라이브가 다른 경로 (Windows)
+        return False
+
+def read_cached(path):
+    """파일 내용 (수정 시각/크기가 같으면 메모리 캐시 사용, 없으면 None)"""
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    with _file_cache_lock:
+        _file_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+class AssetResolver:
+    """render.local 요청을 로컬 리소스로 처리하고 외부 요청을 막는 요청 처리기
+
+    - base_dir: http://render.local/ 에 대응하는 폴더
+    - assets: 파일 대신 제공할 메모리 리소스 {경로: 바이트 또는 (content_type, 바이트)}
+    - mirrors: 외부 주소를 대신할 로컬 파일 {URL: 파일 경로}
+    - external: 그 밖의 외부 요청 처리 방식 ("stub": 빈 응답, "block": 요청 실패, "allow": 네트워크로 보냄)
+    - allowed: render.local로 제공할 base_dir 파일 경로 목록 (None이면 base_dir 전체, 목록에 없으면 404)
+    """
+
+    def __init__(self, base_dir, assets=None, mirrors=None, external="stub", allowed=None):
+        if external not in EXTERNAL_POLICIES:
+            raise ValueError(f"알 수 없는 외부 요청 처리 방식: {external} (가능: {', '.join(EXTERNAL_POLICIES)})")
+
+        self.base_dir = os.path.abspath(base_dir)
+        self.mirrors = dict(mirrors or {})
+        self.external = external
+        self.allowed = None if allowed is None else {self._normalize(self._relative(path)) for path in allowed}
+        self._assets = {}
+        self._lock = threading.Lock()
+        self.stats = {"served": 0, "missing": 0, "mirrored": 0, "stubbed": 0, "blocked": 0, "allowed": 0}
+
+        for path, asset in (assets or {}).items():
+            self.add(path, *(asset if isinstance(asset, tuple) else (None, asset)))
+
+    @classmethod
+    def for_html(cls, html_file, **options):
+        """html_file이 있는 폴더를 기준으로 하는 처리기"""
+
+        return cls(os.path.dirname(os.path.abspath(html_file)), **options)
+
+    def add(self, path, content_type=None, data=b""):
+        """메모리 리소스 추가 (path: render.local 기준 경로, 예: "job.html")"""
+
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        key = self._normalize(path)
+        with self._lock:
+            self._assets[key] = (content_type or content_type_for(key), data)
+        return self.url_for(key)
+
+    def remove(self, path):
+        with self._lock:
+            self._assets.pop(self._normalize(path), None)
+
+    def url_for(self, path):
+        """파일 경로(base_dir 기준 또는 절대 경로)의 render.local 주소"""
+
+        return f"{VIRTUAL_ORIGIN}/{self._normalize(self._relative(path))}"
+
+    def serves(self, path):
+        """base_dir 파일을 render.local로 제공하는지 (base_dir 밖이거나 allowed에 없으면 False)"""
+
+        if not is_within(path, self.base_dir):
+            return False
+        return self.allowed is None or self._normalize(self._relative(os.path.abspath(path))) in self.allowed
+
+    def _relative(self, path):
+        return os.path.relpath(path, self.base_dir) if os.path.isabs(path) else path
+
+    @staticmethod
+    def _normalize(path):
+        return posixpath.normpath("/" + path.replace(os.sep, "/")).lstrip("/")
+
+    def resolve(self, url, resource_type=None):
+        """요청 처리 방법: ("fulfill", {status, content_type, body}), ("abort", None) 또는 ("continue", None)"""
+
+        parsed = urlparse(url)
+        if parsed.scheme in ("data", "blob"):
+            return "continue", None
+
+        if parsed.netloc == VIRTUAL_HOST:
+            key = self._normalize(unquote(parsed.path))
+            with self._lock:
+                asset = self._assets.get(key)
+            if asset is None and (self.allowed is None or key in self.allowed):
+                path = os.path.join(self.base_dir, *key.split("/"))
+                data = read_cached(path) if key else None
+                asset = (content_type_for(path), data) if data is not None else None
+
+            if asset is None:
+                self._count("missing")
+                return "fulfill", {"status": 404, "content_type": "text/plain", "body": b""}
+            self._count("served")
+            return "fulfill", {"status": 200, "content_type": asset[0], "body": asset[1]}
+
+        if url in self.mirrors:
+            data = read_cached(self.mirrors[url])
+            if data is not None:
+                self._count("mirrored")
+                return "fulfill", {"status": 200, "content_type": content_type_for(self.mirrors[url]), "body": data}
+
+        if self.external == "allow":
+            self._count("allowed")
+            return "continue", None
+
+        if self.external == "stub" and resource_type in _STUB_RESPONSES:
+            self._count("stubbed")
+            content_type, body = _STUB_RESPONSES[resource_type]
+            return "fulfill", {"status": 200, "content_type": content_type, "body": body}
+
+        self._count("blocked")
+        return "abort", None
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _handle(self, route, request):
+        action, response = self.resolve(request.url, request.resource_type)
+        if action == "fulfill":
+            route.fulfill(**response)
+        elif action == "abort":
+            route.abort("blockedbyclient")
+        else:
+            route.continue_()
+
+    async def _async_handle(self, route, request):
+        action, response = self.resolve(request.url, request.resource_type)
+        if action == "fulfill":
+            await route.fulfill(**response)
+        elif action == "abort":
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    def install(self, page):
+        """page(또는 browser context)의 모든 요청을 이 처리기로 가로챔 (playwright.sync_api)"""
+
+        page.route("**/*", self._handle)
+
+    async def async_install(self, page):
+        """install의 playwright.async_api 버전"""
+
+        await page.route("**/*", self._async_handle)
+
+def prepare_page(page, html_file_path, resolver=None):
+    """page.goto에 넘길 주소 (resolver가 있으면 요청 가로채기를 설치하고 render.local 주소 사용)"""
+
+    if resolver is None:
+        return f"file:///{html_file_path.replace(os.sep, '/').lstrip('/')}"
+    resolver.install(page)
+    return resolver.url_for(html_file_path)
+
+async def async_prepare_page(page, html_file_path, resolver=None):
+    """prepare_page의 playwright.async_api 버전"""
+
+    if resolver is None:
+        return f"file:///{html_file_path.replace(os.sep, '/').lstrip('/')}"
+    await resolver.async_install(page)
+    return resolver.url_for(html_file_path)
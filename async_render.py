@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio용 HTML to PDF 렌더링 API (playwright.async_api 사용)
+브라우저 하나에서 여러 페이지를 동시에 렌더링하고, 파일 대신 PDF 바이트를 반환합니다.
+
+사용 예:
+    async with AsyncRenderer(concurrency=8) as renderer:
+        pdf_bytes = await renderer.render_pdf("index.html", profile="landscape")
+"""
+
+import asyncio
+import os
+
+from playwright.async_api import async_playwright
+
+import landscape_pdf
+import simple_pdf
+from asset_resolver import async_prepare_page
+from render_ready import PRINT_MODE_SCRIPT, async_wait_for_render_ready
+
+# 프로필별 렌더링 설정 (simple_pdf / landscape_pdf와 동일)
+PROFILES = {
+    "portrait": {
+        "viewport": simple_pdf.VIEWPORT,
+        "pdf_options": simple_pdf.PDF_OPTIONS,
+        "css": None,
+    },
+    "landscape": {
+        "viewport": landscape_pdf.VIEWPORT,
+        "pdf_options": landscape_pdf.PDF_OPTIONS,
+        "css": landscape_pdf.PDF_OPTIMIZED_CSS,
+    },
+}
+
+class AsyncRenderer:
+    """브라우저 하나를 공유하며 동시 렌더링 수를 제한하는 비동기 렌더러
+
+    - concurrency: 동시에 열 수 있는 최대 페이지 수
+    - launch_options: chromium.launch()에 그대로 전달할 옵션
+    """
+
+    def __init__(self, concurrency=4, launch_options=None):
+        if concurrency < 1:
+            raise ValueError("concurrency는 1 이상이어야 합니다.")
+
+        self.concurrency = concurrency
+        self.launch_options = {"headless": True, **(launch_options or {})}
+
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._playwright_manager = None
+        self._playwright = None
+        self._browser = None
+        self._start_lock = asyncio.Lock()
+
+    async def start(self):
+        """playwright와 브라우저 실행"""
+        async with self._start_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright_manager = async_playwright()
+                    self._playwright = await self._playwright_manager.start()
+                self._browser = await self._playwright.chromium.launch(**self.launch_options)
+        return self
+
+    async def close(self):
+        """브라우저와 playwright 종료"""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                # 이미 죽은 브라우저는 닫기 실패를 무시
+                pass
+            self._browser = None
+
+        if self._playwright_manager is not None:
+            await self._playwright_manager.__aexit__(None, None, None)
+        self._playwright_manager = None
+        self._playwright = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def render_pdf(self, html_file="index.html", profile="portrait", resolver=None):
+        """HTML 파일을 PDF로 렌더링하여 바이트로 반환 (실패 시 예외 발생, resolver: 외부 요청 차단)"""
+
+        if profile not in PROFILES:
+            raise ValueError(f"알 수 없는 프로필: {profile} (가능: {', '.join(PROFILES)})")
+        if not os.path.exists(html_file):
+            raise FileNotFoundError(f"{html_file} 파일을 찾을 수 없습니다.")
+
+        settings = PROFILES[profile]
+        html_file_path = os.path.abspath(html_file)
+
+        async with self._semaphore:
+            # 브라우저가 죽었으면 다시 실행
+            await self.start()
+
+            context = await self._browser.new_context(viewport=settings["viewport"])
+            try:
+                page = await context.new_page()
+                # script.js 인쇄 모드 (스크롤/애니메이션 처리 생략)
+                await page.add_init_script(PRINT_MODE_SCRIPT)
+
+                if settings["css"]:
+                    await page.add_init_script(landscape_pdf.style_injection_script(settings["css"]))
+
+                await page.goto(await async_prepare_page(page, html_file_path, resolver))
+                await page.wait_for_load_state('networkidle')
+                await async_wait_for_render_ready(page)
+
+                return await page.pdf(**settings["pdf_options"])
+            finally:
+                await context.close()
+
+    async def render_many(self, html_files, profile="portrait", return_exceptions=False, resolver=None):
+        """여러 HTML 파일을 동시에 렌더링하여 입력 순서대로 PDF 바이트 목록 반환"""
+
+        tasks = [self.render_pdf(html_file, profile, resolver) for html_file in html_files]
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+async def create_pdf_bytes(html_file="index.html"):
+    """simple_pdf.create_pdf의 비동기 버전 (세로형 PDF 바이트 반환)"""
+
+    async with AsyncRenderer(concurrency=1) as renderer:
+        return await renderer.render_pdf(html_file, profile="portrait")
+
+async def create_landscape_pdf_bytes(html_file="index.html"):
+    """landscape_pdf.create_landscape_pdf의 비동기 버전 (가로형 PDF 바이트 반환)"""
+
+    async with AsyncRenderer(concurrency=1) as renderer:
+        return await renderer.render_pdf(html_file, profile="landscape")
+
+if __name__ == "__main__":
+    async def _main():
+        print("🎬 비동기 PDF 변환을 시작합니다...")
+        async with AsyncRenderer(concurrency=2) as renderer:
+            portrait, landscape = await asyncio.gather(
+                renderer.render_pdf("index.html", profile="portrait"),
+                renderer.render_pdf("index.html", profile="landscape"),
+            )
+        print(f"✅ 세로형 PDF: {len(portrait):,} bytes")
+        print(f"✅ 가로형 PDF: {len(landscape):,} bytes")
+
+    asyncio.run(_main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 HTML 입력을 한 프로세스에서 PDF로 변환하는 배치 스크립트
+매니페스트(JSON/CSV)에 적힌 입력 HTML, 출력 경로, 프로필 목록을 하나의 런타임으로 처리합니다.
+
+매니페스트 예 (JSON):
+    [
+        {"input": "index.html", "output": "out/a.pdf", "profile": "portrait"},
+        {"input": "index.html", "output": "out/b.pdf", "profile": "landscape"}
+    ]
+
+매니페스트 예 (CSV, 첫 줄은 헤더):
+    input,output,profile
+    index.html,out/a.pdf,weasyprint
+
+프로필:
+    portrait   - simple_pdf (playwright, 세로형 A4)
+    landscape  - landscape_pdf (playwright, 가로형 A4)
+    weasyprint - create_pdf (weasyprint)
+    pptx       - create_ppt (python-pptx, input 없이 output만 사용)
+
+입력이 바뀌지 않은 작업은 --cache-dir로 지정한 렌더링 캐시에서 바로 복사합니다.
+--optimize를 지정하면 PDF 결과물의 폰트를 서브셋하고 중복 객체를 합쳐 용량을 줄입니다(pdf_optimize).
+--offline을 지정하면 playwright 프로필에서 외부 요청을 막고 로컬 리소스만 사용합니다(asset_resolver).
+--bundle-css를 지정하면 landscape/weasyprint 프로필에서 인쇄에 필요한 규칙만 남긴 CSS 번들을 사용합니다(css_bundle).
+
+사용법:
+    python batch_render.py manifest.json [--report report.json] [--cache-dir .render_cache] [--optimize]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+PROFILES = ("portrait", "landscape", "weasyprint", "pptx")
+PLAYWRIGHT_PROFILES = ("portrait", "landscape")
+
+# 인쇄용 CSS 번들(css_bundle)을 지원하는 프로필
+BUNDLE_PROFILES = ("landscape", "weasyprint")
+DEFAULT_PROFILE = "portrait"
+
+def load_manifest(manifest_file):
+    """매니페스트 파일을 읽어 작업 목록 반환 (상대 경로는 매니페스트 위치 기준)"""
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_file))
+
+    with open(manifest_file, 'r', encoding='utf-8-sig', newline='') as f:
+        if manifest_file.lower().endswith('.csv'):
+            entries = list(csv.DictReader(f))
+        else:
+            entries = json.load(f)
+            if isinstance(entries, dict):
+                entries = entries.get("jobs", [])
+
+    if not isinstance(entries, list):
+        raise ValueError("매니페스트는 작업 목록(배열)이어야 합니다.")
+
+    jobs = []
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{index}번째 항목이 객체가 아닙니다: {entry!r}")
+        for key in ("input", "output", "profile"):
+            if entry.get(key) is not None and not isinstance(entry[key], str):
+                raise ValueError(f"{index}번째 항목의 {key} 값은 문자열이어야 합니다: {entry[key]!r}")
+
+        html_file = (entry.get("input") or "").strip()
+        output_file = (entry.get("output") or "").strip()
+        profile = (entry.get("profile") or DEFAULT_PROFILE).strip().lower()
+
+        if not output_file or (not html_file and profile != "pptx"):
+            raise ValueError(f"{index}번째 항목에 input/output이 없습니다: {entry}")
+        if profile not in PROFILES:
+            raise ValueError(f"{index}번째 항목의 프로필을 알 수 없습니다: {profile} (가능: {', '.join(PROFILES)})")
+
+        jobs.append({
+            "input": os.path.join(base_dir, html_file) if html_file else None,
+            "output": os.path.join(base_dir, output_file),
+            "profile": profile,
+        })
+
+    return jobs
+
+class BatchRenderer:
+    """배치 전체에서 하나의 런타임(브라우저 풀)을 공유하는 렌더러
+
+    playwright 프로필 작업이 처음 나올 때 브라우저 풀을 시작하고, 배치가 끝나면 닫습니다.
+    cache(RenderCache)가 주어지면 입력이 같은 작업은 렌더링하지 않고 캐시에서 복사합니다.
+    optimize가 True이면 PDF 프로필 결과물을 pdf_optimize로 최적화합니다 (캐시에는 최적화된 결과가 저장됨).
+    offline이 True이면 playwright 프로필에서 외부 요청을 막고 로컬 리소스만 메모리에서 제공합니다.
+    bundle_css가 True이면 BUNDLE_PROFILES에서 styles.css 대신 인쇄용 CSS 번들을 사용합니다.
+    """
+
+    def __init__(self, pool_size=1, max_renders=100, cache=None, optimize=False, offline=False, bundle_css=False):
+        self.pool_size = pool_size
+        self.max_renders = max_renders
+        self.cache = cache
+        self.optimize = optimize
+        self.offline = offline
+        self.bundle_css = bundle_css
+        self._weasy_renderer = None
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            from browser_pool import BrowserPool
+            self._pool = BrowserPool(size=self.pool_size, max_renders=self.max_renders).start()
+        return self._pool
+
+    def render(self, job):
+        """작업 하나를 렌더링하고 캐시에서 가져왔으면 True 반환 (실패 시 예외 발생)"""
+
+        html_file = job["input"]
+        output_file = job["output"]
+        profile = job["profile"]
+
+        if profile != "pptx" and not os.path.exists(html_file):
+            raise FileNotFoundError(f"{html_file} 파일을 찾을 수 없습니다.")
+
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        os.makedirs(output_dir, exist_ok=True)
+
+        entry = self.cache_entry(job)
+        if entry is not None and self.cache.get(*entry, output_file):
+            return True
+
+        self._render_uncached(job)
+        if self.optimize and profile != "pptx":
+            from pdf_optimize import optimize_pdf
+            optimize_pdf(output_file)
+
+        if entry is not None:
+            self.cache.put(*entry, output_file)
+        return False
+
+    def cache_entry(self, job):
+        """작업의 캐시 (키, 확장자) (캐시를 쓰지 않으면 None)"""
+
+        if self.cache is None:
+            return None
+
+        from render_cache import PROFILE_EXTENSIONS
+
+        profile = job["profile"]
+        # 최적화/오프라인/CSS 번들 여부에 따라 결과물이 다르므로 캐시 키도 구분
+        extra = {}
+        if self.optimize and profile != "pptx":
+            extra["optimize"] = True
+        if self.offline and profile in PLAYWRIGHT_PROFILES:
+            extra["offline"] = True
+        if self.bundle_css and profile in BUNDLE_PROFILES:
+            extra["bundle_css"] = True
+        return self.cache.key_for(profile, job["input"], extra or None), PROFILE_EXTENSIONS[profile]
+
+    def _render_uncached(self, job):
+        html_file = job["input"]
+        output_file = job["output"]
+        profile = job["profile"]
+
+        resolver = None
+        if self.offline and profile in PLAYWRIGHT_PROFILES:
+            from asset_resolver import AssetResolver
+            resolver = AssetResolver.for_html(html_file)
+
+        if profile == "portrait":
+            from simple_pdf import render_pdf
+            render_pdf(self.pool, os.path.abspath(html_file), output_file, resolver=resolver)
+        elif profile == "landscape":
+            from landscape_pdf import render_landscape_pdf
+            render_landscape_pdf(self.pool, html_file, output_file, resolver=resolver, bundle=self.bundle_css)
+        elif profile == "weasyprint":
+            from create_pdf import WeasyRenderer, render_pdf_with_weasyprint
+            if self.bundle_css and self._weasy_renderer is None:
+                self._weasy_renderer = WeasyRenderer(bundle_css=True)
+            render_pdf_with_weasyprint(html_file, output_file, renderer=self._weasy_renderer)
+        elif profile == "pptx":
+            from create_ppt import create_music_marketing_ppt
+            create_music_marketing_ppt(output_file)
+        else:
+            raise ValueError(f"알 수 없는 프로필: {profile}")
+
+def run_batch(jobs, pool_size=1, max_renders=100, cache=None, optimize=False, offline=False, bundle_css=False):
+    """작업 목록을 순서대로 렌더링하고 작업별 결과(소요 시간, 캐시 적중, 오류) 목록 반환
+
+    개별 작업이 실패해도 배치는 중단되지 않습니다.
+    """
+
+    results = []
+    total = len(jobs)
+
+    with BatchRenderer(pool_size=pool_size, max_renders=max_renders, cache=cache, optimize=optimize,
+                       offline=offline, bundle_css=bundle_css) as renderer:
+        for index, job in enumerate(jobs, 1):
+            started = time.perf_counter()
+            error = None
+            cached = False
+
+            try:
+                cached = renderer.render(job)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+
+            elapsed = time.perf_counter() - started
+            results.append({**job, "ok": error is None, "cached": cached, "seconds": round(elapsed, 4), "error": error})
+
+            if error is None:
+                source = ", 캐시" if cached else ""
+                print(f"✅ [{index}/{total}] {job['output']} ({job['profile']}{source}, {elapsed:.2f}초)")
+            else:
+                print(f"❌ [{index}/{total}] {job['output']} ({job['profile']}, {elapsed:.2f}초): {error}")
+
+    return results
+
+def summarize(results):
+    """배치 결과 요약"""
+
+    succeeded = [r for r in results if r["ok"]]
+    seconds = [r["seconds"] for r in results]
+    return {
+        "total": len(results),
+        "cached": sum(1 for r in results if r.get("cached")),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "total_seconds": round(sum(seconds), 4),
+        "average_seconds": round(sum(seconds) / len(seconds), 4) if seconds else 0.0,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="매니페스트에 적힌 HTML 파일들을 한 번에 PDF로 변환합니다.")
+    parser.add_argument("manifest", help="작업 목록 (JSON 또는 CSV)")
+    parser.add_argument("--report", help="작업별 결과를 저장할 JSON 파일")
+    parser.add_argument("--pool-size", type=int, default=1, help="미리 띄워 둘 브라우저 수 (기본 1)")
+    parser.add_argument("--max-renders", type=int, default=100, help="브라우저 재시작 전 최대 렌더링 수 (기본 100)")
+    parser.add_argument("--cache-dir", help="렌더링 캐시 폴더 (지정하지 않으면 캐시 사용 안 함)")
+    parser.add_argument("--cache-max-mb", type=int, default=500, help="렌더링 캐시 최대 크기(MB, 기본 500)")
+    parser.add_argument("--optimize", action="store_true", help="PDF 폰트 서브셋/중복 객체 제거로 용량 줄이기")
+    parser.add_argument("--offline", action="store_true", help="외부 요청(폰트 CDN 등)을 막고 로컬 리소스만 사용")
+    parser.add_argument("--bundle-css", action="store_true", help="인쇄에 필요한 규칙만 남긴 CSS 번들 사용 (landscape/weasyprint)")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"❌ 매니페스트를 읽을 수 없습니다: {e}")
+        return 2
+
+    print(f"🎬 배치 변환을 시작합니다... ({len(jobs)}건)")
+    cache = None
+    if args.cache_dir:
+        from render_cache import RenderCache
+        cache = RenderCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
+    results = run_batch(jobs, pool_size=args.pool_size, max_renders=args.max_renders, cache=cache,
+                        optimize=args.optimize, offline=args.offline, bundle_css=args.bundle_css)
+    summary = summarize(results)
+    if cache is not None:
+        summary["cache"] = cache.stats()
+
+    print(f"\n📊 완료: 성공 {summary['succeeded']}건 / 실패 {summary['failed']}건 "
+          f"(총 {summary['total_seconds']:.2f}초, 평균 {summary['average_seconds']:.2f}초)")
+    if cache is not None:
+        print(f"🗄️ 캐시: 적중 {summary['cache']['hits']}건 / 실패 {summary['cache']['misses']}건")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({"summary": summary, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"📁 결과 파일: {os.path.abspath(args.report)}")
+
+    return 0 if summary["failed"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PPT 템플릿 복제 모드 벤치마크
+프로그램 표 슬라이드를 여러 장 만들면서 속성을 하나씩 설정하는 기존 방식과
+SlideTemplates로 XML을 복제하는 방식의 빌드 시간을 비교하고, 두 결과가 같은지 확인합니다.
+
+사용법:
+    python bench_ppt_template.py [--slides 200] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+
+from lxml import etree
+from pptx import Presentation
+
+import create_ppt
+
+TABLE_DATA = [
+    ["방식", "구분", "과정", "추가 내용", "금액"],
+    ["1", "인스타그램 업로드(릴스)", "본인 사진 및 영상 업로드", "게시물 업로드 시 지정된 노래 삽입", "3천원"],
+    ["2", "인스타그램 업로드(릴스)", "대행사에서 사진 및 영상 전달", "게시물 업로드 시 지정된 노래 삽입", "3천원"],
+    ["3", "틱톡 업로드", "대행사에서 사진 및 영상 전달", "게시물 업로드 시 지정된 노래 삽입", "4천원"]
+]
+
+def build_deck(slide_count, use_templates):
+    """프로그램 표 슬라이드 slide_count장짜리 Presentation 생성"""
+
+    prs = Presentation()
+    templates = create_ppt.SlideTemplates() if use_templates else None
+
+    for i in range(slide_count):
+        table_data = [TABLE_DATA[0]] + [[*row[:-1], f"{i + 1}천원"] for row in TABLE_DATA[1:]]
+        create_ppt.create_program_slide(
+            prs, f"📱 프로그램 {i + 1}", table_data, create_ppt.PRIMARY_COLOR, create_ppt.ACCENT_COLOR,
+            note="※ 참고사항: 개인에 따라 약간의 편집이 필요함", templates=templates,
+        )
+        create_ppt.create_benefits_slide(prs, create_ppt.PRIMARY_COLOR, create_ppt.SECONDARY_COLOR,
+                                         templates=templates)
+
+    return prs
+
+def time_build(slide_count, use_templates, repeat):
+    """repeat번 빌드해서 가장 빠른 시간(초)과 마지막 결과 반환"""
+
+    best = None
+    prs = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        prs = build_deck(slide_count, use_templates)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, prs
+
+def same_slides(first, second):
+    return len(first.slides) == len(second.slides) and all(
+        etree.tostring(a._element) == etree.tostring(b._element)
+        for a, b in zip(first.slides, second.slides)
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PPT 템플릿 복제 모드와 기존 방식의 빌드 시간을 비교합니다.")
+    parser.add_argument("--slides", type=int, default=200, help="표 슬라이드 수 (혜택 슬라이드가 같은 수만큼 추가됨, 기본 200)")
+    parser.add_argument("--repeat", type=int, default=3, help="방식별 반복 횟수 (가장 빠른 값 사용, 기본 3)")
+    args = parser.parse_args(argv)
+
+    print(f"🎬 PPT 빌드 벤치마크 (표 슬라이드 {args.slides}장, 반복 {args.repeat}회)")
+
+    baseline, baseline_prs = time_build(args.slides, False, args.repeat)
+    print(f"⏱️ 속성별 설정: {baseline:.3f}초")
+
+    templated, templated_prs = time_build(args.slides, True, args.repeat)
+    print(f"⏱️ 템플릿 복제: {templated:.3f}초 ({baseline / templated:.2f}배)")
+
+    if not same_slides(baseline_prs, templated_prs):
+        print("❌ 두 방식의 슬라이드 XML이 다릅니다.")
+        return 1
+
+    print("✅ 두 방식의 슬라이드 XML이 동일합니다.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
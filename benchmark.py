@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더링 백엔드 벤치마크
+index.html의 프로그램 표를 1배/10배/100배로 늘린 합성 문서로 백엔드별 성능을 측정하고
+결과를 JSON 파일로 저장합니다 (릴리스 사이 성능 회귀 추적용).
+
+측정 항목 (백엔드 x 배율마다 별도 프로세스에서 실행):
+    - cold_start_seconds: 프로세스 시작부터 첫 문서 완료까지 (import, 브라우저 실행 포함)
+    - warm 지연 시간: 두 번째 문서부터의 문서별 시간 (평균, p50/p95/p99)
+    - peak_rss_mb: 측정 프로세스의 최대 메모리 (브라우저 등 자식 프로세스는 peak_child_rss_mb)
+    - output_bytes: 결과 파일 크기
+
+백엔드:
+    weasyprint - create_pdf.render_pdf_with_weasyprint
+    pdfkit     - create_pdf의 pdfkit(wkhtmltopdf) 경로
+    playwright - create_pdf.create_pdf_with_playwright와 같은 렌더링
+    portrait   - simple_pdf
+    landscape  - landscape_pdf
+    pptx       - create_ppt (catalog.json 캠페인의 프로그램 슬라이드를 같은 배율로 늘림)
+
+설치되지 않은 백엔드는 건너뛰고 결과에 skipped로 기록합니다.
+
+사용법:
+    python benchmark.py [--backends weasyprint,portrait] [--scales 1,10,100] [--iterations 10]
+                        [--output benchmark_results.json] [--baseline 이전_결과.json]
+"""
+
+import time
+
+_PROCESS_STARTED = time.perf_counter()
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+BACKENDS = ("weasyprint", "pdfkit", "playwright", "portrait", "landscape", "pptx")
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_ITERATIONS = 10
+DEFAULT_OUTPUT = "benchmark_results.json"
+WORKER_TIMEOUT = 1800  # 초
+
+# 기준 결과 대비 p50이 이 비율 이상 느려지면 회귀로 표시
+REGRESSION_THRESHOLD = 1.10
+
+# 결과에 버전을 기록할 패키지
+PACKAGES = ("playwright", "weasyprint", "pdfkit", "python-pptx")
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class BackendUnavailable(Exception):
+    """백엔드 라이브러리나 외부 프로그램이 설치되지 않음"""
+
+def scale_html(html_content, scale):
+    """프로그램 섹션의 표(program-category)들을 scale번 반복한 HTML 반환"""
+
+    start = html_content.find('<div class="program-category">')
+    if start < 0:
+        raise ValueError("HTML에서 프로그램 표(program-category)를 찾을 수 없습니다.")
+
+    # 프로그램 섹션의 container를 닫는 </div> 직전까지가 표 목록
+    section_end = html_content.index('</section>', start)
+    end = html_content.rindex('</div>', start, section_end)
+
+    tables = html_content[start:end].rstrip() + "\n\n            "
+    return html_content[:start] + tables * scale + html_content[end:]
+
+def scale_campaign(campaign, scale):
+    """캠페인의 프로그램 목록을 scale번 반복한 사본 반환"""
+
+    return {**campaign, "programs": list(campaign.get("programs", [])) * scale}
+
+def write_synthetic_documents(html_file, scales, work_dir):
+    """배율별 합성 HTML을 work_dir에 쓰고 {배율: 경로} 반환 (로컬 리소스도 함께 복사)"""
+
+    from render_cache import collect_local_assets
+
+    base_dir = os.path.dirname(os.path.abspath(html_file))
+    for asset in collect_local_assets(html_file):
+        target = os.path.join(work_dir, os.path.relpath(asset, base_dir))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(asset, target)
+
+    with open(html_file, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+
+    documents = {}
+    for scale in scales:
+        path = os.path.join(work_dir, f"synthetic_{scale}x.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(scale_html(html_content, scale))
+        documents[scale] = path
+    return documents
+
+def percentile(values, percent):
+    """정렬된 값 목록의 nearest-rank 백분위수"""
+
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+def _peak_rss_mb(who):
+    """getrusage 기준 최대 메모리(MB) (who: RUSAGE_SELF 또는 RUSAGE_CHILDREN)"""
+    try:
+        import resource
+    except ImportError:
+        # Windows에는 resource 모듈이 없음
+        return None
+
+    peak = resource.getrusage(getattr(resource, who)).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+def _open_backend(backend):
+    """(render(html_file, scale) -> bytes, close()) 반환"""
+
+    if backend == "weasyprint":
+        try:
+            import weasyprint  # noqa: F401 (설치 여부 확인)
+        except (ImportError, OSError) as e:
+            raise BackendUnavailable(f"weasyprint를 사용할 수 없습니다: {e}")
+        import create_pdf
+        return (lambda html_file, scale: create_pdf.render_pdf_with_weasyprint(html_file)), (lambda: None)
+
+    if backend == "pdfkit":
+        try:
+            import pdfkit
+            configuration = pdfkit.configuration()
+        except ImportError as e:
+            raise BackendUnavailable(f"pdfkit이 설치되지 않았습니다: {e}")
+        except OSError as e:
+            raise BackendUnavailable(f"wkhtmltopdf를 찾을 수 없습니다: {e}")
+        import create_pdf
+
+        def render(html_file, scale):
+            return pdfkit.from_file(os.path.abspath(html_file), False, options=create_pdf.PDFKIT_OPTIONS,
+                                    configuration=configuration)
+        return render, (lambda: None)
+
+    if backend in ("playwright", "portrait", "landscape"):
+        try:
+            import playwright  # noqa: F401 (설치 여부 확인)
+        except ImportError as e:
+            raise BackendUnavailable(f"playwright가 설치되지 않았습니다: {e}")
+        from browser_pool import BrowserPool
+        pool = BrowserPool(size=1, max_renders=1_000_000).start()
+
+        if backend == "playwright":
+            import create_pdf
+            render = lambda html_file, scale: create_pdf._render_with_pool(pool, os.path.abspath(html_file))
+        elif backend == "portrait":
+            import simple_pdf
+            render = lambda html_file, scale: simple_pdf.render_pdf(pool, os.path.abspath(html_file))
+        else:
+            import landscape_pdf
+            render = lambda html_file, scale: landscape_pdf.render_landscape_pdf(pool, html_file)
+        return render, pool.close
+
+    if backend == "pptx":
+        try:
+            import pptx  # noqa: F401 (설치 여부 확인)
+        except ImportError as e:
+            raise BackendUnavailable(f"python-pptx가 설치되지 않았습니다: {e}")
+        import catalog
+        campaign = catalog.load_catalog(os.path.join(_BASE_DIR, catalog.DEFAULT_CATALOG))[0]
+
+        def render(html_file, scale):
+            stream = io.BytesIO()
+            catalog.build_presentation(scale_campaign(campaign, scale)).save(stream)
+            return stream.getvalue()
+        return render, (lambda: None)
+
+    raise ValueError(f"알 수 없는 백엔드: {backend}")
+
+def run_worker(backend, html_file, scale, iterations):
+    """(측정 프로세스 안에서) 백엔드 하나를 iterations+1번 실행하고 측정 결과 반환"""
+
+    result = {"backend": backend, "scale": scale, "iterations": iterations}
+
+    try:
+        render, close = _open_backend(backend)
+    except BackendUnavailable as e:
+        return {**result, "status": "skipped", "reason": str(e)}
+    except Exception as e:
+        # 브라우저 실행 실패 등
+        return {**result, "status": "error", "error": f"{type(e).__name__}: {e}"}
+
+    latencies = []
+    output_bytes = None
+    try:
+        # 첫 문서: 프로세스 시작부터 계산 (import, 폰트/브라우저 초기화 포함)
+        output_bytes = len(render(html_file, scale))
+        result["cold_start_seconds"] = round(time.perf_counter() - _PROCESS_STARTED, 4)
+
+        for _ in range(iterations):
+            started = time.perf_counter()
+            output_bytes = len(render(html_file, scale))
+            latencies.append(time.perf_counter() - started)
+    except Exception as e:
+        result.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    else:
+        result["status"] = "ok"
+    finally:
+        try:
+            close()
+        except Exception:
+            pass
+
+    latencies.sort()
+    result.update({
+        "warm_mean_seconds": round(sum(latencies) / len(latencies), 4) if latencies else None,
+        "p50_seconds": _round(percentile(latencies, 50)),
+        "p95_seconds": _round(percentile(latencies, 95)),
+        "p99_seconds": _round(percentile(latencies, 99)),
+        "peak_rss_mb": _peak_rss_mb("RUSAGE_SELF"),
+        "peak_child_rss_mb": _peak_rss_mb("RUSAGE_CHILDREN"),
+        "output_bytes": output_bytes,
+    })
+    return result
+
+def _round(value):
+    return round(value, 4) if value is not None else None
+
+def measure(backend, html_file, scale, iterations, timeout=WORKER_TIMEOUT):
+    """새 프로세스에서 백엔드를 측정 (콜드 스타트와 메모리를 다른 측정과 분리하기 위함)"""
+
+    command = [sys.executable, os.path.abspath(__file__), "--worker", backend,
+               "--input", html_file, "--scale", str(scale), "--iterations", str(iterations)]
+    try:
+        completed = subprocess.run(command, cwd=_BASE_DIR, capture_output=True, text=True,
+                                   encoding='utf-8', timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"backend": backend, "scale": scale, "status": "error",
+                "error": f"TimeoutError: {timeout}초 안에 끝나지 않았습니다."}
+
+    # 렌더링 스크립트의 출력 뒤 마지막 줄이 측정 결과
+    lines = [line for line in completed.stdout.splitlines() if line.strip()]
+    try:
+        return json.loads(lines[-1])
+    except (IndexError, ValueError):
+        stderr = completed.stderr.strip().splitlines()
+        return {"backend": backend, "scale": scale, "status": "error",
+                "error": stderr[-1] if stderr else f"exitcode={completed.returncode}"}
+
+def _package_versions():
+    from importlib import metadata
+
+    versions = {}
+    for name in PACKAGES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+def _git_revision():
+    try:
+        completed = subprocess.run(["git", "rev-parse", "HEAD"], cwd=_BASE_DIR, capture_output=True, text=True)
+    except OSError:
+        return None
+    return completed.stdout.strip() or None
+
+def compare_results(results, baseline):
+    """기준 결과 대비 p50 변화율 목록 반환 [(backend, scale, 기준 p50, 현재 p50, 비율)]"""
+
+    previous = {(r["backend"], r["scale"]): r for r in baseline.get("results", []) if r.get("status") == "ok"}
+
+    changes = []
+    for result in results:
+        before = previous.get((result["backend"], result["scale"]))
+        if result.get("status") != "ok" or not before or not before.get("p50_seconds") or not result.get("p50_seconds"):
+            continue
+        ratio = result["p50_seconds"] / before["p50_seconds"]
+        changes.append((result["backend"], result["scale"], before["p50_seconds"], result["p50_seconds"], ratio))
+    return changes
+
+def run_benchmark(backends=BACKENDS, scales=DEFAULT_SCALES, iterations=DEFAULT_ITERATIONS, html_file="index.html"):
+    """전체 벤치마크를 실행하고 결과 사전 반환"""
+
+    results = []
+    work_dir = tempfile.mkdtemp(prefix="render_bench_")
+    try:
+        documents = write_synthetic_documents(html_file, scales, work_dir)
+
+        for backend in backends:
+            for scale in scales:
+                print(f"⏱️ {backend} {scale}배 측정 중...")
+                result = measure(backend, documents[scale], scale, iterations)
+                results.append(result)
+                _print_result(result)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": _package_versions(),
+        "iterations": iterations,
+        "results": results,
+    }
+
+def _print_result(result):
+    if result["status"] == "skipped":
+        print(f"   ⏭️ 건너뜀: {result['reason']}")
+    elif result["status"] == "error":
+        print(f"   ❌ 실패: {result['error'].splitlines()[0]}")
+    else:
+        print(f"   ✅ 콜드 {result['cold_start_seconds']:.2f}초 / "
+              f"p50 {result['p50_seconds']:.3f}초, p95 {result['p95_seconds']:.3f}초, p99 {result['p99_seconds']:.3f}초 / "
+              f"RSS {result['peak_rss_mb']}MB / {result['output_bytes']:,} bytes")
+
+def _parse_list(value, cast=str):
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="렌더링 백엔드별 성능을 측정하고 JSON 결과 파일을 씁니다.")
+    parser.add_argument("--backends", default=",".join(BACKENDS), help=f"측정할 백엔드 (기본: {','.join(BACKENDS)})")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)), help="프로그램 표 배율 (기본: 1,10,100)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help=f"첫 문서 이후 warm 측정 횟수 (기본 {DEFAULT_ITERATIONS})")
+    parser.add_argument("--input", default="index.html", help="합성 문서의 원본 HTML (기본 index.html)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help=f"결과 JSON 파일 (기본 {DEFAULT_OUTPUT})")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--scale", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        # 측정 프로세스: 결과를 마지막 줄에 JSON으로 출력
+        result = run_worker(args.worker, args.input, args.scale, args.iterations)
+        print(json.dumps(result, ensure_ascii=False))
+        return 0
+
+    backends = _parse_list(args.backends)
+    unknown = [backend for backend in backends if backend not in BACKENDS]
+    if unknown:
+        print(f"❌ 알 수 없는 백엔드: {', '.join(unknown)} (가능: {', '.join(BACKENDS)})")
+        return 2
+    if not os.path.exists(args.input):
+        print(f"❌ {args.input} 파일을 찾을 수 없습니다.")
+        return 2
+
+    scales = _parse_list(args.scales, int)
+    print(f"🎬 벤치마크를 시작합니다... (백엔드 {len(backends)}개, 배율 {scales}, warm {args.iterations}회)")
+    report = run_benchmark(backends, scales, args.iterations, args.input)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"📁 결과 파일: {os.path.abspath(args.output)}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = 0
+        print("\n📊 기준 결과 대비 p50:")
+        for backend, scale, before, after, ratio in compare_results(report["results"], baseline):
+            mark = "⚠️" if ratio >= REGRESSION_THRESHOLD else "  "
+            regressions += ratio >= REGRESSION_THRESHOLD
+            print(f"{mark} {backend} {scale}배: {before:.3f}초 → {after:.3f}초 ({ratio:.2f}배)")
+        if regressions:
+            print(f"⚠️ 성능 회귀 {regressions}건")
+            return 1
+
+    failed = [r for r in report["results"] if r["status"] == "error"]
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+playwright Chromium 브라우저 풀
+미리 실행해 둔 Chromium 인스턴스를 재사용하여 PDF마다 브라우저를 새로 띄우는 비용을 없앱니다.
+
+사용 예:
+    with BrowserPool(size=2) as pool:
+        with pool.page(viewport={"width": 1200, "height": 800}) as page:
+            page.goto(...)
+"""
+
+from contextlib import contextmanager
+
+from render_trace import get_tracer
+
+
+class _PooledBrowser:
+    """풀에 속한 브라우저 하나와 렌더링 횟수"""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.renders = 0
+
+    def is_healthy(self):
+        return self.browser.is_connected()
+
+    def close(self):
+        try:
+            self.browser.close()
+        except Exception:
+            # 이미 죽은 브라우저는 닫기 실패를 무시
+            pass
+
+
+class BrowserPool:
+    """N개의 Chromium 인스턴스를 유지하고 렌더링마다 새 컨텍스트/페이지를 제공
+
+    - size: 미리 띄워 둘 브라우저 수
+    - max_renders: 브라우저 하나가 처리할 최대 렌더링 수 (초과 시 재시작)
+    - launch_options: chromium.launch()에 그대로 전달할 옵션
+    - tracer: 브라우저 실행/컨텍스트 생성 시간을 기록할 render_trace.Tracer
+
+    playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로
+    풀 하나는 한 스레드에서만 사용해야 합니다.
+    """
+
+    def __init__(self, size=1, max_renders=100, launch_options=None, tracer=None):
+        if size < 1:
+            raise ValueError("size는 1 이상이어야 합니다.")
+        if max_renders < 1:
+            raise ValueError("max_renders는 1 이상이어야 합니다.")
+
+        self.size = size
+        self.max_renders = max_renders
+        self.launch_options = {"headless": True, **(launch_options or {})}
+        self.tracer = get_tracer(tracer)
+
+        self._playwright_manager = None
+        self._playwright = None
+        self._slots = []
+        self._next_slot = 0
+        self.launches = 0
+        self.recycles = 0
+
+    def start(self):
+        """playwright를 시작하고 브라우저를 미리 실행"""
+        if self._playwright is not None:
+            return self
+
+        with self.tracer.span("playwright.start"):
+            # playwright는 무거우므로 풀을 실제로 시작할 때 가져옴 (캐시 적중/--help 경로에서는 불필요)
+            from playwright.sync_api import sync_playwright
+            self._playwright_manager = sync_playwright()
+            self._playwright = self._playwright_manager.start()
+        try:
+            self._slots = [self._launch() for _ in range(self.size)]
+        except Exception:
+            # 일부만 실행된 경우에도 playwright와 브라우저를 모두 정리
+            self.close()
+            raise
+        return self
+
+    def close(self):
+        """모든 브라우저와 playwright 종료"""
+        for slot in self._slots:
+            slot.close()
+        self._slots = []
+
+        if self._playwright_manager is not None:
+            self._playwright_manager.__exit__(None, None, None)
+        self._playwright_manager = None
+        self._playwright = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _launch(self):
+        self.launches += 1
+        with self.tracer.span("browser.launch", launch=self.launches):
+            return _PooledBrowser(self._playwright.chromium.launch(**self.launch_options))
+
+    def _acquire(self):
+        """라운드 로빈으로 브라우저를 고르고, 상태 점검 및 재시작을 수행"""
+        if self._playwright is None:
+            self.start()
+
+        index = self._next_slot
+        self._next_slot = (self._next_slot + 1) % self.size
+
+        slot = self._slots[index]
+        if not slot.is_healthy() or slot.renders >= self.max_renders:
+            slot.close()
+            slot = self._slots[index] = self._launch()
+            self.recycles += 1
+        return slot
+
+    @contextmanager
+    def context(self, **context_options):
+        """풀의 브라우저에서 새 브라우저 컨텍스트를 열고 사용 후 닫음"""
+        slot = self._acquire()
+        with self.tracer.span("browser.new_context"):
+            context = slot.browser.new_context(**context_options)
+        try:
+            yield context
+        finally:
+            slot.renders += 1
+            try:
+                context.close()
+            except Exception:
+                # 브라우저가 죽은 경우 다음 _acquire()에서 재시작됨
+                pass
+
+    @contextmanager
+    def page(self, **context_options):
+        """새 컨텍스트의 페이지 하나를 제공 (viewport 등은 컨텍스트 옵션으로 전달)"""
+        with self.context(**context_options) as context:
+            yield context.new_page()
+
+    def stats(self):
+        """풀 상태 요약"""
+        return {
+            "size": self.size,
+            "launches": self.launches,
+            "recycles": self.recycles,
+            "renders": [slot.renders for slot in self._slots],
+        }
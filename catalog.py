@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로그램 카탈로그 기반 PPT/HTML 생성 스크립트
+카탈로그 파일(JSON 또는 YAML)에 캠페인별 프로그램, 금액, 진행 단계, 혜택을 적어 두면
+캠페인마다 PPT와 HTML 페이지를 한 번에 생성합니다.
+
+- 카탈로그 형식은 catalog.json 참고 (HTML 페이지를 주면 html_extract로 캠페인 하나를 추출해서 사용)
+- 내용이 바뀌지 않은 캠페인은 다시 만들지 않습니다 (출력 폴더의 .catalog_state.json에 해시 기록)
+- --workers로 여러 캠페인을 동시에 생성할 수 있습니다
+- --slide-workers로 슬라이드가 많은 캠페인의 슬라이드를 여러 프로세스에서 나눠 만들 수 있습니다 (결과는 동일)
+
+사용법:
+    python catalog.py [catalog.json] [--output build] [--workers 4] [--slide-workers 4] [--force]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CATALOG = "catalog.json"
+DEFAULT_OUTPUT_DIR = "build"
+STATE_FILE = ".catalog_state.json"
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 생성 결과에 영향을 주는 소스 (바뀌면 모든 캠페인을 다시 생성)
+GENERATOR_SOURCES = ("catalog.py", "create_ppt.py", "html_extract.py")
+
+# 생성된 HTML이 참조하는 공용 리소스 (출력 폴더로 복사)
+SHARED_ASSETS = ("styles.css", "script.js")
+
+# 캠페인 id는 출력 파일 이름이 되므로 경로 구분자나 ".."가 없는 이름만 허용
+CAMPAIGN_ID_PATTERN = re.compile(r'^\w[\w-]*$')
+
+def load_catalog(catalog_file):
+    """카탈로그 파일을 읽어 캠페인 목록 반환"""
+
+    if catalog_file.lower().endswith(('.html', '.htm')):
+        from html_extract import extract_campaign
+        campaigns = [extract_campaign(catalog_file)]
+    else:
+        campaigns = _read_campaigns(catalog_file)
+
+    seen = set()
+    for index, campaign in enumerate(campaigns, 1):
+        if not isinstance(campaign, dict):
+            raise ValueError(f"{index}번째 캠페인이 객체가 아닙니다.")
+        campaign_id = campaign.get("id")
+        if not campaign_id:
+            raise ValueError(f"{index}번째 캠페인에 id가 없습니다.")
+        if not isinstance(campaign_id, str) or not CAMPAIGN_ID_PATTERN.match(campaign_id):
+            raise ValueError(f"캠페인 id는 문자, 숫자, '-', '_'만 쓸 수 있습니다: {campaign_id!r}")
+        if campaign_id in seen:
+            raise ValueError(f"캠페인 id가 중복되었습니다: {campaign_id}")
+        seen.add(campaign_id)
+
+    return campaigns
+
+def _read_campaigns(catalog_file):
+    with open(catalog_file, 'r', encoding='utf-8') as f:
+        if catalog_file.lower().endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML 카탈로그를 읽으려면 PyYAML이 필요합니다: pip install pyyaml")
+            catalog = yaml.safe_load(f)
+        else:
+            catalog = json.load(f)
+
+    return catalog.get("campaigns", []) if isinstance(catalog, dict) else catalog
+
+def _generator_digest():
+    digest = hashlib.sha256()
+    for source in GENERATOR_SOURCES:
+        with open(os.path.join(_BASE_DIR, source), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def campaign_hash(campaign, generator_digest):
+    """캠페인 데이터와 생성기 소스에 대한 해시"""
+
+    data = json.dumps(campaign, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(generator_digest.encode() + data).hexdigest()
+
+def _with_emoji(item, text):
+    emoji = item.get("emoji")
+    return f"{emoji} {text}" if emoji else text
+
+def build_presentation(campaign, use_templates=True, workers=1):
+    """캠페인 데이터로 Presentation 객체 생성 (create_ppt의 슬라이드 함수 사용)
+
+    use_templates=True이면 표와 부제목을 create_ppt.SlideTemplates에서 복제합니다 (결과는 동일).
+    workers > 1이면 슬라이드를 여러 프로세스에서 나눠 만들고 순서대로 조립합니다 (결과는 동일).
+    """
+
+    import create_ppt
+
+    return create_ppt.build_presentation_from_specs(slide_specs(campaign), use_templates, workers)
+
+def slide_specs(campaign):
+    """캠페인 데이터의 슬라이드 명세 목록 [(create_ppt 슬라이드 함수, 인자, 키워드 인자)]"""
+
+    import create_ppt
+
+    colors = {
+        "primary": create_ppt.PRIMARY_COLOR,
+        "secondary": create_ppt.SECONDARY_COLOR,
+        "accent": create_ppt.ACCENT_COLOR,
+    }
+    primary = create_ppt.PRIMARY_COLOR
+    specs = []
+
+    hero = campaign.get("hero", {})
+    specs.append((create_ppt.create_title_slide, (primary, create_ppt.ACCENT_COLOR), dict(
+        title=campaign.get("title", ""),
+        subtitle=campaign.get("subtitle", ""),
+        channels=[_with_emoji(channel, channel["label"]) for channel in hero.get("channels", [])],
+    )))
+
+    process = campaign.get("process")
+    if process:
+        specs.append((create_ppt.create_process_slide, (primary, create_ppt.SECONDARY_COLOR), dict(
+            title_text=process.get("title", ""),
+            description=process.get("description", ""),
+            steps=[f"{i}. {step['title']}\n({step['actor']})" for i, step in enumerate(process.get("steps", []), 1)],
+        )))
+
+    for program in campaign.get("programs", []):
+        specs.append((create_ppt.create_program_slide, (
+            _with_emoji(program, program["title"]),
+            [program["headers"]] + program["rows"],
+            primary,
+            colors[program.get("highlight", "accent")],
+        ), dict(
+            note=program.get("note"),
+            title_size=program.get("title_size", 32),
+        )))
+
+    benefits = campaign.get("benefits")
+    if benefits:
+        specs.append((create_ppt.create_benefits_slide, (primary, create_ppt.SECONDARY_COLOR), dict(
+            title_text=_with_emoji(benefits, benefits.get("title", "")),
+            description=benefits.get("description", ""),
+            benefits=[(_with_emoji(item, item["title"]), item.get("description", "")) for item in benefits.get("items", [])],
+        )))
+
+    apply = campaign.get("apply")
+    if apply:
+        specs.append((create_ppt.create_application_slide, (primary, create_ppt.ACCENT_COLOR), dict(
+            title_text=_with_emoji(apply, apply.get("title", "")),
+            description=apply.get("description", ""),
+            form_fields=apply.get("form_fields", []),
+            perks=apply.get("perks", []),
+        )))
+
+    return specs
+
+def _text(value):
+    """HTML 이스케이프 후 줄바꿈을 <br>로 변환"""
+    return html.escape(str(value)).replace("\n", "<br>")
+
+def render_html(campaign):
+    """캠페인 데이터로 index.html과 같은 구조의 HTML 페이지 생성"""
+
+    hero = campaign.get("hero", {})
+    apply_url = html.escape(hero.get("apply_url", "#apply"), quote=True)
+    parts = []
+
+    parts.append(f'''<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{_text(campaign.get("title", ""))}</title>
+    <link rel="stylesheet" href="styles.css">
+    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
+</head>
+<body>
+    <!-- 헤더 -->
+    <header class="header">
+        <nav class="nav">
+            <div class="nav-container">
+                <div class="nav-logo">
+                    <h2>{_text(campaign.get("title", ""))}</h2>
+                </div>
+                <ul class="nav-menu">
+                    <li><a href="#programs">프로그램</a></li>
+                    <li><a href="#benefits">혜택</a></li>
+                    <li><a href="#apply" class="btn-primary">신청하기</a></li>
+                </ul>
+                <div class="hamburger">
+                    <span></span>
+                    <span></span>
+                    <span></span>
+                </div>
+            </div>
+        </nav>
+    </header>
+
+    <!-- 메인 히어로 섹션 -->
+    <section class="hero">
+        <div class="hero-container">
+            <div class="hero-content">
+                <h1 class="hero-title">
+                    {_text(hero.get("title", ""))}<br>
+                    <span class="highlight">{_text(hero.get("highlight", ""))}</span>
+                </h1>
+                <p class="hero-description">
+                    {_text(hero.get("description", campaign.get("subtitle", "")))}
+                </p>
+                <div class="hero-buttons">
+                    <a href="{apply_url}" class="btn btn-primary" target="_blank">
+                        <i class="fas fa-rocket"></i>
+                        지금 신청하기
+                    </a>
+                    <a href="#programs" class="btn btn-secondary">
+                        <i class="fas fa-play"></i>
+                        자세히 보기
+                    </a>
+                </div>
+            </div>
+            <div class="hero-image">
+                <div class="hero-graphic">''')
+
+    for i, channel in enumerate(hero.get("channels", []), 1):
+        parts.append(f'''
+                    <div class="floating-card card-{i}">
+                        <i class="{html.escape(channel.get("icon", "fas fa-star"), quote=True)}"></i>
+                        <span>{_text(channel["label"])}</span>
+                    </div>''')
+
+    parts.append('''
+                </div>
+            </div>
+        </div>
+    </section>
+''')
+
+    process = campaign.get("process")
+    if process:
+        parts.append(f'''
+    <!-- 체험단 진행과정 섹션 -->
+    <section class="process">
+        <div class="container">
+            <div class="section-header">
+                <h2>{_text(process.get("title", ""))}</h2>
+                <p>{_text(process.get("description", ""))}</p>
+            </div>
+            <div class="process-steps">''')
+        steps = process.get("steps", [])
+        for i, step in enumerate(steps, 1):
+            parts.append(f'''
+                <div class="step-item">
+                    <div class="step-number">{i}</div>
+                    <h3>{_text(step["title"])}</h3>
+                    <p>{_text(step.get("actor", ""))}</p>
+                </div>''')
+            if i < len(steps):
+                parts.append('''
+                <div class="step-arrow">
+                    <i class="fas fa-arrow-right"></i>
+                </div>''')
+        parts.append('''
+            </div>
+        </div>
+    </section>
+''')
+
+    programs = campaign.get("programs", [])
+    if programs:
+        parts.append('''
+    <!-- 프로그램 섹션 -->
+    <section id="programs" class="programs">
+        <div class="container">
+            <div class="section-header">
+                <h2>체험 프로그램</h2>
+                <p>다양한 방식의 체험단 프로그램을 확인해보세요.</p>
+            </div>
+''')
+        for program in programs:
+            headers = "".join(f'''
+                        <div>{_text(header)}</div>''' for header in program["headers"])
+            parts.append(f'''
+            <div class="program-category">
+                <h3 class="category-title">
+                    <i class="{html.escape(program.get("icon", "fas fa-music"), quote=True)}"></i>
+                    {_text(program["title"])}
+                </h3>
+                <div class="program-table">
+                    <div class="table-header">{headers}
+                    </div>''')
+            for row in program["rows"]:
+                cells = []
+                for col, cell in enumerate(row):
+                    if col == 0:
+                        cells.append(f'''
+                        <div class="method-number">{_text(cell)}</div>''')
+                    elif col == len(row) - 1:
+                        cells.append(f'''
+                        <div class="price">{_text(cell)}</div>''')
+                    else:
+                        cells.append(f'''
+                        <div>{_text(cell)}</div>''')
+                parts.append(f'''
+                    <div class="table-row">{"".join(cells)}
+                    </div>''')
+            parts.append('''
+                </div>''')
+            if program.get("note"):
+                parts.append(f'''
+                <p class="table-note">{_text(program["note"])}</p>''')
+            parts.append('''
+            </div>
+''')
+        parts.append('''        </div>
+    </section>
+''')
+
+    benefits = campaign.get("benefits")
+    if benefits:
+        parts.append(f'''
+    <!-- 혜택 섹션 -->
+    <section id="benefits" class="benefits">
+        <div class="container">
+            <div class="section-header">
+                <h2>{_text(benefits.get("title", ""))}</h2>
+                <p>{_text(benefits.get("description", ""))}</p>
+            </div>
+            <div class="benefits-grid">''')
+        for item in benefits.get("items", []):
+            parts.append(f'''
+                <div class="benefit-item">
+                    <div class="benefit-icon">
+                        <i class="{html.escape(item.get("icon", "fas fa-gift"), quote=True)}"></i>
+                    </div>
+                    <h3>{_text(item["title"])}</h3>
+                    <p>{_text(item.get("description", ""))}</p>
+                </div>''')
+        parts.append('''
+            </div>
+        </div>
+    </section>
+''')
+
+    apply = campaign.get("apply")
+    if apply:
+        perks = "".join(f'''
+                        <li><i class="fas fa-check"></i> {_text(perk)}</li>''' for perk in apply.get("perks", []))
+        fields = "".join(f'''
+                    <div class="form-group">
+                        <input type="text" placeholder="{html.escape(field, quote=True)}">
+                    </div>''' for field in apply.get("form_fields", []))
+        parts.append(f'''
+    <!-- 신청 섹션 -->
+    <section id="apply" class="apply">
+        <div class="container">
+            <div class="apply-content">
+                <div class="apply-text">
+                    <h2>{_text(apply.get("title", ""))}</h2>
+                    <p>{_text(apply.get("description", ""))}</p>
+                    <ul class="apply-benefits">{perks}
+                    </ul>
+                </div>
+                <form class="apply-form contact-form">{fields}
+                    <a href="{apply_url}" class="btn btn-primary btn-full" target="_blank">
+                        <i class="fas fa-rocket"></i>
+                        지금 신청하기
+                    </a>
+                </form>
+            </div>
+        </div>
+    </section>
+''')
+
+    parts.append('''
+    <script src="script.js"></script>
+</body>
+</html>
+''')
+    return "".join(parts)
+
+def build_campaign(campaign, output_dir, slide_workers=1):
+    """캠페인 하나의 HTML과 PPT를 생성하고 출력 경로 반환"""
+
+    from create_ppt import save_presentation
+
+    campaign_id = campaign["id"]
+    html_path = os.path.join(output_dir, f"{campaign_id}.html")
+    pptx_path = os.path.join(output_dir, f"{campaign_id}.pptx")
+
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(render_html(campaign))
+
+    save_presentation(build_presentation(campaign, workers=slide_workers), pptx_path)
+    return html_path, pptx_path
+
+def _build_campaign_task(args):
+    campaign, output_dir, slide_workers = args
+    return build_campaign(campaign, output_dir, slide_workers)
+
+def _copy_shared_assets(output_dir):
+    for asset in SHARED_ASSETS:
+        source = os.path.join(_BASE_DIR, asset)
+        target = os.path.join(output_dir, asset)
+        if not os.path.exists(target) or os.path.getmtime(target) < os.path.getmtime(source):
+            shutil.copy2(source, target)
+
+def build_catalog(campaigns, output_dir=DEFAULT_OUTPUT_DIR, workers=1, force=False, slide_workers=1):
+    """카탈로그 전체를 생성 (바뀐 캠페인만), 생성/건너뜀 캠페인 id 목록 반환
+
+    slide_workers: 캠페인 하나의 슬라이드를 나눠 만들 프로세스 수 (workers와 함께 쓰면 곱만큼 프로세스 사용)
+    """
+
+    os.makedirs(output_dir, exist_ok=True)
+    _copy_shared_assets(output_dir)
+
+    state_path = os.path.join(output_dir, STATE_FILE)
+    state = {}
+    if not force and os.path.exists(state_path):
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+    generator_digest = _generator_digest()
+    hashes = {campaign["id"]: campaign_hash(campaign, generator_digest) for campaign in campaigns}
+
+    pending = []
+    skipped = []
+    for campaign in campaigns:
+        campaign_id = campaign["id"]
+        outputs_exist = all(
+            os.path.exists(os.path.join(output_dir, f"{campaign_id}{ext}")) for ext in (".html", ".pptx")
+        )
+        if state.get(campaign_id) == hashes[campaign_id] and outputs_exist:
+            skipped.append(campaign_id)
+        else:
+            pending.append(campaign)
+
+    tasks = [(campaign, output_dir, slide_workers) for campaign in pending]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_build_campaign_task, tasks))
+    else:
+        for task in tasks:
+            _build_campaign_task(task)
+
+    # 카탈로그에서 빠진 캠페인의 기록은 정리
+    new_state = {campaign_id: hashes[campaign_id] for campaign_id in hashes}
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(new_state, f, ensure_ascii=False, indent=2)
+
+    return {"built": [campaign["id"] for campaign in pending], "skipped": skipped}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="카탈로그에서 캠페인별 PPT와 HTML을 생성합니다.")
+    parser.add_argument("catalog", nargs="?", default=DEFAULT_CATALOG, help=f"카탈로그 파일 (기본 {DEFAULT_CATALOG})")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_DIR, help=f"출력 폴더 (기본 {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument("--workers", type=int, default=1, help="동시에 생성할 캠페인 수 (기본 1)")
+    parser.add_argument("--slide-workers", type=int, default=1, help="캠페인별 슬라이드를 나눠 만들 프로세스 수 (기본 1)")
+    parser.add_argument("--force", action="store_true", help="바뀌지 않은 캠페인도 다시 생성")
+    args = parser.parse_args(argv)
+
+    try:
+        campaigns = load_catalog(args.catalog)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"❌ 카탈로그를 읽을 수 없습니다: {e}")
+        return 2
+
+    print(f"🎬 카탈로그 생성을 시작합니다... ({len(campaigns)}개 캠페인)")
+    result = build_catalog(campaigns, args.output, workers=args.workers, force=args.force,
+                           slide_workers=args.slide_workers)
+
+    print(f"✅ 생성 {len(result['built'])}개 / 변경 없음 {len(result['skipped'])}개")
+    print(f"📁 출력 폴더: {os.path.abspath(args.output)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,126 +6,429 @@ HTML 파일과 CSS 스타일을 그대로 유지하면서 PDF로 변환합니다
 """
 
 import os
+import re
 import sys
+import threading
 from pathlib import Path
 
-def create_pdf_from_html():
-    """HTML 웹페이지를 PDF로 변환"""
+from render_output import deliver, is_stream
+from render_trace import get_tracer, output_size
+
+# PDF 최적화 CSS (weasyprint에 추가 스타일시트로 전달)
+PDF_CSS = '''
+@page {
+    size: A4;
+    margin: 20mm;
+    @bottom-center {
+        content: "음원 마케팅 체험단 - " counter(page);
+        font-size: 10pt;
+        color: #666;
+    }
+}
+
+body {
+    font-family: 'Malgun Gothic', 'Apple SD Gothic Neo', sans-serif;
+    line-height: 1.4;
+}
+
+/* 페이지 나누기 최적화 */
+.hero-section, .process-section, .program-section, 
+.benefits-section, .application-section {
+    page-break-inside: avoid;
+    margin-bottom: 30px;
+}
+
+/* 모바일 스타일 비활성화 */
+@media print {
+    .mobile-menu-btn { display: none !important; }
+    .mobile-menu { display: none !important; }
+    .floating-elements { position: static !important; }
+    .floating-card { 
+        position: static !important; 
+        transform: none !important;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1) !important;
+        margin: 10px;
+        display: inline-block;
+    }
+}
+
+/* 테이블 스타일 보정 */
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 20px 0;
+    page-break-inside: avoid;
+}
+
+th, td {
+    border: 1px solid #ddd;
+    padding: 8px;
+    text-align: center;
+    font-size: 12px;
+}
+
+/* 프로세스 스텝 레이아웃 조정 */
+.process-steps {
+    display: flex;
+    flex-wrap: wrap;
+    justify-content: center;
+    gap: 10px;
+}
+
+.process-step {
+    width: 150px;
+    min-height: 80px;
+    margin: 5px;
+}
+'''
+
+# 인쇄 폭(mm, A4 세로 210mm - 좌우 여백 20mm), CSS 번들에서 @media 조건 평가에 사용
+BUNDLE_MEDIA_WIDTH_MM = 210 - 20 - 20
+
+# 번들 CSS 파싱 결과를 보관할 최대 개수 (HTML마다 번들이 다름)
+_BUNDLE_STYLESHEET_LIMIT = 16
+
+# pdfkit(wkhtmltopdf) PDF 옵션
+PDFKIT_OPTIONS = {
+    'page-size': 'A4',
+    'margin-top': '20mm',
+    'margin-right': '20mm',
+    'margin-bottom': '20mm',
+    'margin-left': '20mm',
+    'encoding': "UTF-8",
+    'no-outline': None,
+    'enable-local-file-access': None,
+    'print-media-type': None,
+    'disable-smart-shrinking': None,
+    'footer-center': '음원 마케팅 체험단 - [page]',
+    'footer-font-size': '10'
+}
+
+# HTML의 <link> 태그와 속성
+_LINK_TAG_PATTERN = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+_ATTRIBUTE_PATTERN = re.compile(r'([a-zA-Z-]+)\s*=\s*["\']([^"\']*)["\']')
+
+class WeasyRenderer:
+    """여러 번의 렌더링에서 폰트 설정과 파싱된 스타일시트를 재사용하는 weasyprint 렌더러
     
-    print("🔄 HTML to PDF 변환을 시작합니다...")
+    - FontConfiguration을 한 번만 만들어 한글 폰트('Malgun Gothic' 등) 탐색을 반복하지 않습니다.
+    - PDF_CSS와 HTML이 링크한 로컬 스타일시트(styles.css 등)는 파일이 바뀌지 않는 한 한 번만 파싱합니다.
+      로컬 <link>는 HTML에서 제거하고 파싱된 CSS를 PDF_CSS 앞에 추가 스타일시트로 전달합니다.
+      (cache_local_stylesheets=False이면 <link>를 그대로 두고 매번 파싱)
+    - bundle_css=True이면 로컬 스타일시트와 PDF_CSS 대신 인쇄에 필요한 규칙만 남겨 합친 번들(css_bundle)을
+      파싱합니다. 번들은 내용이 같으면 한 번만 파싱합니다.
+    - 원격 리소스(웹 폰트 CSS, 아이콘 CSS 등)는 한 번만 내려받아 메모리에 보관합니다.
+    - resolver(asset_resolver.AssetResolver)가 있으면 신뢰할 수 없는 HTML용으로 모든 리소스 요청을 제한합니다:
+      file: 주소는 resolver.base_dir 안의 파일만 resolver를 거쳐 제공하고, 외부 주소는 resolver의
+      외부 요청 처리 방식(stub/block/allow)을 따릅니다.
     
-    # 현재 디렉토리의 HTML 파일 확인
-    html_file = "index.html"
-    if not os.path.exists(html_file):
-        print(f"❌ {html_file} 파일을 찾을 수 없습니다.")
-        return False
+    렌더링은 잠금으로 한 번에 하나씩 실행됩니다.
+    """
     
-    try:
-        # weasyprint 사용
-        from weasyprint import HTML, CSS
+    def __init__(self, extra_css=PDF_CSS, cache_local_stylesheets=True, tracer=None, bundle_css=False,
+                 resolver=None):
+        from weasyprint import CSS
         from weasyprint.text.fonts import FontConfiguration
         
-        print("📄 weasyprint를 사용하여 PDF를 생성합니다...")
+        self.tracer = get_tracer(tracer)
+        self.cache_local_stylesheets = cache_local_stylesheets
+        self.bundle_css = bundle_css
+        self.extra_css = extra_css
+        self.resolver = resolver
+        self._css_class = CSS
+        self._lock = threading.Lock()
+        self._stylesheets = {}  # (경로, 수정 시각, 크기) -> CSS
+        self._bundles = {}  # 번들 CSS 텍스트 -> CSS
+        self._fetched = {}  # URL -> (최종 URL, 본문, 헤더, 상태)
+        self.url_fetcher = self._make_url_fetcher()
         
         # 폰트 설정
-        font_config = FontConfiguration()
-        
-        # HTML 파일 읽기
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        with self.tracer.span("weasyprint.font_config"):
+            self.font_config = FontConfiguration()
         
         # 추가 CSS (PDF 최적화)
-        pdf_css = CSS(string='''
-            @page {
-                size: A4;
-                margin: 20mm;
-                @bottom-center {
-                    content: "음원 마케팅 체험단 - " counter(page);
-                    font-size: 10pt;
-                    color: #666;
-                }
-            }
-            
-            body {
-                font-family: 'Malgun Gothic', 'Apple SD Gothic Neo', sans-serif;
-                line-height: 1.4;
-            }
-            
-            /* 페이지 나누기 최적화 */
-            .hero-section, .process-section, .program-section, 
-            .benefits-section, .application-section {
-                page-break-inside: avoid;
-                margin-bottom: 30px;
-            }
-            
-            /* 모바일 스타일 비활성화 */
-            @media print {
-                .mobile-menu-btn { display: none !important; }
-                .mobile-menu { display: none !important; }
-                .floating-elements { position: static !important; }
-                .floating-card { 
-                    position: static !important; 
-                    transform: none !important;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1) !important;
-                    margin: 10px;
-                    display: inline-block;
-                }
-            }
-            
-            /* 테이블 스타일 보정 */
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin: 20px 0;
-                page-break-inside: avoid;
-            }
-            
-            th, td {
-                border: 1px solid #ddd;
-                padding: 8px;
-                text-align: center;
-                font-size: 12px;
-            }
-            
-            /* 프로세스 스텝 레이아웃 조정 */
-            .process-steps {
-                display: flex;
-                flex-wrap: wrap;
-                justify-content: center;
-                gap: 10px;
-            }
-            
-            .process-step {
-                width: 150px;
-                min-height: 80px;
-                margin: 5px;
-            }
-        ''', font_config=font_config)
-        
-        # PDF 생성
-        output_file = "음원_마케팅_체험단.pdf"
-        
-        html_doc = HTML(string=html_content, base_url=Path.cwd().as_uri())
-        html_doc.write_pdf(
-            output_file, 
-            stylesheets=[pdf_css],
-            font_config=font_config,
-            optimize_images=True
-        )
+        with self.tracer.span("weasyprint.parse_css", source="PDF_CSS"):
+            self.pdf_css = CSS(string=extra_css, font_config=self.font_config, url_fetcher=self.url_fetcher)
+    
+    def _make_url_fetcher(self):
+        """원격 리소스를 캐시하는 url_fetcher (weasyprint에 URLFetcher 클래스가 없으면 None)"""
+        
+        try:
+            from weasyprint.urls import URLFetcher, URLFetcherResponse
+        except ImportError:
+            if self.resolver is not None:
+                # 제한 없는 기본 fetcher로 대신할 수 없음
+                raise
+            return None
+        
+        fetched = self._fetched
+        resolver = self.resolver
+        
+        def resolve(url):
+            """resolver 기준 응답 (None이면 기본 fetcher로 가져옴, 허용되지 않으면 예외 발생)"""
+            
+            from urllib.parse import urlparse
+            from urllib.request import url2pathname
+            
+            from asset_resolver import is_within, resource_type_for
+            
+            parsed = urlparse(url)
+            scheme = parsed.scheme.lower()
+            target = url
+            if scheme == "file":
+                path = os.path.normpath(url2pathname(parsed.path))
+                if parsed.netloc not in ("", "localhost") or not is_within(path, resolver.base_dir):
+                    raise ValueError(f"base_dir 밖의 파일은 읽을 수 없습니다: {url}")
+                target = resolver.url_for(path)
+            elif scheme not in ("http", "https", "data"):
+                raise ValueError(f"허용되지 않는 주소입니다: {url}")
+            
+            action, response = resolver.resolve(target, resource_type_for(url))
+            if action == "abort":
+                raise ValueError(f"외부 요청이 차단되었습니다: {url}")
+            if action == "continue":
+                return None
+            if response["status"] != 200:
+                raise ValueError(f"리소스를 찾을 수 없습니다: {url}")
+            # 상대 경로가 원래 주소 기준으로 풀리도록 요청한 URL을 그대로 사용
+            return URLFetcherResponse(url, response["body"], {"Content-Type": response["content_type"]})
+        
+        class CachingURLFetcher(URLFetcher):
+            def fetch(self, url, headers=None):
+                if resolver is not None:
+                    response = resolve(url)
+                    if response is not None:
+                        return response
+                
+                # 로컬 파일은 바뀔 수 있고 읽기도 빠르므로 캐시하지 않음
+                if not url.lower().startswith(("http://", "https://")):
+                    return super().fetch(url, headers)
+                
+                if url not in fetched:
+                    response = super().fetch(url, headers)
+                    try:
+                        fetched[url] = (response.url, response.read(), dict(response.headers.items()), response.status)
+                    finally:
+                        response.close()
+                
+                final_url, body, response_headers, status = fetched[url]
+                return URLFetcherResponse(final_url, body, response_headers, status)
+        
+        return CachingURLFetcher()
+    
+    def _local_stylesheet(self, path):
+        """로컬 스타일시트를 파싱해 반환 (파일이 바뀌지 않았으면 캐시 사용)"""
+        
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self.tracer.span("weasyprint.parse_css", source=os.path.basename(path)) as span:
+            span["cached"] = key in self._stylesheets
+            if key not in self._stylesheets:
+                # 같은 파일의 이전 버전은 삭제
+                for old_key in [k for k in self._stylesheets if k[0] == path]:
+                    del self._stylesheets[old_key]
+                self._stylesheets[key] = self._css_class(
+                    filename=path, font_config=self.font_config, url_fetcher=self.url_fetcher)
+        return self._stylesheets[key]
+    
+    def _bundle_stylesheet(self, html_path, html_content):
+        """인쇄용 CSS 번들을 파싱해 반환 (번들 내용이 같으면 캐시 사용)"""
+        
+        from css_bundle import bundle_for_html, css_px
+        
+        with self.tracer.span("css.bundle") as span:
+            css, _ = bundle_for_html(html_path, self.extra_css, css_px(BUNDLE_MEDIA_WIDTH_MM), html_content)
+            span["bytes"] = len(css.encode('utf-8'))
+        
+        with self.tracer.span("weasyprint.parse_css", source="bundle") as span:
+            span["cached"] = css in self._bundles
+            if css not in self._bundles:
+                if len(self._bundles) >= _BUNDLE_STYLESHEET_LIMIT:
+                    self._bundles.clear()
+                self._bundles[css] = self._css_class(
+                    string=css, base_url=Path(html_path).parent.as_uri() + '/',
+                    font_config=self.font_config, url_fetcher=self.url_fetcher)
+        return self._bundles[css]
+    
+    def _extract_local_stylesheets(self, html_content, base_dir, parse=True):
+        """HTML에서 로컬 스타일시트 <link>를 제거하고 (HTML, 파싱된 CSS 목록) 반환 (parse=False이면 경로 목록)"""
+        
+        from render_cache import is_local_reference
+        
+        stylesheets = []
+        
+        def replace(match):
+            attributes = {name.lower(): value for name, value in _ATTRIBUTE_PATTERN.findall(match.group(0))}
+            href = attributes.get("href", "")
+            media = attributes.get("media", "all").lower()
+            if ("stylesheet" not in attributes.get("rel", "").lower().split()
+                    or not is_local_reference(href)
+                    or not ("all" in media or "print" in media)):
+                return match.group(0)
+            
+            path = os.path.normpath(os.path.join(base_dir, href.split('#')[0].split('?')[0]))
+            if not os.path.isfile(path):
+                return match.group(0)
+            if self.resolver is not None and not self.resolver.serves(path):
+                # 남겨 두면 url_fetcher가 거부함
+                return match.group(0)
+            
+            stylesheets.append(self._local_stylesheet(path) if parse else path)
+            return ""
+        
+        return _LINK_TAG_PATTERN.sub(replace, html_content), stylesheets
+    
+    def render(self, html_file, output_file=None, html_content=None, tracer=None):
+        """HTML 파일을 PDF로 렌더링 (실패 시 예외 발생)
+        
+        output_file: 파일 경로, 바이너리 스트림, 또는 None (None이면 PDF 바이트 반환)
+        html_content: 이미 읽어 둔 HTML 문자열 (주어지면 파일을 다시 읽지 않음)
+        """
+        
+        from weasyprint import HTML
+        
+        tracer = tracer if tracer is not None else self.tracer
+        html_path = Path(html_file).resolve()
+        
+        with self._lock, tracer.span("render", profile="weasyprint", input=str(html_path)) as render_span:
+            # HTML 파일 읽기
+            if html_content is None:
+                with tracer.span("html.read") as span:
+                    with open(html_file, 'r', encoding='utf-8') as f:
+                        html_content = f.read()
+                    span["bytes"] = len(html_content.encode('utf-8'))
+            
+            stylesheets = []
+            if self.bundle_css:
+                # 번들에 로컬 스타일시트와 PDF_CSS가 모두 들어 있음
+                bundle = self._bundle_stylesheet(str(html_path), html_content)
+                html_content, _ = self._extract_local_stylesheets(html_content, str(html_path.parent), parse=False)
+                stylesheets = [bundle]
+            elif self.cache_local_stylesheets:
+                html_content, stylesheets = self._extract_local_stylesheets(html_content, str(html_path.parent))
+                stylesheets.append(self.pdf_css)
+            else:
+                stylesheets = [self.pdf_css]
+            
+            # 레이아웃 계산 (상대 경로 리소스는 HTML 파일 위치 기준)
+            options = {"stylesheets": stylesheets, "optimize_images": True}
+            with tracer.span("weasyprint.layout") as span:
+                base_url = html_path.parent.as_uri() + '/'
+                html_doc = HTML(string=html_content, base_url=base_url, url_fetcher=self.url_fetcher)
+                document = html_doc.render(font_config=self.font_config, **options)
+                span["pages"] = len(document.pages)
+            
+            # PDF 생성
+            with tracer.span("weasyprint.write_pdf") as span:
+                pdf_bytes = document.write_pdf(output_file, **options)
+                span["bytes"] = render_span["bytes"] = len(pdf_bytes) if pdf_bytes is not None else output_size(output_file)
+            
+            return pdf_bytes
+
+_default_weasy_renderer = None
+_default_weasy_renderer_lock = threading.Lock()
+
+def get_weasy_renderer():
+    """프로세스에서 공유하는 WeasyRenderer (처음 호출할 때 생성)"""
+    
+    global _default_weasy_renderer
+    
+    with _default_weasy_renderer_lock:
+        if _default_weasy_renderer is None:
+            _default_weasy_renderer = WeasyRenderer()
+        return _default_weasy_renderer
+
+def render_pdf_with_weasyprint(html_file, output_file=None, tracer=None, html_content=None, renderer=None):
+    """weasyprint로 HTML 파일을 PDF로 렌더링 (실패 시 예외 발생)
+    
+    output_file: 파일 경로, 바이너리 스트림, 또는 None (None이면 PDF 바이트 반환)
+    tracer: 단계별 시간을 기록할 render_trace.Tracer
+    html_content: 이미 읽어 둔 HTML 문자열 (주어지면 파일을 다시 읽지 않음)
+    renderer: 사용할 WeasyRenderer (없으면 프로세스 공용 렌더러를 사용해 폰트 설정과 CSS 파싱을 재사용)
+    """
+    
+    if renderer is None:
+        with get_tracer(tracer).span("weasyprint.renderer"):
+            renderer = get_weasy_renderer()
+    
+    return renderer.render(html_file, output_file, html_content, tracer)
+
+def create_pdf_bytes(html_file="index.html", tracer=None):
+    """weasyprint로 HTML 웹페이지를 PDF로 변환하여 바이트로 반환 (실패 시 예외 발생)"""
+    
+    return render_pdf_with_weasyprint(html_file, tracer=tracer)
+
+def create_pdf_from_html(html_file="index.html", output_file="음원_마케팅_체험단.pdf", tracer=None,
+                         policy="explicit", backends=None, registry=None):
+    """HTML 웹페이지를 PDF로 변환 (tracer: 단계별 시간 기록)
+    
+    설치된 백엔드(weasyprint, pdfkit, playwright) 중 policy에 따라 순서를 정해 시도하고,
+    실패하면 다음 백엔드로 넘어갑니다 (render_backends 참고).
+    - policy: "explicit"(backends 순서, 기본 weasyprint → pdfkit → playwright), "fastest", "faithful"
+    - registry: 재사용할 render_backends.BackendRegistry (설치 확인 결과, 브라우저, 측정 시간 공유)
+    """
+    
+    from render_backends import BackendRegistry, NoBackendAvailable
+    
+    print("🔄 HTML to PDF 변환을 시작합니다...")
+    
+    # HTML 파일 확인
+    if not os.path.exists(html_file):
+        print(f"❌ {html_file} 파일을 찾을 수 없습니다.")
+        return False
+    
+    own_registry = registry is None
+    if own_registry:
+        registry = BackendRegistry(tracer=tracer, verbose=True)
+    
+    try:
+        registry.render(html_file, output_file, policy=policy, backends=backends)
         
         print(f"✅ PDF 파일이 생성되었습니다: {output_file}")
-        print(f"📁 파일 위치: {os.path.abspath(output_file)}")
+        if not is_stream(output_file):
+            print(f"📁 파일 위치: {os.path.abspath(output_file)}")
         return True
         
-    except ImportError:
-        print("❌ weasyprint가 설치되지 않았습니다. pdfkit을 시도합니다...")
-        return create_pdf_with_pdfkit()
+    except NoBackendAvailable as e:
+        print("❌ 사용할 수 있는 백엔드로 PDF를 만들지 못했습니다.")
+        for name, reason in e.errors:
+            print(f"   - {name}: {reason}")
+        return False
     except Exception as e:
-        print(f"❌ weasyprint로 PDF 생성 실패: {e}")
-        print("🔄 pdfkit을 시도합니다...")
-        return create_pdf_with_pdfkit()
+        # 출력 파일 쓰기 실패 등 (호출하는 쪽은 True/False만 기대함)
+        print(f"❌ PDF 생성 중 오류가 발생했습니다: {e}")
+        return False
+    finally:
+        if own_registry:
+            registry.close()
 
-def create_pdf_with_pdfkit():
+def render_pdf_with_pdfkit(html_file, output_file=None, tracer=None, configuration=None):
+    """pdfkit(wkhtmltopdf)으로 HTML 파일을 PDF로 렌더링 (실패 시 예외 발생)
+    
+    output_file: 파일 경로, 바이너리 스트림, 또는 None (None이면 PDF 바이트 반환)
+    configuration: 재사용할 pdfkit.configuration() (wkhtmltopdf 경로 탐색 생략)
+    """
+    
+    import pdfkit
+    
+    tracer = get_tracer(tracer)
+    
+    # HTML 파일 경로
+    html_file = os.path.abspath(html_file)
+    
+    # PDF 생성 (스트림 출력이나 바이트 반환은 바이트로 받아 전달)
+    with tracer.span("render", profile="pdfkit", input=html_file) as render_span:
+        with tracer.span("pdfkit.from_file") as span:
+            if output_file is None or is_stream(output_file):
+                pdf_bytes = pdfkit.from_file(html_file, False, options=PDFKIT_OPTIONS, configuration=configuration)
+                span["bytes"] = render_span["bytes"] = len(pdf_bytes)
+                return deliver(pdf_bytes, output_file)
+            
+            pdfkit.from_file(html_file, output_file, options=PDFKIT_OPTIONS, configuration=configuration)
+            span["bytes"] = render_span["bytes"] = output_size(output_file)
+            return None
+
+def create_pdf_with_pdfkit(html_file="index.html", output_file="음원_마케팅_체험단.pdf", tracer=None):
     """pdfkit을 사용한 PDF 생성 (대안)"""
     
     try:
@@ -133,31 +436,11 @@ def create_pdf_with_pdfkit():
         
         print("📄 pdfkit을 사용하여 PDF를 생성합니다...")
         
-        # HTML 파일 경로
-        html_file = os.path.abspath("index.html")
-        output_file = "음원_마케팅_체험단.pdf"
-        
-        # PDF 옵션 설정
-        options = {
-            'page-size': 'A4',
-            'margin-top': '20mm',
-            'margin-right': '20mm',
-            'margin-bottom': '20mm',
-            'margin-left': '20mm',
-            'encoding': "UTF-8",
-            'no-outline': None,
-            'enable-local-file-access': None,
-            'print-media-type': None,
-            'disable-smart-shrinking': None,
-            'footer-center': '음원 마케팅 체험단 - [page]',
-            'footer-font-size': '10'
-        }
-        
-        # PDF 생성
-        pdfkit.from_file(html_file, output_file, options=options)
+        render_pdf_with_pdfkit(html_file, output_file, tracer)
         
         print(f"✅ PDF 파일이 생성되었습니다: {output_file}")
-        print(f"📁 파일 위치: {os.path.abspath(output_file)}")
+        if not is_stream(output_file):
+            print(f"📁 파일 위치: {os.path.abspath(output_file)}")
         return True
         
     except ImportError as e:
@@ -169,47 +452,71 @@ def create_pdf_with_pdfkit():
         return False
     except Exception as e:
         print(f"❌ pdfkit으로 PDF 생성 실패: {e}")
-        return create_pdf_with_playwright()
+        return create_pdf_with_playwright(html_file, output_file, tracer=tracer)
 
-def create_pdf_with_playwright():
-    """playwright를 사용한 PDF 생성 (최후 대안)"""
+def _render_with_pool(pool, html_file, output_file=None, tracer=None, resolver=None):
+    """브라우저 풀의 페이지에서 PDF 생성 (output_file이 None이면 바이트 반환, resolver: 외부 요청 차단)"""
     
-    try:
-        from playwright.sync_api import sync_playwright
-        
-        print("📄 playwright를 사용하여 PDF를 생성합니다...")
-        
-        html_file = os.path.abspath("index.html")
-        output_file = "음원_마케팅_체험단.pdf"
-        
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page()
+    from asset_resolver import prepare_page
+    from render_ready import PRINT_MODE_SCRIPT, wait_for_render_ready
+    
+    tracer = get_tracer(tracer)
+    
+    with tracer.span("render", profile="playwright", input=html_file) as render_span:
+        with pool.page() as page:
+            # script.js 인쇄 모드 (스크롤/애니메이션 처리 생략)
+            page.add_init_script(PRINT_MODE_SCRIPT)
             
             # HTML 파일 로드
-            page.goto(f"file://{html_file}")
+            with tracer.span("page.goto"):
+                page.goto(prepare_page(page, html_file, resolver))
             
             # 페이지가 완전히 로드될 때까지 대기
-            page.wait_for_load_state('networkidle')
+            with tracer.span("page.wait_networkidle"):
+                page.wait_for_load_state('networkidle')
+            
+            # 애니메이션 완료 신호 대기 (script.js의 렌더 준비 신호)
+            with tracer.span("page.wait_render_ready") as span:
+                span["ready"] = wait_for_render_ready(page)
             
             # PDF 생성
-            page.pdf(
-                path=output_file,
-                format='A4',
-                margin={
-                    'top': '20mm',
-                    'right': '20mm', 
-                    'bottom': '20mm',
-                    'left': '20mm'
-                },
-                print_background=True,
-                prefer_css_page_size=True
-            )
-            
-            browser.close()
+            with tracer.span("page.pdf") as span:
+                pdf_bytes = page.pdf(
+                    format='A4',
+                    margin={
+                        'top': '20mm',
+                        'right': '20mm', 
+                        'bottom': '20mm',
+                        'left': '20mm'
+                    },
+                    print_background=True,
+                    prefer_css_page_size=True
+                )
+                span["bytes"] = render_span["bytes"] = len(pdf_bytes)
+            
+            with tracer.span("output.write"):
+                return deliver(pdf_bytes, output_file)
+
+def create_pdf_with_playwright(html_file="index.html", output_file="음원_마케팅_체험단.pdf", pool=None, tracer=None):
+    """playwright를 사용한 PDF 생성 (최후 대안, pool: 재사용할 BrowserPool, tracer: 단계별 시간 기록)"""
+    
+    try:
+        from browser_pool import BrowserPool
+        
+        print("📄 playwright를 사용하여 PDF를 생성합니다...")
+        
+        html_file = os.path.abspath(html_file)
+        
+        if pool is None:
+            # 풀이 주어지지 않으면 이번 변환에만 쓰는 브라우저를 실행
+            with BrowserPool(size=1, tracer=tracer) as own_pool:
+                _render_with_pool(own_pool, html_file, output_file, tracer)
+        else:
+            _render_with_pool(pool, html_file, output_file, tracer)
         
         print(f"✅ PDF 파일이 생성되었습니다: {output_file}")
-        print(f"📁 파일 위치: {os.path.abspath(output_file)}")
+        if not is_stream(output_file):
+            print(f"📁 파일 위치: {os.path.abspath(output_file)}")
         return True
         
     except ImportError:
@@ -3,6 +3,10 @@
 """
 음원 마케팅 체험단 PPT 생성 스크립트
 HTML 웹페이지 내용을 바탕으로 PowerPoint 프레젠테이션을 생성합니다.
+
+슬라이드는 (함수, 인자, 키워드 인자) 명세 목록으로 정의되며, workers > 1이면
+슬라이드 XML을 여러 프로세스에서 나눠 만든 뒤 명세 순서대로 하나의 파일로 조립합니다.
+저장할 때 zip 항목 시각과 문서 수정 시각을 고정하므로 workers 수와 관계없이 결과 바이트가 같습니다.
 """
 
 from pptx import Presentation
@@ -11,51 +15,204 @@ from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.parts.slide import SlidePart
+from pptx.oxml.ns import qn
+from lxml import etree
+import copy
+import copyreg
+import datetime
+import io
 import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from render_output import deliver
+from render_trace import get_tracer, output_size
+
+# 색상 정의 (CSS 변수에서 가져온 색상)
+PRIMARY_COLOR = RGBColor(99, 102, 241)    # #6366f1
+SECONDARY_COLOR = RGBColor(16, 185, 129)  # #10b981
+ACCENT_COLOR = RGBColor(245, 158, 11)     # #f59e0b
+DARK_COLOR = RGBColor(31, 41, 55)         # #1f2937
+LIGHT_COLOR = RGBColor(107, 114, 128)     # #6b7280
+
+# 프로그램 표 크기
+TABLE_WIDTH = Inches(9)
+TABLE_HEIGHT = Inches(3)
+
+# 반복해서 쓰는 텍스트 상자 스타일 (위치, 정렬, 글꼴)
+SUBTITLE_STYLE = {"position": (Inches(1), Inches(1.5), Inches(8), Inches(0.5)), "alignment": PP_ALIGN.CENTER, "size": Pt(16)}
+NOTE_STYLE = {"position": (Inches(1), Inches(6.5), Inches(8), Inches(0.5)), "size": Pt(12), "italic": True}
+
+# zip 항목 시각의 하한 (zip 형식은 1980년 이전을 표현할 수 없음)
+# 저장 시각은 SOURCE_DATE_EPOCH가 있으면 그 시각, 없으면 템플릿의 생성 시각으로 고정
+DEFAULT_BUILD_TIMESTAMP = datetime.datetime(1980, 1, 1)
 
-def create_music_marketing_ppt():
-    """음원 마케팅 체험단 PPT 생성"""
+# 명세를 다른 프로세스로 보낼 수 있도록 RGBColor를 16진수 문자열로 직렬화
+copyreg.pickle(RGBColor, lambda color: (RGBColor.from_string, (str(color),)))
+
+def create_music_marketing_ppt(filename='음원_마케팅_체험단.pptx', tracer=None, workers=1):
+    """음원 마케팅 체험단 PPT 생성 (filename: 파일 경로 또는 바이너리 스트림, tracer: 단계별 시간 기록)"""
     
-    # 새 프레젠테이션 생성
-    prs = Presentation()
+    tracer = get_tracer(tracer)
+    
+    with tracer.span("render", profile="pptx") as render_span:
+        with tracer.span("pptx.build", workers=workers) as span:
+            prs = build_music_marketing_presentation(workers=workers)
+            span["slides"] = len(prs.slides)
+        
+        # PPT 파일 저장 (스트림이면 그대로 기록)
+        with tracer.span("pptx.save") as span:
+            save_presentation(prs, filename)
+            span["bytes"] = render_span["bytes"] = output_size(filename)
+    
+    if isinstance(filename, (str, os.PathLike)):
+        print(f"✅ PPT 파일이 생성되었습니다: {filename}")
     
-    # 색상 정의 (CSS 변수에서 가져온 색상)
-    primary_color = RGBColor(99, 102, 241)    # #6366f1
-    secondary_color = RGBColor(16, 185, 129)  # #10b981
-    accent_color = RGBColor(245, 158, 11)     # #f59e0b
-    dark_color = RGBColor(31, 41, 55)         # #1f2937
-    light_color = RGBColor(107, 114, 128)     # #6b7280
+    return filename
+
+def create_music_marketing_ppt_bytes(tracer=None, workers=1):
+    """음원 마케팅 체험단 PPT를 파일 없이 바이트로 생성"""
     
-    # 슬라이드 1: 타이틀 페이지
-    create_title_slide(prs, primary_color, accent_color)
+    tracer = get_tracer(tracer)
     
-    # 슬라이드 2: 체험단 진행과정
-    create_process_slide(prs, primary_color, secondary_color)
+    with tracer.span("render", profile="pptx") as render_span:
+        with tracer.span("pptx.build", workers=workers) as span:
+            prs = build_music_marketing_presentation(workers=workers)
+            span["slides"] = len(prs.slides)
+        
+        with tracer.span("pptx.save") as span:
+            data = save_presentation(prs)
+            span["bytes"] = render_span["bytes"] = len(data)
     
-    # 슬라이드 3: 인스타그램/틱톡 프로그램
-    create_instagram_tiktok_slide(prs, primary_color, accent_color)
+    return data
+
+def music_marketing_slide_specs():
+    """음원 마케팅 체험단 슬라이드 명세 [(슬라이드 함수, 인자, 키워드 인자)] (슬라이드 순서대로)"""
+    
+    return [
+        # 슬라이드 1: 타이틀 페이지
+        (create_title_slide, (PRIMARY_COLOR, ACCENT_COLOR), {}),
+        # 슬라이드 2: 체험단 진행과정
+        (create_process_slide, (PRIMARY_COLOR, SECONDARY_COLOR), {}),
+        # 슬라이드 3: 인스타그램/틱톡 프로그램
+        (create_instagram_tiktok_slide, (PRIMARY_COLOR, ACCENT_COLOR), {}),
+        # 슬라이드 4: 음원 다운로드 프로그램
+        (create_music_download_slide, (PRIMARY_COLOR, SECONDARY_COLOR), {}),
+        # 슬라이드 5: 블로그/카페/커뮤니티 프로그램
+        (create_blog_community_slide, (PRIMARY_COLOR, ACCENT_COLOR), {}),
+        # 슬라이드 6: 체험단 특별 혜택
+        (create_benefits_slide, (PRIMARY_COLOR, SECONDARY_COLOR), {}),
+        # 슬라이드 7: 신청 방법
+        (create_application_slide, (PRIMARY_COLOR, ACCENT_COLOR), {}),
+    ]
+
+def build_music_marketing_presentation(use_templates=False, workers=1):
+    """음원 마케팅 체험단 슬라이드를 모두 만든 Presentation 객체 반환
     
-    # 슬라이드 4: 음원 다운로드 프로그램
-    create_music_download_slide(prs, primary_color, secondary_color)
+    use_templates=True이면 표와 부제목을 미리 만든 XML 템플릿에서 복제합니다 (결과는 동일).
+    """
     
-    # 슬라이드 5: 블로그/카페/커뮤니티 프로그램
-    create_blog_community_slide(prs, primary_color, accent_color)
+    return build_presentation_from_specs(music_marketing_slide_specs(), use_templates, workers)
+
+def build_presentation_from_specs(specs, use_templates=False, workers=1):
+    """슬라이드 명세 목록으로 Presentation 생성
     
-    # 슬라이드 6: 체험단 특별 혜택
-    create_benefits_slide(prs, primary_color, secondary_color)
+    workers > 1이면 명세를 연속된 묶음으로 나눠 각 프로세스에서 슬라이드 XML을 만들고,
+    새 Presentation에 명세 순서대로 슬라이드 파트를 붙입니다.
+    슬라이드 함수는 슬라이드 하나만 추가하고 이미지 등 별도 파트를 만들지 않아야 합니다.
+    """
     
-    # 슬라이드 7: 신청 방법
-    create_application_slide(prs, primary_color, accent_color)
+    prs = Presentation()
     
-    # PPT 파일 저장
-    filename = '음원_마케팅_체험단.pptx'
-    prs.save(filename)
-    print(f"✅ PPT 파일이 생성되었습니다: {filename}")
+    if workers <= 1 or len(specs) <= 1:
+        _add_slides(prs, specs, use_templates)
+        return prs
     
-    return filename
+    # 프로세스당 여러 묶음을 두어 슬라이드 크기 차이로 인한 대기를 줄임
+    chunk_size = max(1, -(-len(specs) // (workers * 4)))
+    chunks = [specs[i:i + chunk_size] for i in range(0, len(specs), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map은 결과를 입력 순서대로 돌려주므로 완료 순서와 관계없이 조립 순서가 고정됨
+        for parts in executor.map(_build_slide_parts, chunks, [use_templates] * len(chunks)):
+            for layout_index, xml in parts:
+                _append_slide_part(prs, prs.slide_layouts[layout_index], xml)
+    
+    return prs
+
+def _add_slides(prs, specs, use_templates):
+    templates = SlideTemplates() if use_templates else None
+    for function, args, kwargs in specs:
+        function(prs, *args, templates=templates, **kwargs)
 
-def create_title_slide(prs, primary_color, accent_color):
-    """타이틀 슬라이드 생성"""
+def _build_slide_parts(specs, use_templates):
+    """작업 프로세스: 명세 묶음의 슬라이드를 만들고 [(레이아웃 번호, 슬라이드 XML 바이트)] 반환"""
+    
+    prs = Presentation()
+    _add_slides(prs, specs, use_templates)
+    layouts = list(prs.slide_layouts)
+    return [(layouts.index(slide.slide_layout), etree.tostring(slide._element)) for slide in prs.slides]
+
+def _append_slide_part(prs, slide_layout, xml):
+    """작업 프로세스에서 만든 슬라이드 XML을 새 슬라이드 파트로 추가
+    
+    prs.slides.add_slide와 같은 파트 이름, rId, 슬라이드 id를 쓰지만 기존 관계를 매번 훑지 않으므로
+    슬라이드 수에 비례하는 시간에 조립됩니다 (레이아웃 자리표시자 복제도 생략).
+    """
+    
+    sld_id_lst = prs.part._element.get_or_add_sldIdLst()
+    count = len(sld_id_lst)
+    slide_part = SlidePart(PackURI(f"/ppt/slides/slide{count + 1}.xml"), CT.PML_SLIDE, prs.part.package,
+                           parse_xml(xml))
+    slide_part.relate_to(slide_layout.part, RT.SLIDE_LAYOUT)
+    r_id = prs.part.rels._add_relationship(RT.SLIDE, slide_part)
+    last_id = int(sld_id_lst[-1].get('id')) if count else 255
+    sld_id_lst._add_sldId(id=last_id + 1, rId=r_id)
+
+def _build_timestamp():
+    """SOURCE_DATE_EPOCH 시각 (없으면 None)"""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc).replace(tzinfo=None)
+    return None
+
+def save_presentation(prs, output=None, timestamp=None):
+    """문서 수정 시각과 zip 항목 시각을 고정해 저장 (같은 내용이면 항상 같은 바이트)
+    
+    output: 파일 경로, 바이너리 스트림 또는 None (None이면 바이트 반환)
+    """
+    
+    timestamp = timestamp or _build_timestamp()
+    props = prs.core_properties
+    if timestamp:
+        # 요청한 시각으로 고정 (생성 시각이 더 늦으면 함께 맞춰 수정 시각이 앞서지 않게 함)
+        props.modified = timestamp
+        if props.created and props.created > timestamp:
+            props.created = timestamp
+    else:
+        props.modified = props.created or DEFAULT_BUILD_TIMESTAMP
+    zip_time = max(props.modified, DEFAULT_BUILD_TIMESTAMP)
+    
+    stream = io.BytesIO()
+    prs.save(stream)
+    
+    normalized = io.BytesIO()
+    with zipfile.ZipFile(stream) as source, zipfile.ZipFile(normalized, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            entry = zipfile.ZipInfo(info.filename, date_time=zip_time.timetuple()[:6])
+            entry.compress_type = info.compress_type
+            entry.external_attr = info.external_attr
+            target.writestr(entry, source.read(info.filename))
+    
+    return deliver(normalized.getvalue(), output)
+
+def create_title_slide(prs, primary_color, accent_color, title="음원 마케팅 체험단",
+                       subtitle="새로운 음원의 시작, 미교 체험단",
+                       channels=("📱 인스타그램", "🎬 틱톡", "🔍 네이버"), templates=None):
+    """타이틀 슬라이드 생성 (templates는 사용하지 않음, 다른 슬라이드 함수와 호출 형식을 맞춤)"""
     slide_layout = prs.slide_layouts[6]  # 빈 슬라이드
     slide = prs.slides.add_slide(slide_layout)
     
@@ -68,7 +225,7 @@ def create_title_slide(prs, primary_color, accent_color):
     # 메인 제목
     title_box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1.5))
     title_frame = title_box.text_frame
-    title_frame.text = "음원 마케팅 체험단"
+    title_frame.text = title
     title_para = title_frame.paragraphs[0]
     title_para.alignment = PP_ALIGN.CENTER
     title_para.font.size = Pt(48)
@@ -78,18 +235,18 @@ def create_title_slide(prs, primary_color, accent_color):
     # 부제목
     subtitle_box = slide.shapes.add_textbox(Inches(1), Inches(4), Inches(8), Inches(1))
     subtitle_frame = subtitle_box.text_frame
-    subtitle_frame.text = "새로운 음원의 시작, 미교 체험단"
+    subtitle_frame.text = subtitle
     subtitle_para = subtitle_frame.paragraphs[0]
     subtitle_para.alignment = PP_ALIGN.CENTER
     subtitle_para.font.size = Pt(24)
     subtitle_para.font.color.rgb = accent_color
     
-    # 플로팅 요소들 (텍스트로 표현)
-    elements = [
-        ("📱 인스타그램", Inches(1.5), Inches(6)),
-        ("🎬 틱톡", Inches(4.25), Inches(6.5)),
-        ("🔍 네이버", Inches(7), Inches(6))
-    ]
+    # 플로팅 요소들 (텍스트로 표현, 1.5~7인치 사이에 지그재그로 배치)
+    elements = []
+    for i, text in enumerate(channels):
+        left = 1.5 + i * 5.5 / (len(channels) - 1) if len(channels) > 1 else 4.25
+        top = 6.5 if i % 2 else 6
+        elements.append((text, Inches(left), Inches(top)))
     
     for text, left, top in elements:
         element_box = slide.shapes.add_textbox(left, top, Inches(1.5), Inches(0.8))
@@ -100,35 +257,31 @@ def create_title_slide(prs, primary_color, accent_color):
         element_para.font.size = Pt(14)
         element_para.font.color.rgb = RGBColor(255, 255, 255)
 
-def create_process_slide(prs, primary_color, secondary_color):
+DEFAULT_PROCESS_STEPS = [
+    "1. 체험단 신청서 작성\n(신청자)",
+    "2. 접수\n(대행사)",
+    "3. 체험단 승인\n(대행사)",
+    "4. 게시물 작성\n(신청자)",
+    "5. 게시물 확인\n(대행사)",
+    "6. 이체(입금)\n(대행사)"
+]
+
+def create_process_slide(prs, primary_color, secondary_color, title_text="체험단 진행과정",
+                         description="체험단 신청부터 완료까지의 단계별 진행과정을 안내해드립니다.",
+                         steps=DEFAULT_PROCESS_STEPS, templates=None):
     """체험단 진행과정 슬라이드"""
     slide_layout = prs.slide_layouts[5]  # 제목과 내용
     slide = prs.slides.add_slide(slide_layout)
     
     # 제목
     title = slide.shapes.title
-    title.text = "체험단 진행과정"
+    title.text = title_text
     title_para = title.text_frame.paragraphs[0]
     title_para.font.size = Pt(36)
     title_para.font.color.rgb = primary_color
     
     # 부제목
-    subtitle_box = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(0.5))
-    subtitle_frame = subtitle_box.text_frame
-    subtitle_frame.text = "체험단 신청부터 완료까지의 단계별 진행과정을 안내해드립니다."
-    subtitle_para = subtitle_frame.paragraphs[0]
-    subtitle_para.alignment = PP_ALIGN.CENTER
-    subtitle_para.font.size = Pt(16)
-    
-    # 진행과정 단계들
-    steps = [
-        "1. 체험단 신청서 작성\n(신청자)",
-        "2. 접수\n(대행사)",
-        "3. 체험단 승인\n(대행사)",
-        "4. 게시물 작성\n(신청자)",
-        "5. 게시물 확인\n(대행사)",
-        "6. 이체(입금)\n(대행사)"
-    ]
+    add_styled_textbox(slide, SUBTITLE_STYLE, description, templates)
     
     # 3x2 그리드로 배치
     for i, step in enumerate(steps):
@@ -155,19 +308,30 @@ def create_process_slide(prs, primary_color, secondary_color):
             arrow_para.font.size = Pt(20)
             arrow_para.font.color.rgb = primary_color
 
-def create_instagram_tiktok_slide(prs, primary_color, accent_color):
-    """인스타그램/틱톡 프로그램 슬라이드"""
+def create_program_slide(prs, title_text, table_data, primary_color, highlight_color, note=None, title_size=32,
+                         templates=None):
+    """프로그램 표 슬라이드 (제목, 표, 참고사항)"""
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
     # 제목
     title = slide.shapes.title
-    title.text = "📱 인스타그램 / 틱톡"
+    title.text = title_text
     title_para = title.text_frame.paragraphs[0]
-    title_para.font.size = Pt(32)
+    title_para.font.size = Pt(title_size)
     title_para.font.color.rgb = primary_color
     
     # 테이블 생성
+    create_table_on_slide(slide, table_data, Inches(0.5), Inches(2.5), primary_color, highlight_color, templates)
+    
+    # 참고사항
+    if note:
+        add_styled_textbox(slide, NOTE_STYLE, note, templates)
+    
+    return slide
+
+def create_instagram_tiktok_slide(prs, primary_color, accent_color, templates=None):
+    """인스타그램/틱톡 프로그램 슬라이드"""
     table_data = [
         ["방식", "구분", "과정", "추가 내용", "금액"],
         ["1", "인스타그램 업로드(릴스)", "본인 사진 및 영상 업로드", "게시물 업로드 시 지정된 노래 삽입", "3천원"],
@@ -175,50 +339,21 @@ def create_instagram_tiktok_slide(prs, primary_color, accent_color):
         ["3", "틱톡 업로드", "대행사에서 사진 및 영상 전달", "게시물 업로드 시 지정된 노래 삽입", "4천원"]
     ]
     
-    create_table_on_slide(slide, table_data, Inches(0.5), Inches(2.5), primary_color, accent_color)
-    
-    # 참고사항
-    note_box = slide.shapes.add_textbox(Inches(1), Inches(6.5), Inches(8), Inches(0.5))
-    note_frame = note_box.text_frame
-    note_frame.text = "※ 참고사항: 개인에 따라 약간의 편집이 필요함"
-    note_para = note_frame.paragraphs[0]
-    note_para.font.size = Pt(12)
-    note_para.font.italic = True
-
-def create_music_download_slide(prs, primary_color, secondary_color):
+    create_program_slide(prs, "📱 인스타그램 / 틱톡", table_data, primary_color, accent_color,
+                         note="※ 참고사항: 개인에 따라 약간의 편집이 필요함", templates=templates)
+
+def create_music_download_slide(prs, primary_color, secondary_color, templates=None):
     """음원 다운로드 프로그램 슬라이드"""
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # 제목
-    title = slide.shapes.title
-    title.text = "🎵 음원 다운로드"
-    title_para = title.text_frame.paragraphs[0]
-    title_para.font.size = Pt(32)
-    title_para.font.color.rgb = primary_color
-    
-    # 테이블 생성
     table_data = [
         ["방식", "구분", "과정", "추가 내용", "비고"],
         ["1", "멜론 음원 다운로드", "가수검색, 음악검색 → 음원 다운로드", "음원 듣기 및 공감", "3천원"],
         ["2", "네이버 검색", "해당 가수 또는 음원 검색 → 음원 플레이", "해당 게시물 클릭 및 리딩", "3천원"]
     ]
     
-    create_table_on_slide(slide, table_data, Inches(0.5), Inches(2.5), primary_color, secondary_color)
+    create_program_slide(prs, "🎵 음원 다운로드", table_data, primary_color, secondary_color, templates=templates)
 
-def create_blog_community_slide(prs, primary_color, accent_color):
+def create_blog_community_slide(prs, primary_color, accent_color, templates=None):
     """블로그/카페/커뮤니티 프로그램 슬라이드"""
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
-    
-    # 제목
-    title = slide.shapes.title
-    title.text = "✍️ 블로그 / 카페 / 커뮤니티 후기 작성"
-    title_para = title.text_frame.paragraphs[0]
-    title_para.font.size = Pt(28)
-    title_para.font.color.rgb = primary_color
-    
-    # 테이블 생성
     table_data = [
         ["방식", "구분", "과정", "추가 내용", "비고"],
         ["1", "블로그 후기작성", "음원다운로드 후 블로그 후기 작성", "감상평/후기글 1500자 이상 작성", "1.5만"],
@@ -226,36 +361,34 @@ def create_blog_community_slide(prs, primary_color, accent_color):
         ["3", "커뮤니티글 작성", "음원다운로드 후 커뮤니티 글 게시", "감상평/후기글 500자 이상 작성", "1만"]
     ]
     
-    create_table_on_slide(slide, table_data, Inches(0.5), Inches(2.5), primary_color, accent_color)
+    create_program_slide(prs, "✍️ 블로그 / 카페 / 커뮤니티 후기 작성", table_data, primary_color, accent_color,
+                         title_size=28, templates=templates)
+
+DEFAULT_BENEFITS = [
+    ("🎁 무료 체험", "모든 프로그램을\n무료로 체험할 수 있습니다."),
+    ("📜 수료증 발급", "프로그램 완료 시\n공식 수료증을 발급합니다."),
+    ("💰 할인 혜택", "정규 프로그램 등록 시\n최대 50% 할인 혜택"),
+    ("👥 커뮤니티", "체험단 전용 커뮤니티에서\n지속적인 교류")
+]
 
-def create_benefits_slide(prs, primary_color, secondary_color):
+def create_benefits_slide(prs, primary_color, secondary_color, title_text="🎁 체험단 특별 혜택",
+                          description="미교 체험단 참여자만의 특별한 혜택을 만나보세요.",
+                          benefits=DEFAULT_BENEFITS, templates=None):
     """체험단 특별 혜택 슬라이드"""
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
     # 제목
     title = slide.shapes.title
-    title.text = "🎁 체험단 특별 혜택"
+    title.text = title_text
     title_para = title.text_frame.paragraphs[0]
     title_para.font.size = Pt(32)
     title_para.font.color.rgb = primary_color
     
     # 부제목
-    subtitle_box = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(0.5))
-    subtitle_frame = subtitle_box.text_frame
-    subtitle_frame.text = "미교 체험단 참여자만의 특별한 혜택을 만나보세요."
-    subtitle_para = subtitle_frame.paragraphs[0]
-    subtitle_para.alignment = PP_ALIGN.CENTER
-    subtitle_para.font.size = Pt(16)
+    add_styled_textbox(slide, SUBTITLE_STYLE, description, templates)
     
     # 혜택 박스들 (2x2 그리드)
-    benefits = [
-        ("🎁 무료 체험", "모든 프로그램을\n무료로 체험할 수 있습니다."),
-        ("📜 수료증 발급", "프로그램 완료 시\n공식 수료증을 발급합니다."),
-        ("💰 할인 혜택", "정규 프로그램 등록 시\n최대 50% 할인 혜택"),
-        ("👥 커뮤니티", "체험단 전용 커뮤니티에서\n지속적인 교류")
-    ]
-    
     for i, (title_text, desc_text) in enumerate(benefits):
         row = i // 2
         col = i % 2
@@ -280,58 +413,61 @@ def create_benefits_slide(prs, primary_color, secondary_color):
         desc_p.font.size = Pt(14)
         desc_p.alignment = PP_ALIGN.CENTER
 
-def create_application_slide(prs, primary_color, accent_color):
+DEFAULT_FORM_FIELDS = [
+    "이름",
+    "이메일 주소",
+    "연락처",
+    "관심 프로그램 선택",
+    "궁금한 점이나 요청사항"
+]
+
+DEFAULT_APPLY_PERKS = [
+    "전문 강사진과의 1:1 상담",
+    "개인 맞춤형 학습 계획",
+    "24시간 학습 지원 서비스"
+]
+
+def create_application_slide(prs, primary_color, accent_color, title_text="📝 지금 바로 신청하세요!",
+                             description="미교 체험단과 함께 새로운 음원 마케팅의 미래를 경험해보세요.",
+                             form_fields=DEFAULT_FORM_FIELDS, perks=DEFAULT_APPLY_PERKS, templates=None):
     """신청 방법 슬라이드"""
     slide_layout = prs.slide_layouts[5]
     slide = prs.slides.add_slide(slide_layout)
     
     # 제목
     title = slide.shapes.title
-    title.text = "📝 지금 바로 신청하세요!"
+    title.text = title_text
     title_para = title.text_frame.paragraphs[0]
     title_para.font.size = Pt(32)
     title_para.font.color.rgb = primary_color
     
     # 부제목
-    subtitle_box = slide.shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(0.5))
-    subtitle_frame = subtitle_box.text_frame
-    subtitle_frame.text = "미교 체험단과 함께 새로운 음원 마케팅의 미래를 경험해보세요."
-    subtitle_para = subtitle_frame.paragraphs[0]
-    subtitle_para.alignment = PP_ALIGN.CENTER
-    subtitle_para.font.size = Pt(16)
+    add_styled_textbox(slide, SUBTITLE_STYLE, description, templates)
     
     # 신청 폼 필드들
-    form_fields = [
-        "✓ 이름",
-        "✓ 이메일 주소",
-        "✓ 연락처",
-        "✓ 관심 프로그램 선택",
-        "✓ 궁금한 점이나 요청사항"
-    ]
-    
     form_box = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(4), Inches(3))
     form_frame = form_box.text_frame
-    form_frame.text = "신청 양식:\n\n" + "\n".join(form_fields)
+    form_frame.text = "신청 양식:\n\n" + "\n".join(f"✓ {field}" for field in form_fields)
     
     # 혜택 포인트
-    benefits_text = """신청 혜택:
-
-• 전문 강사진과의 1:1 상담
-• 개인 맞춤형 학습 계획
-• 24시간 학습 지원 서비스"""
+    benefits_text = "신청 혜택:\n\n" + "\n".join(f"• {perk}" for perk in perks)
     
     benefits_box = slide.shapes.add_textbox(Inches(5.5), Inches(2.5), Inches(4), Inches(3))
     benefits_frame = benefits_box.text_frame
     benefits_frame.text = benefits_text
 
-def create_table_on_slide(slide, table_data, left, top, primary_color, accent_color):
-    """슬라이드에 테이블 생성"""
+def create_table_on_slide(slide, table_data, left, top, primary_color, accent_color, templates=None):
+    """슬라이드에 테이블 생성 (templates가 있으면 스타일이 적용된 표 XML을 복제해서 텍스트만 채움)"""
+    if templates is not None and not any(_has_control_chars(str(cell)) for row in table_data for cell in row):
+        templates.table(len(table_data[0]), primary_color, accent_color).add_to(slide, table_data, left, top)
+        return
+    
     rows = len(table_data)
     cols = len(table_data[0])
     
     # 테이블 크기 계산
-    table_width = Inches(9)
-    table_height = Inches(3)
+    table_width = TABLE_WIDTH
+    table_height = TABLE_HEIGHT
     
     table = slide.shapes.add_table(rows, cols, left, top, table_width, table_height).table
     
@@ -359,6 +495,124 @@ def create_table_on_slide(slide, table_data, left, top, primary_color, accent_co
                     paragraph.font.color.rgb = accent_color
                     paragraph.font.bold = True
 
+def _has_control_chars(text):
+    """줄바꿈 등 제어 문자가 있으면 python-pptx의 텍스트 처리(문단 분리, 이스케이프)가 필요"""
+    return any(ord(ch) < 32 for ch in text)
+
+def add_styled_textbox(slide, style, text, templates=None):
+    """스타일 사전(SUBTITLE_STYLE 등)대로 텍스트 상자 추가"""
+    if templates is not None and not _has_control_chars(text):
+        templates.textbox(style).add_to(slide, text)
+        return
+    
+    text_box = slide.shapes.add_textbox(*style["position"])
+    text_frame = text_box.text_frame
+    text_frame.text = text
+    para = text_frame.paragraphs[0]
+    
+    # 속성 순서가 XML 속성 순서를 결정하므로 항상 같은 순서로 설정
+    if "alignment" in style:
+        para.alignment = style["alignment"]
+    if "size" in style:
+        para.font.size = style["size"]
+    if "bold" in style:
+        para.font.bold = style["bold"]
+    if "italic" in style:
+        para.font.italic = style["italic"]
+    if "color" in style:
+        para.font.color.rgb = style["color"]
+
+def _set_run_text(p, text):
+    """템플릿 문단의 자리표시 텍스트를 교체 (빈 문자열이면 run 제거)"""
+    r = p.find(qn('a:r'))
+    if text:
+        r.find(qn('a:t')).text = text
+    else:
+        p.remove(r)
+
+def _insert_shape(slide, element, name_prefix):
+    """복제한 도형 XML에 새 id/이름을 붙여 슬라이드 도형 트리에 추가"""
+    shape_id = slide.shapes._next_shape_id
+    c_nv_pr = element.find('.//' + qn('p:cNvPr'))
+    c_nv_pr.set('id', str(shape_id))
+    c_nv_pr.set('name', f"{name_prefix} {shape_id - 1}")
+    slide.shapes._spTree.insert_element_before(element, 'p:extLst')
+
+class TableTemplate:
+    """스타일을 모두 적용한 표를 한 번 만들어 두고, XML을 복제해 텍스트만 채우는 템플릿
+    
+    create_table_on_slide와 같은 XML을 만들지만 셀마다 채우기/글꼴 속성을 설정하지 않습니다.
+    """
+    
+    def __init__(self, cols, primary_color, accent_color):
+        scratch = Presentation()
+        slide = scratch.slides.add_slide(scratch.slide_layouts[6])
+        # 헤더 행과 데이터 행 하나를 자리표시 텍스트로 생성
+        create_table_on_slide(slide, [["X"] * cols, ["X"] * cols], 0, 0, primary_color, accent_color)
+        self.cols = cols
+        self._frame = slide.shapes[-1]._element
+    
+    def add_to(self, slide, table_data, left, top):
+        """슬라이드에 표 복제본 추가"""
+        frame = copy.deepcopy(self._frame)
+        tbl = frame.find('.//' + qn('a:tbl'))
+        header_row, data_row = tbl.findall(qn('a:tr'))
+        
+        rows = len(table_data)
+        if rows == 1:
+            tbl.remove(data_row)
+        for _ in range(rows - 2):
+            data_row.addnext(copy.deepcopy(data_row))
+        
+        # add_table과 같은 방식으로 높이 분배 (마지막 행이 나머지 흡수)
+        row_height = TABLE_HEIGHT // rows
+        for row_idx, (tr, row_data) in enumerate(zip(tbl.findall(qn('a:tr')), table_data)):
+            tr.set('h', str(TABLE_HEIGHT - (rows - 1) * row_height if row_idx == rows - 1 else row_height))
+            for tc, cell_data in zip(tr.findall(qn('a:tc')), row_data):
+                _set_run_text(tc.find(qn('a:txBody')).find(qn('a:p')), str(cell_data))
+        
+        off = frame.find(qn('p:xfrm')).find(qn('a:off'))
+        off.set('x', str(int(left)))
+        off.set('y', str(int(top)))
+        _insert_shape(slide, frame, "Table")
+
+class TextBoxTemplate:
+    """스타일을 적용한 텍스트 상자 XML을 복제해 텍스트만 채우는 템플릿"""
+    
+    def __init__(self, style):
+        scratch = Presentation()
+        slide = scratch.slides.add_slide(scratch.slide_layouts[6])
+        add_styled_textbox(slide, style, "X")
+        self._sp = slide.shapes[-1]._element
+    
+    def add_to(self, slide, text):
+        """슬라이드에 텍스트 상자 복제본 추가"""
+        sp = copy.deepcopy(self._sp)
+        _set_run_text(sp.find(qn('p:txBody')).find(qn('a:p')), text)
+        _insert_shape(slide, sp, "TextBox")
+
+class SlideTemplates:
+    """표/텍스트 상자 템플릿 모음 (스타일별로 처음 한 번만 생성)
+    
+    수백 장짜리 덱에서 속성을 하나씩 설정하는 대신 템플릿을 복제하므로 빌드 시간이 줄어듭니다.
+    """
+    
+    def __init__(self):
+        self._tables = {}
+        self._textboxes = {}
+    
+    def table(self, cols, primary_color, accent_color):
+        key = (cols, str(primary_color), str(accent_color))
+        if key not in self._tables:
+            self._tables[key] = TableTemplate(cols, primary_color, accent_color)
+        return self._tables[key]
+    
+    def textbox(self, style):
+        key = tuple(sorted((name, value) for name, value in style.items()))
+        if key not in self._textboxes:
+            self._textboxes[key] = TextBoxTemplate(style)
+        return self._textboxes[key]
+
 if __name__ == "__main__":
     print("🎬 음원 마케팅 체험단 PPT 생성을 시작합니다...")
     
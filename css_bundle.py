@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+인쇄용 CSS 번들 빌드 (사용하지 않는 규칙 제거 + 인쇄 보정 CSS 병합 + 압축)
+렌더러는 styles.css 전체에 인쇄 보정 CSS(PDF_OPTIMIZED_CSS, PDF_CSS)를 덧붙여 문서마다 파싱합니다.
+이 모듈은 HTML이 링크한 로컬 스타일시트에서 인쇄에 필요 없는 규칙을 걸러낸 뒤 보정 CSS를 붙여
+한 개의 압축된 스타일시트로 만들고, 입력 해시로 캐시합니다.
+
+걸러내는 규칙:
+    - HTML(과 script.js가 추가하는 클래스)에 없는 태그/클래스/id를 요구하는 선택자
+    - :hover, :focus, :active, :visited 선택자 (인쇄에서는 적용되지 않음)
+    - 인쇄 폭(media_width)에서 맞지 않는 @media (max-width/min-width) 블록과 @media screen 블록
+    - 남은 규칙에서 쓰지 않는 @keyframes
+선택자는 구조(자식/형제 관계)까지 따지지 않고 이름만 확인하므로, 남겨도 되는 규칙을 지우지 않습니다.
+
+사용법:
+    python css_bundle.py [index.html] [--media-width 1009] [--output bundle.css]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import threading
+from html.parser import HTMLParser
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 작업 폴더와 관계없이 한 곳에 저장 (서비스 워커 스레드, 다른 폴더에서 실행해도 같은 캐시 사용)
+BUNDLE_CACHE_DIR = os.path.join(_BASE_DIR, ".render_cache_css")
+
+# 번들 규칙(이 파일)이 바뀌면 캐시 키도 바뀌도록 포함
+_SOURCE_FILE = os.path.abspath(__file__)
+
+CSS_PX_PER_MM = 96 / 25.4
+ROOT_FONT_SIZE = 16  # em/rem 미디어 쿼리 환산용 (px)
+
+# 인쇄에서 적용되지 않는 동적 가상 클래스
+_DYNAMIC_PSEUDO = re.compile(r":(?:hover|focus|focus-visible|focus-within|active|visited)\b", re.IGNORECASE)
+_PARENTHESES = re.compile(r"\([^()]*\)")
+_PSEUDO = re.compile(r"::?[\w-]+")
+_ATTRIBUTE = re.compile(r"\[[^\]]*\]")
+_COMBINATORS = re.compile(r"\s*[\s>+~]\s*")
+_ID = re.compile(r"#([\w-]+)")
+_CLASS = re.compile(r"\.([\w-]+)")
+_TAG = re.compile(r"^([a-zA-Z][\w-]*)")
+_MEDIA_FEATURE = re.compile(r"\(\s*(min|max)-width\s*:\s*([\d.]+)(px|em|rem)\s*\)", re.IGNORECASE)
+_ANIMATION = re.compile(r"animation(?:-name)?\s*:([^;}]*)", re.IGNORECASE)
+_KEYFRAMES = re.compile(r"@(?:-webkit-)?keyframes\s+([\w-]+)", re.IGNORECASE)
+
+# script.js가 실행 중에 붙이는 클래스/요소
+_SCRIPT_CLASS_CALL = re.compile(r"classList\.(?:add|toggle|replace)\(([^)]*)\)")
+_SCRIPT_CLASS_NAME = re.compile(r"className\s*=\s*([`'\"])(.*?)\1")
+_SCRIPT_ELEMENT = re.compile(r"createElement\(\s*['\"]([\w-]+)['\"]")
+_STRING_LITERAL = re.compile(r"([`'\"])(.*?)\1")
+
+# 압축할 때 문자열/url()을 대신하는 자리표시자
+_PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+_IDENTIFIER_CHAR = re.compile(r"[\w-]")
+
+# 컴파일한 번들 메모리 캐시 {키: CSS} (프로세스 전체에서 공유)
+_memo = {}
+_memo_lock = threading.Lock()
+_MEMO_LIMIT = 32
+
+def css_px(mm):
+    """mm를 CSS px로 환산 (인쇄 폭 계산용)"""
+    return round(mm * CSS_PX_PER_MM)
+
+class DocumentNames:
+    """문서에 나오는 태그/클래스/id 이름 모음 (선택자가 쓸모 있는지 판단용)"""
+
+    def __init__(self):
+        self.tags = {"html", "body", "head"}
+        self.classes = set()
+        self.ids = set()
+        self.class_prefixes = set()  # `notification-${type}`처럼 이름 일부만 알 수 있는 클래스
+        self.stylesheets = []  # 로컬 스타일시트 href (문서 순서)
+        self.scripts = []  # 로컬 스크립트 src
+
+    def add_classes(self, text):
+        for name in text.split():
+            if "${" in name:
+                prefix = name.split("${")[0]
+                if prefix:
+                    self.class_prefixes.add(prefix)
+            else:
+                self.classes.add(name)
+
+    def add_script(self, script_text):
+        """스크립트가 붙이는 클래스와 만드는 요소 추가"""
+
+        for call in _SCRIPT_CLASS_CALL.findall(script_text):
+            for _, literal in _STRING_LITERAL.findall(call):
+                self.add_classes(literal)
+        for _, literal in _SCRIPT_CLASS_NAME.findall(script_text):
+            self.add_classes(literal)
+        self.tags.update(tag.lower() for tag in _SCRIPT_ELEMENT.findall(script_text))
+
+    def has_class(self, name):
+        return name in self.classes or any(name.startswith(prefix) for prefix in self.class_prefixes)
+
+    def selector_used(self, selector):
+        """선택자가 문서에 적용될 수 있는지 (이름만 확인, 구조는 따지지 않음)"""
+
+        if _DYNAMIC_PSEUDO.search(selector):
+            return False
+
+        # :not(...), :nth-child(...) 등 괄호 안과 가상 클래스/속성 조건은 무시
+        simplified = selector
+        while True:
+            reduced = _PARENTHESES.sub("", simplified)
+            if reduced == simplified:
+                break
+            simplified = reduced
+        simplified = _ATTRIBUTE.sub("", _PSEUDO.sub("", simplified))
+
+        for compound in _COMBINATORS.split(simplified.strip()):
+            tag = _TAG.match(compound)
+            if tag and tag.group(1).lower() not in self.tags:
+                return False
+            if any(name not in self.ids for name in _ID.findall(compound)):
+                return False
+            if any(not self.has_class(name) for name in _CLASS.findall(compound)):
+                return False
+        return True
+
+class _NameCollector(HTMLParser):
+    def __init__(self, names):
+        super().__init__(convert_charrefs=True)
+        self.names = names
+
+    def handle_starttag(self, tag, attrs):
+        from render_cache import is_local_reference
+
+        names = self.names
+        attrs = dict(attrs)
+        names.tags.add(tag)
+        if attrs.get("class"):
+            names.add_classes(attrs["class"])
+        if attrs.get("id"):
+            names.ids.add(attrs["id"])
+
+        if tag == "link" and "stylesheet" in (attrs.get("rel") or "").lower().split():
+            media = (attrs.get("media") or "all").lower()
+            href = attrs.get("href") or ""
+            if is_local_reference(href) and ("all" in media or "print" in media):
+                names.stylesheets.append(href.split('#')[0].split('?')[0])
+        elif tag == "script" and attrs.get("src") and is_local_reference(attrs["src"]):
+            names.scripts.append(attrs["src"].split('#')[0].split('?')[0])
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+def collect_names(html_text):
+    """HTML의 태그/클래스/id와 로컬 스타일시트/스크립트 목록"""
+
+    names = DocumentNames()
+    collector = _NameCollector(names)
+    collector.feed(html_text)
+    collector.close()
+    return names
+
+# CSS 분해
+
+def _skip_string(css, index):
+    quote = css[index]
+    index += 1
+    while index < len(css) and css[index] != quote:
+        index += 2 if css[index] == "\\" else 1
+    return index + 1
+
+def split_rules(css):
+    """최상위 규칙 목록 [(prelude, body)] (body는 중괄호 안 텍스트, @import 같은 문장 규칙은 None)
+
+    주석을 제거하고 문자열/괄호 안의 중괄호와 세미콜론은 구분자로 보지 않습니다.
+    """
+
+    rules = []
+    start = 0
+    depth = 0
+    body_start = None
+    prelude = None
+    index = 0
+    length = len(css)
+    parts = []  # 주석을 뺀 현재 구간
+
+    while index < length:
+        char = css[index]
+        if char == "/" and css.startswith("/*", index):
+            end = css.find("*/", index + 2)
+            end = length if end < 0 else end + 2
+            parts.append(css[start:index])
+            index = start = end
+            continue
+        if char in "\"'":
+            index = _skip_string(css, index)
+            continue
+        if char == "{":
+            if depth == 0:
+                parts.append(css[start:index])
+                prelude = "".join(parts).strip()
+                parts = []
+                start = body_start = index + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                parts.append(css[start:index])
+                rules.append((prelude, "".join(parts)))
+                parts = []
+                start = index + 1
+                body_start = None
+            depth = max(depth, 0)
+        elif char == ";" and depth == 0:
+            parts.append(css[start:index])
+            statement = "".join(parts).strip()
+            if statement:
+                rules.append((statement, None))
+            parts = []
+            start = index + 1
+        index += 1
+
+    parts.append(css[start:])
+    rest = "".join(parts).strip()
+    if rest and body_start is None:
+        rules.append((rest, None))
+    return rules
+
+def _split_top_level(text, separator):
+    """문자열/괄호 밖의 separator로 나눔"""
+
+    items = []
+    depth = 0
+    start = 0
+    index = 0
+    while index < len(text):
+        char = text[index]
+        if char in "\"'":
+            index = _skip_string(text, index)
+            continue
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            items.append(text[start:index])
+            start = index + 1
+        index += 1
+    items.append(text[start:])
+    return items
+
+def media_may_match(query, media_width=None):
+    """인쇄(print) 매체, 폭 media_width(px)에서 @media 조건이 맞을 수 있는지 (모르는 조건은 맞는 것으로 봄)"""
+
+    for part in _split_top_level(query, ","):
+        words = _PARENTHESES.sub(" ", part).strip().lower().split()
+        if words and words[0] == "not":
+            return True
+        media_type = next((word for word in words if word not in ("only", "and")), "all")
+        if media_type not in ("all", "print"):
+            continue
+        if media_width is None:
+            return True
+        matches = True
+        for bound, value, unit in _MEDIA_FEATURE.findall(part):
+            limit = float(value) * (1 if unit.lower() == "px" else ROOT_FONT_SIZE)
+            if (bound.lower() == "max" and media_width > limit) or (bound.lower() == "min" and media_width < limit):
+                matches = False
+        if matches:
+            return True
+    return False
+
+# 걸러내기 / 압축
+
+def _protect_literals(text):
+    """문자열과 따옴표 없는 url(...)을 자리표시자로 바꿔 (텍스트, 원본 목록) 반환 (압축에서 제외)"""
+
+    literals = []
+    parts = []
+    start = 0
+    index = 0
+    while index < len(text):
+        char = text[index]
+        if char in "\"'":
+            end = _skip_string(text, index)
+        elif (text[index:index + 4].lower() == "url(" and (index == 0 or not _IDENTIFIER_CHAR.match(text[index - 1]))
+                and not text[index + 4:].lstrip().startswith(("'", '"'))):
+            end = text.find(")", index)
+            end = len(text) if end < 0 else end + 1
+        else:
+            index += 1
+            continue
+        parts.append(text[start:index])
+        parts.append(f"\x00{len(literals)}\x00")
+        literals.append(text[index:end])
+        index = start = end
+    parts.append(text[start:])
+    return "".join(parts), literals
+
+def _restore_literals(text, literals):
+    return _PLACEHOLDER.sub(lambda match: literals[int(match.group(1))], text)
+
+def _minify_selector(selector):
+    selector, literals = _protect_literals(selector)
+    selector = " ".join(selector.split())
+    return _restore_literals(re.sub(r"\s*([>+~,])\s*", r"\1", selector), literals)
+
+def _minify_declarations(body):
+    declarations = []
+    for declaration in _split_top_level(body, ";"):
+        name, colon, value = declaration.partition(":")
+        if not colon:
+            continue
+        value, literals = _protect_literals(value)
+        value = " ".join(value.split())
+        value = re.sub(r"\s*,\s*", ",", value)
+        value = re.sub(r"\s*!\s*important", "!important", value)
+        declarations.append(f"{name.strip()}:{_restore_literals(value, literals)}")
+    return ";".join(declarations)
+
+def shake(css, names, media_width=None):
+    """쓰지 않는 규칙을 걸러 압축한 CSS 반환 (@keyframes 정리는 bundle 단계에서)
+
+    names가 None이면 선택자는 거르지 않고 @media 조건 평가와 압축만 합니다.
+    """
+
+    output = []
+    for prelude, body in split_rules(css):
+        if body is None:
+            output.append(" ".join(prelude.split()) + ";")
+            continue
+
+        if prelude.startswith("@"):
+            keyword = prelude.split(None, 1)[0].lower()
+            if keyword == "@media":
+                if not media_may_match(prelude[6:], media_width):
+                    continue
+                inner = shake(body, names, media_width)
+                if inner:
+                    output.append(f"@media {' '.join(prelude[6:].split())}{{{inner}}}")
+            elif keyword in ("@supports", "@layer", "@document"):
+                inner = shake(body, names, media_width)
+                if inner:
+                    output.append(f"{' '.join(prelude.split())}{{{inner}}}")
+            elif keyword.endswith("keyframes"):
+                steps = "".join(f"{_minify_selector(step)}{{{_minify_declarations(step_body)}}}"
+                                for step, step_body in split_rules(body) if step_body is not None)
+                output.append(f"{' '.join(prelude.split())}{{{steps}}}")
+            else:
+                # @font-face, @page 등은 그대로 유지
+                output.append(f"{' '.join(prelude.split())}{{{_minify_declarations(body)}}}")
+            continue
+
+        selectors = [selector.strip() for selector in _split_top_level(prelude, ",")]
+        used = [selector for selector in selectors if selector and (names is None or names.selector_used(selector))]
+        declarations = _minify_declarations(body)
+        if used and declarations:
+            output.append(f"{_minify_selector(','.join(used))}{{{declarations}}}")
+    return "".join(output)
+
+def _drop_unused_keyframes(css):
+    """남은 규칙이 참조하지 않는 @keyframes 제거"""
+
+    used = set()
+    for value in _ANIMATION.findall(css):
+        used.update(re.findall(r"[\w-]+", value))
+
+    output = []
+    for prelude, body in split_rules(css):
+        match = _KEYFRAMES.match(prelude)
+        if body is None:
+            output.append(prelude + ";")
+        elif match and match.group(1) not in used:
+            continue
+        else:
+            output.append(f"{prelude}{{{body}}}")
+    return "".join(output)
+
+def compile_bundle(html_text, stylesheets, overrides="", media_width=None, scripts=()):
+    """스타일시트 텍스트 목록을 HTML 기준으로 걸러내고 보정 CSS를 붙여 압축한 번들 반환
+
+    stylesheets: HTML이 링크한 순서대로의 CSS 텍스트
+    overrides: 뒤에 붙일 인쇄 보정 CSS (걸러내지 않고 압축만 함)
+    media_width: 인쇄 폭(px), None이면 폭 조건으로 @media를 거르지 않음
+    scripts: 실행 중에 클래스를 붙이는 스크립트 텍스트 (script.js 등)
+    """
+
+    names = collect_names(html_text)
+    for script_text in scripts:
+        names.add_script(script_text)
+
+    shaken = "".join(shake(css, names, media_width) for css in stylesheets)
+    # 보정 CSS는 렌더러가 원래 주입하던 그대로 모두 적용 (@media 조건만 인쇄 기준으로 평가)
+    merged = shaken + shake(overrides, None, media_width)
+
+    # @import는 맨 앞에 있어야 함
+    rules = split_rules(_drop_unused_keyframes(merged))
+    imports = [prelude + ";" for prelude, body in rules if body is None and prelude.lower().startswith("@import")]
+    others = [prelude + ";" if body is None else f"{prelude}{{{body}}}"
+              for prelude, body in rules if not (body is None and prelude.lower().startswith("@import"))]
+    return "".join(imports + others)
+
+def _read_text(path):
+    from asset_resolver import read_cached
+
+    data = read_cached(path)
+    return data.decode('utf-8-sig') if data is not None else None
+
+def bundle_for_html(html_file, overrides="", media_width=None, html_content=None, cache_dir=BUNDLE_CACHE_DIR):
+    """HTML 파일의 인쇄용 CSS 번들과 번들로 대체되는 로컬 스타일시트 경로 목록 반환
+
+    입력(HTML, 스타일시트, 스크립트, 보정 CSS, 인쇄 폭, 이 모듈 소스)의 해시로
+    메모리와 cache_dir(render_cache.RenderCache)에 캐시합니다. cache_dir가 None이면 디스크 캐시를 쓰지 않습니다.
+    html_content: 이미 읽어 둔 HTML 문자열 (주어지면 파일을 다시 읽지 않음)
+    """
+
+    base_dir = os.path.dirname(os.path.abspath(html_file))
+    if html_content is None:
+        html_content = _read_text(os.path.abspath(html_file))
+        if html_content is None:
+            raise FileNotFoundError(f"{html_file} 파일을 찾을 수 없습니다.")
+
+    names = collect_names(html_content)
+    stylesheet_paths = [os.path.normpath(os.path.join(base_dir, href)) for href in names.stylesheets]
+    stylesheet_paths = [path for path in stylesheet_paths if os.path.isfile(path)]
+    stylesheets = [_read_text(path) for path in stylesheet_paths]
+    scripts = [text for text in (_read_text(os.path.normpath(os.path.join(base_dir, src))) for src in names.scripts)
+               if text is not None]
+
+    digest = hashlib.sha256()
+    for part in [_read_text(_SOURCE_FILE) or "", repr(media_width), overrides, html_content, *stylesheets, "\0", *scripts]:
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    key = digest.hexdigest()
+
+    with _memo_lock:
+        css = _memo.get(key)
+    if css is None:
+        cache = None
+        if cache_dir is not None:
+            from render_cache import RenderCache
+            cache = RenderCache(cache_dir)
+            data = cache.read(key, ".css")
+            css = data.decode('utf-8') if data is not None else None
+        if css is None:
+            css = compile_bundle(html_content, stylesheets, overrides, media_width, scripts)
+            if cache is not None:
+                cache.write(key, ".css", css.encode('utf-8'))
+        with _memo_lock:
+            if len(_memo) >= _MEMO_LIMIT:
+                _memo.clear()
+            _memo[key] = css
+
+    return css, stylesheet_paths
+
+def install_bundle(resolver, html_file, overrides="", media_width=None, html_content=None):
+    """resolver(asset_resolver.AssetResolver)가 로컬 스타일시트 대신 번들을 제공하도록 등록하고 번들 크기 반환
+
+    첫 번째 스타일시트 주소에서 번들 전체를, 나머지 스타일시트 주소에서는 빈 CSS를 제공합니다.
+    """
+
+    css, stylesheet_paths = bundle_for_html(html_file, overrides, media_width, html_content)
+    for index, path in enumerate(stylesheet_paths):
+        resolver.add(os.path.relpath(path, resolver.base_dir), "text/css; charset=utf-8", css if index == 0 else "")
+    return len(css.encode('utf-8'))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTML에서 쓰는 규칙만 남긴 인쇄용 CSS 번들을 만듭니다.")
+    parser.add_argument("input", nargs="?", default="index.html", help="입력 HTML (기본 index.html)")
+    parser.add_argument("--profile", choices=("landscape", "weasyprint", "none"), default="landscape",
+                        help="병합할 인쇄 보정 CSS와 인쇄 폭 (기본 landscape)")
+    parser.add_argument("--media-width", type=int, help="인쇄 폭(px) 직접 지정")
+    parser.add_argument("-o", "--output", help="번들을 저장할 파일 (지정하지 않으면 크기만 출력)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        print(f"❌ {args.input} 파일을 찾을 수 없습니다.")
+        return 2
+
+    overrides, media_width = "", None
+    if args.profile == "landscape":
+        from landscape_pdf import BUNDLE_MEDIA_WIDTH_MM, PDF_OPTIMIZED_CSS
+        overrides, media_width = PDF_OPTIMIZED_CSS, css_px(BUNDLE_MEDIA_WIDTH_MM)
+    elif args.profile == "weasyprint":
+        from create_pdf import BUNDLE_MEDIA_WIDTH_MM, PDF_CSS
+        overrides, media_width = PDF_CSS, css_px(BUNDLE_MEDIA_WIDTH_MM)
+    if args.media_width is not None:
+        media_width = args.media_width
+
+    css, stylesheet_paths = bundle_for_html(args.input, overrides, media_width)
+    original = sum(len((_read_text(path) or "").encode('utf-8')) for path in stylesheet_paths)
+    original += len(overrides.encode('utf-8'))
+    bundled = len(css.encode('utf-8'))
+    print(f"📦 {', '.join(os.path.basename(path) for path in stylesheet_paths) or '(스타일시트 없음)'} + 보정 CSS: "
+          f"{original:,} → {bundled:,} bytes ({bundled / original:.0%})" if original else f"📦 {bundled:,} bytes")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(css)
+        print(f"📁 번들 파일: {os.path.abspath(args.output)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+index.html에서 캠페인 데이터를 뽑아 PPT를 만드는 추출기
+HTML을 스트리밍 파서(html.parser)로 한 번만 읽으면서 카탈로그와 같은 형식(catalog.json 참고)의
+캠페인 사전을 만들고, 그 사전으로 catalog.build_presentation을 호출해 슬라이드를 생성합니다.
+create_ppt.py에 손으로 옮겨 적은 내용 대신 웹페이지 자체가 PPT의 원본이 됩니다.
+
+- 파일을 일정 크기씩 읽어 파서에 넣으므로 DOM 트리를 만들지 않고, 열린 요소 스택과 결과 데이터만 메모리에 남음
+- 표 행이 수천 개여도 행마다 고정된 작업만 하므로 입력 크기에 비례하는 시간에 처리
+- HTML에 없는 정보(이모지, 강조 색, 제목 글꼴 크기)는 아이콘 클래스 대응표와 기본값으로 채움
+
+추출하는 구조 (catalog.render_html이 만드는 HTML도 같은 구조):
+    .nav-logo h2                      캠페인 제목
+    section.hero                      .hero-title, .highlight, .hero-description, .btn-primary 링크, .floating-card
+    section.process                   .section-header, .step-item (h3: 단계, p: 담당)
+    section.programs                  .program-category (.category-title, .table-header, .table-row, .table-note)
+    section.benefits                  .section-header, .benefit-item
+    section#apply / .apply            .hero-title 또는 .apply-text, .apply-benefits li, 입력란 placeholder
+
+사용법:
+    python html_extract.py [index.html] [-o 음원_마케팅_체험단.pptx] [--json campaign.json] [--workers 4]
+"""
+
+import argparse
+import json
+import os
+import sys
+from html.parser import HTMLParser
+
+# 파서에 한 번에 넣는 크기
+CHUNK_SIZE = 64 * 1024
+
+# 닫는 태그가 없는 요소 (스택에 넣지 않음)
+VOID_ELEMENTS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+))
+
+# 아이콘 클래스 -> PPT 제목에 붙일 이모지
+ICON_EMOJI = {
+    "fab fa-instagram": "📱",
+    "fab fa-tiktok": "🎬",
+    "fas fa-cloud-download-alt": "🎵",
+    "fas fa-music": "🎵",
+    "fas fa-edit": "✍️",
+    "fas fa-gift": "🎁",
+    "fas fa-certificate": "📜",
+    "fas fa-percent": "💰",
+    "fas fa-users": "👥",
+}
+
+def _text(parts):
+    """모은 텍스트 조각을 줄(<br>) 단위로 공백 정리"""
+
+    return "\n".join(" ".join(line.split()) for line in "".join(parts).split("\n")).strip()
+
+def _with_icon(item, icon):
+    if icon:
+        item["icon"] = icon
+        if icon in ICON_EMOJI:
+            item["emoji"] = ICON_EMOJI[icon]
+    return item
+
+class CampaignParser(HTMLParser):
+    """HTML을 feed()로 조금씩 받아 캠페인 사전(self.campaign)을 채우는 파서
+
+    요소를 열 때 위치(섹션, 부모 역할)와 클래스로 역할을 정하고, 닫을 때 모은 텍스트를 캠페인 사전에 기록합니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.campaign = {}
+        self._stack = []  # [(태그, 역할)]
+        self._captures = []  # [텍스트 조각 목록] (가장 안쪽 필드가 마지막)
+        self._section = None  # 현재 섹션 종류
+        self._item = None  # 현재 단계/프로그램/혜택/카드 사전
+        self._row = None  # 현재 표 행 (셀 목록)
+        self._document_title = None
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self._end(*self._stack.pop())
+        if "title" not in self.campaign and self._document_title:
+            self.campaign["title"] = self._document_title
+        self.campaign.setdefault("subtitle", self.campaign.get("hero", {}).get("description", ""))
+
+    # 섹션
+
+    def _section_kind(self, classes, attrs):
+        if "process" in classes:
+            return "process"
+        if "programs" in classes:
+            return "programs"
+        if "benefits" in classes:
+            return "benefits"
+        if attrs.get("id") == "apply" or "apply" in classes or "apply-section" in classes:
+            return "apply"
+        if "hero" in classes:
+            return "hero"
+        return None
+
+    @property
+    def _target(self):
+        """현재 섹션의 결과 사전"""
+
+        if self._section == "hero":
+            return self.campaign.setdefault("hero", {})
+        if self._section in ("process", "benefits", "apply"):
+            return self.campaign.setdefault(self._section, {})
+        return {}
+
+    # 역할 결정
+
+    def _role(self, tag, classes, attrs):
+        parent = self._stack[-1][1] if self._stack else None
+        section = self._section
+
+        if tag == "section":
+            return "section"
+        if tag == "title":
+            return "document_title"
+        if tag == "h2" and parent == "nav_logo":
+            return "site_title"
+        if "nav-logo" in classes:
+            return "nav_logo"
+        if section is None:
+            return None
+
+        if tag == "a" and "btn-primary" in classes and section in ("hero", "apply"):
+            self.campaign.setdefault("hero", {}).setdefault("apply_url", attrs.get("href") or "#apply")
+            return None
+        if tag == "input" and section == "apply" and attrs.get("placeholder"):
+            self._target.setdefault("form_fields", []).append(attrs["placeholder"])
+            return None
+        if tag == "i" and parent in ("card", "program_title", "benefit_icon") and self._item is not None:
+            self._item["_icon"] = " ".join(classes)
+            return None
+
+        if "section-header" in classes or "apply-text" in classes:
+            return "section_header"
+        if parent == "section_header":
+            if tag in ("h2", "h1"):
+                return "header_title"
+            if tag == "p":
+                return "header_description"
+        if "hero-title" in classes:
+            return "hero_title"
+        if "highlight" in classes and parent == "hero_title":
+            return "highlight"
+        if "hero-description" in classes:
+            return "description"
+        if "floating-card" in classes:
+            return "card"
+        if tag == "span" and parent == "card":
+            return "card_label"
+
+        if "step-item" in classes:
+            return "step"
+        if parent == "step" and tag == "h3":
+            return "step_title"
+        if parent == "step" and tag == "p":
+            return "step_actor"
+
+        if "program-category" in classes:
+            return "program"
+        if "category-title" in classes:
+            return "program_title"
+        if "table-header" in classes:
+            return "header_row"
+        if "table-row" in classes:
+            return "row"
+        if parent in ("header_row", "row") and tag == "div":
+            return "cell"
+        if "table-note" in classes:
+            return "note"
+
+        if "benefit-item" in classes:
+            return "benefit"
+        if "benefit-icon" in classes:
+            return "benefit_icon"
+        if parent == "benefit" and tag == "h3":
+            return "benefit_title"
+        if parent == "benefit" and tag == "p":
+            return "benefit_description"
+
+        if tag == "li" and section == "apply":
+            return "perk"
+        return None
+
+    # 파서 콜백
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "br":
+            if self._captures:
+                self._captures[-1].append("\n")
+            return
+
+        classes = (attrs.get("class") or "").split()
+        role = self._role(tag, classes, attrs)
+        if tag in VOID_ELEMENTS:
+            return
+
+        self._begin(role, classes, attrs)
+        self._stack.append((tag, role))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        # 닫히지 않은 요소(<p>, <li> 등)는 바깥 요소가 닫힐 때 함께 닫음
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        while self._stack:
+            open_tag, role = self._stack.pop()
+            self._end(open_tag, role)
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._captures:
+            self._captures[-1].append(data)
+
+    # 역할별 처리
+
+    _CAPTURED = frozenset((
+        "document_title", "site_title", "header_title", "header_description", "hero_title", "highlight",
+        "description", "card_label", "step_title", "step_actor", "program_title", "cell", "note",
+        "benefit_title", "benefit_description", "perk",
+    ))
+
+    def _begin(self, role, classes, attrs):
+        if role == "section":
+            self._section = self._section_kind(classes, attrs)
+            if self._section == "hero" and "hero" in self.campaign:
+                # 히어로 모양의 두 번째 섹션은 무시 (신청 섹션은 id/클래스로 구분)
+                self._section = "ignored"
+        elif role in ("step", "program", "benefit", "card"):
+            self._item = {"headers": [], "rows": []} if role == "program" else {}
+        elif role in ("header_row", "row"):
+            self._row = []
+        elif role in self._CAPTURED:
+            self._captures.append([])
+
+    def _end(self, tag, role):
+        if role is None:
+            return
+        if role in self._CAPTURED:
+            self._field(role, _text(self._captures.pop()))
+        elif role == "section":
+            self._section = None
+        elif role in ("header_row", "row") and self._item is not None and self._row is not None:
+            if role == "header_row":
+                self._item["headers"] = self._row
+            else:
+                self._item["rows"].append(self._row)
+            self._row = None
+        elif role in ("step", "program", "benefit", "card") and self._item is not None:
+            self._finish_item(role, self._item)
+            self._item = None
+
+    def _field(self, role, text):
+        item = self._item
+        target = self._target
+
+        if role == "document_title":
+            self._document_title = text
+        elif role == "site_title":
+            self.campaign.setdefault("title", text)
+        elif role == "header_title" and self._section != "programs":
+            target["title"] = text
+        elif role == "header_description" and self._section != "programs":
+            target["description"] = text
+        elif role == "hero_title":
+            # 강조 문구는 highlight로 따로 모으므로 남은 텍스트가 제목
+            target["title"] = text
+        elif role == "highlight":
+            target["highlight"] = text
+        elif role == "description":
+            target["description"] = text
+        elif item is not None and role in ("card_label", "step_title", "program_title", "benefit_title"):
+            item["label" if role == "card_label" else "title"] = text
+        elif item is not None and role == "step_actor":
+            item["actor"] = text
+        elif item is not None and role == "benefit_description":
+            item["description"] = text
+        elif item is not None and role == "note" and text:
+            item["note"] = text
+        elif role == "cell" and self._row is not None:
+            self._row.append(text)
+        elif role == "perk" and text:
+            target.setdefault("perks", []).append(text)
+
+    def _finish_item(self, role, item):
+        icon = item.pop("_icon", None)
+        target = self._target
+
+        if role == "step":
+            target.setdefault("steps", []).append({"title": item.get("title", ""), "actor": item.get("actor", "")})
+        elif role == "program":
+            program = _with_icon({"title": item.get("title", "")}, icon)
+            program["headers"] = item["headers"]
+            program["rows"] = item["rows"]
+            if "note" in item:
+                program["note"] = item["note"]
+            self.campaign.setdefault("programs", []).append(program)
+        elif role == "benefit":
+            target.setdefault("items", []).append(_with_icon(item, icon))
+        elif role == "card" and item.get("label"):
+            if self._section == "apply":
+                # 신청 섹션의 카드는 신청 혜택으로 사용
+                target.setdefault("perks", []).append(item["label"])
+            else:
+                # 채널 카드의 아이콘은 채널과 무관한 장식이므로 이모지로 바꾸지 않음
+                if icon:
+                    item["icon"] = icon
+                target.setdefault("channels", []).append(item)
+
+def extract_campaign(source, campaign_id=None, chunk_size=CHUNK_SIZE):
+    """HTML 파일(경로 또는 텍스트 스트림)에서 카탈로그 형식의 캠페인 사전 추출
+
+    campaign_id: 캠페인 id (없으면 파일 이름)
+    """
+
+    parser = CampaignParser()
+    if isinstance(source, (str, os.PathLike)):
+        campaign_id = campaign_id or os.path.splitext(os.path.basename(source))[0]
+        with open(source, 'r', encoding='utf-8') as f:
+            _feed(parser, f, chunk_size)
+    else:
+        _feed(parser, source, chunk_size)
+    parser.close()
+
+    campaign = {"id": campaign_id or "campaign"}
+    campaign.update(parser.campaign)
+    return campaign
+
+def _feed(parser, stream, chunk_size):
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        parser.feed(chunk)
+
+def build_presentation_from_html(source, use_templates=True, workers=1):
+    """HTML을 한 번 파싱해 (캠페인 사전, Presentation) 반환"""
+
+    from catalog import build_presentation
+
+    campaign = extract_campaign(source)
+    return campaign, build_presentation(campaign, use_templates=use_templates, workers=workers)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="index.html 내용을 읽어 PPT를 생성합니다.")
+    parser.add_argument("input", nargs="?", default="index.html", help="입력 HTML (기본 index.html)")
+    parser.add_argument("-o", "--output", default="음원_마케팅_체험단.pptx", help="결과 PPT 파일")
+    parser.add_argument("--json", help="추출한 캠페인 데이터를 저장할 JSON 파일 (catalog.json 형식)")
+    parser.add_argument("--id", help="캠페인 id (기본: 파일 이름)")
+    parser.add_argument("--workers", type=int, default=1, help="슬라이드를 나눠 만들 프로세스 수 (기본 1)")
+    parser.add_argument("--no-pptx", action="store_true", help="PPT를 만들지 않고 데이터만 추출")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        print(f"❌ {args.input} 파일을 찾을 수 없습니다.")
+        return 2
+
+    campaign = extract_campaign(args.input, campaign_id=args.id)
+    rows = sum(len(program["rows"]) for program in campaign.get("programs", []))
+    print(f"🔍 {args.input}: 프로그램 {len(campaign.get('programs', []))}개, 표 행 {rows}개, "
+          f"진행 단계 {len(campaign.get('process', {}).get('steps', []))}개")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"campaigns": [campaign]}, f, ensure_ascii=False, indent=2)
+        print(f"📁 캠페인 데이터: {os.path.abspath(args.json)}")
+
+    if not args.no_pptx:
+        try:
+            from catalog import build_presentation
+            from create_ppt import save_presentation
+        except ImportError:
+            print("❌ 오류: python-pptx 라이브러리가 설치되지 않았습니다.")
+            print("💡 다음 명령어를 실행해주세요: pip install python-pptx")
+            return 1
+
+        prs = build_presentation(campaign, workers=args.workers)
+        save_presentation(prs, args.output)
+        print(f"✅ PPT 파일이 생성되었습니다: {args.output} ({len(prs.slides)}장)")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
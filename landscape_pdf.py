@@ -2,378 +2,724 @@
 # -*- coding: utf-8 -*-
 """
 가로형 페이지 HTML to PDF 변환 스크립트 (섹션별 페이지 분할)
+
+섹션 모드(--sections)에서는 섹션마다 따로 PDF를 만들어 섹션 DOM과 그 섹션에 적용되는 CSS의
+해시로 캐시해 두고, 바뀐 섹션만 다시 렌더링한 뒤 합쳐서 페이지 번호를 붙입니다.
+
+--bundle-css를 지정하면 styles.css 전체와 PDF_OPTIMIZED_CSS를 따로 적용하는 대신
+인쇄에 필요한 규칙만 남겨 합친 번들(css_bundle)을 styles.css 주소에서 제공합니다.
+
+사용법:
+    python landscape_pdf.py [--sections] [--cache-dir .render_cache_sections] [--offline] [--bundle-css]
 """
 
+import argparse
+import hashlib
+import io
+import json
 import os
-from playwright.sync_api import sync_playwright
+import sys
 
-def create_landscape_pdf():
-    """HTML 웹페이지를 가로형 PDF로 변환 (섹션별 페이지 분할)"""
-    
-    print("🎬 가로형 PDF 변환을 시작합니다...")
-    
-    # HTML 파일 확인
-    html_file = "index.html"
-    if not os.path.exists(html_file):
-        print(f"❌ {html_file} 파일을 찾을 수 없습니다.")
-        return False
+from asset_resolver import AssetResolver, prepare_page
+from browser_pool import BrowserPool
+from render_output import deliver, is_stream
+from render_ready import DEFAULT_TIMEOUT_MS, PRINT_MODE_SCRIPT, deadline_after, time_left_ms, wait_for_render_ready
+from render_trace import get_tracer
+
+# PDF 가로형 최적화 CSS (문서 로드 시 <head>에 삽입)
+PDF_OPTIMIZED_CSS = """
+/* PDF 가로형 페이지 최적화 CSS */
+@page {
+    size: A4 landscape;
+    margin: 10mm 15mm 15mm 15mm; /* 상단 여백 줄임 */
+}
+
+/* 페이지 분할 설정 */
+.hero {
+    page-break-after: always;
+    min-height: 95vh; /* 높이 줄임 */
+    display: flex;
+    align-items: center;
+    padding: 20px 0; /* 패딩 추가 */
+}
+
+.process {
+    page-break-before: always;
+    page-break-after: always;
+    min-height: 95vh; /* 높이 줄임 */
+    padding: 20px 0; /* 패딩 줄임 */
+}
+
+.programs {
+    page-break-before: always;
+    page-break-after: always;
+    min-height: 95vh; /* 높이 줄임 */
+    padding: 20px 0; /* 패딩 줄임 */
+}
+
+.benefits {
+    page-break-before: always;
+    page-break-after: always;
+    min-height: 95vh; /* 높이 줄임 */
+    padding: 20px 0; /* 패딩 줄임 */
+}
+
+.apply {
+    page-break-before: always;
+    page-break-after: always;
+    min-height: 95vh; /* 높이 줄임 */
+    padding: 20px 0; /* 패딩 줄임 */
+}
+
+.footer {
+    page-break-before: always;
+    min-height: 40vh; /* 높이 줄임 */
+    padding: 20px 0; /* 패딩 줄임 */
+}
+
+/* 가로형에 맞는 레이아웃 조정 */
+body {
+    font-size: 14px;
+    line-height: 1.4; /* 줄간격 줄임 */
+}
+
+.container {
+    max-width: 100%;
+    padding: 0 20px;
+}
+
+/* 섹션 제목 크기 및 여백 조정 */
+.section-header h2, h2 {
+    font-size: 2rem !important; /* 제목 크기 줄임 */
+    margin: 10px 0 20px 0 !important; /* 상단 여백 줄임 */
+    line-height: 1.2 !important;
+}
+
+.section-header p {
+    margin: 0 0 20px 0 !important; /* 여백 조정 */
+}
+
+/* 히어로 섹션 가로형 최적화 */
+.hero-container {
+    display: flex;
+    align-items: center;
+    gap: 30px; /* 간격 줄임 */
+    height: 100%;
+    max-height: 85vh; /* 최대 높이 제한 */
+}
+
+.hero-content {
+    flex: 1;
+}
+
+.hero-title {
+    font-size: 2.5rem !important; /* 크기 줄임 */
+    margin-bottom: 15px !important; /* 여백 줄임 */
+    line-height: 1.2 !important;
+}
+
+.hero-buttons {
+    margin-top: 20px !important; /* 여백 줄임 */
+}
+
+/* 플로팅 카드 크기 및 위치 조정 */
+.hero-image {
+    flex: 0 0 400px; /* 고정 너비로 설정 */
+    height: 300px; /* 높이 제한 */
+    position: relative;
+}
+
+.hero-graphic {
+    width: 100%;
+    height: 100%;
+    position: relative;
+}
+
+.floating-card {
+    position: absolute !important;
+    width: 120px !important; /* 크기 줄임 */
+    height: 60px !important; /* 높이 줄임 */
+    display: flex !important;
+    align-items: center;
+    justify-content: center;
+    background: rgba(255, 255, 255, 0.9);
+    border-radius: 12px;
+    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
+    font-size: 12px !important; /* 폰트 크기 줄임 */
+    font-weight: 500;
+}
+
+.floating-card.card-1 {
+    top: 20px;
+    left: 20px;
+}
+
+.floating-card.card-2 {
+    top: 80px;
+    right: 30px;
+}
+
+.floating-card.card-3 {
+    bottom: 30px; /* 하단에서 여유 있게 */
+    left: 50px;
+}
+
+/* 프로세스 스텝 가로형 최적화 */
+.process-steps {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    flex-wrap: nowrap;
+    gap: 15px; /* 간격 줄임 */
+    margin: 30px 0; /* 여백 줄임 */
+}
+
+.step-item {
+    flex: 1;
+    text-align: center;
+    min-width: 100px; /* 최소 너비 줄임 */
+}
+
+.step-item h3 {
+    font-size: 14px !important; /* 크기 줄임 */
+    margin: 8px 0 !important; /* 여백 줄임 */
+}
+
+.step-number {
+    font-size: 18px !important; /* 크기 줄임 */
+    margin-bottom: 8px !important; /* 여백 줄임 */
+}
+
+.step-arrow {
+    color: var(--primary-color);
+    font-size: 20px; /* 크기 줄임 */
+}
+
+/* 프로그램 테이블 가로형 최적화 */
+.program-category {
+    margin-bottom: 30px; /* 여백 줄임 */
+    page-break-inside: avoid;
+}
+
+.category-title {
+    font-size: 1.3rem !important; /* 크기 줄임 */
+    margin: 15px 0 !important; /* 여백 줄임 */
+}
+
+.program-table {
+    font-size: 11px; /* 폰트 크기 줄임 */
+    margin: 15px 0; /* 여백 줄임 */
+}
+
+.table-header, .table-row {
+    display: grid;
+    grid-template-columns: 50px 2fr 3fr 3fr 70px; /* 컬럼 크기 조정 */
+    gap: 8px; /* 간격 줄임 */
+    padding: 8px; /* 패딩 줄임 */
+    border: 1px solid #ddd;
+}
+
+.table-header {
+    background: var(--primary-color);
+    color: white;
+    font-weight: bold;
+}
+
+/* 혜택 섹션 가로형 최적화 */
+.benefits-grid {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 20px; /* 간격 줄임 */
+    margin: 30px 0; /* 여백 줄임 */
+}
+
+.benefit-item {
+    text-align: center;
+    padding: 15px; /* 패딩 줄임 */
+}
+
+.benefit-item h3 {
+    font-size: 1.1rem !important; /* 크기 줄임 */
+    margin: 10px 0 !important; /* 여백 줄임 */
+}
+
+/* 신청 섹션 가로형 최적화 */
+.apply-content {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 30px; /* 간격 줄임 */
+    align-items: start;
+}
+
+.apply-form {
+    max-width: 100%;
+}
+
+.apply-text h2 {
+    font-size: 1.8rem !important; /* 크기 줄임 */
+    margin: 0 0 15px 0 !important; /* 여백 줄임 */
+}
+
+/* 푸터 가로형 최적화 */
+.footer-content {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 20px; /* 간격 줄임 */
+}
+
+.footer-section h3, .footer-section h4 {
+    font-size: 1rem !important; /* 크기 줄임 */
+    margin: 0 0 10px 0 !important; /* 여백 줄임 */
+}
+
+/* 모바일 요소 숨김 */
+.hamburger, .mobile-menu {
+    display: none !important;
+}
+
+/* 헤더 높이 조정 */
+.header {
+    height: auto !important;
+    min-height: 60px !important; /* 높이 줄임 */
+    padding: 10px 0 !important; /* 패딩 줄임 */
+}
+
+/* 인쇄 최적화 */
+@media print {
+    * {
+        -webkit-print-color-adjust: exact !important;
+        color-adjust: exact !important;
+    }
     
-    try:
-        print("📄 playwright를 사용하여 가로형 PDF를 생성합니다...")
-        
-        html_file_path = os.path.abspath(html_file)
-        output_file = "음원_마케팅_체험단_가로형.pdf"
-        
-        # PDF 최적화를 위한 CSS 추가
-        pdf_optimized_css = """
-        <style>
-        /* PDF 가로형 페이지 최적화 CSS */
-        @page {
-            size: A4 landscape;
-            margin: 10mm 15mm 15mm 15mm; /* 상단 여백 줄임 */
-        }
-        
-        /* 페이지 분할 설정 */
-        .hero {
-            page-break-after: always;
-            min-height: 95vh; /* 높이 줄임 */
-            display: flex;
-            align-items: center;
-            padding: 20px 0; /* 패딩 추가 */
-        }
-        
-        .process {
-            page-break-before: always;
-            page-break-after: always;
-            min-height: 95vh; /* 높이 줄임 */
-            padding: 20px 0; /* 패딩 줄임 */
-        }
-        
-        .programs {
-            page-break-before: always;
-            page-break-after: always;
-            min-height: 95vh; /* 높이 줄임 */
-            padding: 20px 0; /* 패딩 줄임 */
-        }
-        
-        .benefits {
-            page-break-before: always;
-            page-break-after: always;
-            min-height: 95vh; /* 높이 줄임 */
-            padding: 20px 0; /* 패딩 줄임 */
-        }
-        
-        .apply {
-            page-break-before: always;
-            page-break-after: always;
-            min-height: 95vh; /* 높이 줄임 */
-            padding: 20px 0; /* 패딩 줄임 */
-        }
-        
-        .footer {
-            page-break-before: always;
-            min-height: 40vh; /* 높이 줄임 */
-            padding: 20px 0; /* 패딩 줄임 */
-        }
-        
-        /* 가로형에 맞는 레이아웃 조정 */
-        body {
-            font-size: 14px;
-            line-height: 1.4; /* 줄간격 줄임 */
-        }
-        
-        .container {
-            max-width: 100%;
-            padding: 0 20px;
-        }
-        
-        /* 섹션 제목 크기 및 여백 조정 */
-        .section-header h2, h2 {
-            font-size: 2rem !important; /* 제목 크기 줄임 */
-            margin: 10px 0 20px 0 !important; /* 상단 여백 줄임 */
-            line-height: 1.2 !important;
-        }
-        
-        .section-header p {
-            margin: 0 0 20px 0 !important; /* 여백 조정 */
-        }
-        
-        /* 히어로 섹션 가로형 최적화 */
-        .hero-container {
-            display: flex;
-            align-items: center;
-            gap: 30px; /* 간격 줄임 */
-            height: 100%;
-            max-height: 85vh; /* 최대 높이 제한 */
-        }
-        
-        .hero-content {
-            flex: 1;
-        }
-        
-        .hero-title {
-            font-size: 2.5rem !important; /* 크기 줄임 */
-            margin-bottom: 15px !important; /* 여백 줄임 */
-            line-height: 1.2 !important;
-        }
-        
-        .hero-buttons {
-            margin-top: 20px !important; /* 여백 줄임 */
-        }
-        
-        /* 플로팅 카드 크기 및 위치 조정 */
-        .hero-image {
-            flex: 0 0 400px; /* 고정 너비로 설정 */
-            height: 300px; /* 높이 제한 */
-            position: relative;
-        }
-        
-        .hero-graphic {
-            width: 100%;
-            height: 100%;
-            position: relative;
-        }
-        
-        .floating-card {
-            position: absolute !important;
-            width: 120px !important; /* 크기 줄임 */
-            height: 60px !important; /* 높이 줄임 */
-            display: flex !important;
-            align-items: center;
-            justify-content: center;
-            background: rgba(255, 255, 255, 0.9);
-            border-radius: 12px;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-            font-size: 12px !important; /* 폰트 크기 줄임 */
-            font-weight: 500;
-        }
-        
-        .floating-card.card-1 {
-            top: 20px;
-            left: 20px;
-        }
-        
-        .floating-card.card-2 {
-            top: 80px;
-            right: 30px;
-        }
-        
-        .floating-card.card-3 {
-            bottom: 30px; /* 하단에서 여유 있게 */
-            left: 50px;
-        }
-        
-        /* 프로세스 스텝 가로형 최적화 */
-        .process-steps {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: nowrap;
-            gap: 15px; /* 간격 줄임 */
-            margin: 30px 0; /* 여백 줄임 */
-        }
-        
-        .step-item {
-            flex: 1;
-            text-align: center;
-            min-width: 100px; /* 최소 너비 줄임 */
-        }
-        
-        .step-item h3 {
-            font-size: 14px !important; /* 크기 줄임 */
-            margin: 8px 0 !important; /* 여백 줄임 */
-        }
-        
-        .step-number {
-            font-size: 18px !important; /* 크기 줄임 */
-            margin-bottom: 8px !important; /* 여백 줄임 */
-        }
-        
-        .step-arrow {
-            color: var(--primary-color);
-            font-size: 20px; /* 크기 줄임 */
-        }
-        
-        /* 프로그램 테이블 가로형 최적화 */
-        .program-category {
-            margin-bottom: 30px; /* 여백 줄임 */
-            page-break-inside: avoid;
-        }
-        
-        .category-title {
-            font-size: 1.3rem !important; /* 크기 줄임 */
-            margin: 15px 0 !important; /* 여백 줄임 */
-        }
-        
-        .program-table {
-            font-size: 11px; /* 폰트 크기 줄임 */
-            margin: 15px 0; /* 여백 줄임 */
-        }
-        
-        .table-header, .table-row {
-            display: grid;
-            grid-template-columns: 50px 2fr 3fr 3fr 70px; /* 컬럼 크기 조정 */
-            gap: 8px; /* 간격 줄임 */
-            padding: 8px; /* 패딩 줄임 */
-            border: 1px solid #ddd;
-        }
-        
-        .table-header {
-            background: var(--primary-color);
-            color: white;
-            font-weight: bold;
-        }
-        
-        /* 혜택 섹션 가로형 최적화 */
-        .benefits-grid {
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 20px; /* 간격 줄임 */
-            margin: 30px 0; /* 여백 줄임 */
-        }
-        
-        .benefit-item {
-            text-align: center;
-            padding: 15px; /* 패딩 줄임 */
-        }
-        
-        .benefit-item h3 {
-            font-size: 1.1rem !important; /* 크기 줄임 */
-            margin: 10px 0 !important; /* 여백 줄임 */
-        }
-        
-        /* 신청 섹션 가로형 최적화 */
-        .apply-content {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 30px; /* 간격 줄임 */
-            align-items: start;
-        }
-        
-        .apply-form {
-            max-width: 100%;
-        }
-        
-        .apply-text h2 {
-            font-size: 1.8rem !important; /* 크기 줄임 */
-            margin: 0 0 15px 0 !important; /* 여백 줄임 */
-        }
-        
-        /* 푸터 가로형 최적화 */
-        .footer-content {
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 20px; /* 간격 줄임 */
-        }
-        
-        .footer-section h3, .footer-section h4 {
-            font-size: 1rem !important; /* 크기 줄임 */
-            margin: 0 0 10px 0 !important; /* 여백 줄임 */
-        }
-        
-        /* 모바일 요소 숨김 */
-        .hamburger, .mobile-menu {
-            display: none !important;
-        }
-        
-        /* 헤더 높이 조정 */
-        .header {
-            height: auto !important;
-            min-height: 60px !important; /* 높이 줄임 */
-            padding: 10px 0 !important; /* 패딩 줄임 */
-        }
-        
-        /* 인쇄 최적화 */
-        @media print {
-            * {
-                -webkit-print-color-adjust: exact !important;
-                color-adjust: exact !important;
+    .nav-menu {
+        display: flex !important;
+    }
+}
+
+/* 배경 그라데이션 유지 */
+.hero {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+}
+
+.process {
+    background: #f8fafc;
+}
+
+.benefits {
+    background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+    color: white;
+}
+
+.apply {
+    background: #1a1a2e;
+    color: white;
+}
+"""
+
+VIEWPORT = {"width": 1600, "height": 1000}
+
+# 인쇄 폭(mm, A4 가로 297mm - 좌우 여백 15mm), CSS 번들에서 @media 조건 평가에 사용
+BUNDLE_MEDIA_WIDTH_MM = 297 - 15 - 15
+
+PDF_OPTIONS = {
+    'format': 'A4',
+    'landscape': True,  # 가로형 설정
+    'margin': {
+        'top': '10mm',    # 상단 여백 줄임
+        'right': '15mm', 
+        'bottom': '15mm',
+        'left': '15mm'
+    },
+    'print_background': True,
+    'prefer_css_page_size': True,
+    'display_header_footer': True,
+    'header_template': '<div style="font-size:9px; text-align:center; width:100%; color:#666; margin-top:5mm;">음원 마케팅 체험단</div>',
+    'footer_template': '<div style="font-size:9px; text-align:center; width:100%; color:#666; margin-bottom:5mm;"><span class="pageNumber"></span> / <span class="totalPages"></span></div>'
+}
+
+# 섹션 모드 설정: 한 페이지(또는 몇 페이지)씩 따로 렌더링할 최상위 요소
+SECTION_SELECTOR = "body > section, body > footer"
+SECTION_CACHE_DIR = ".render_cache_sections"
+
+# 섹션 PDF에는 페이지 번호를 넣지 않고, 합칠 때 전체 기준 번호를 찍음
+SECTION_PDF_OPTIONS = {
+    **PDF_OPTIONS,
+    'footer_template': '<span></span>',
+}
+
+# 합친 PDF에 찍는 페이지 번호 (Chromium 푸터 템플릿과 같은 위치/크기: 9px, #666, 하단 여백 5mm)
+PAGE_NUMBER_FONT_SIZE = 6.75  # pt
+PAGE_NUMBER_BASELINE = 30.2  # 페이지 아래쪽에서 pt
+PAGE_NUMBER_GRAY = 0.4
+# Helvetica 글자 폭 (1/1000 em, 숫자/공백/슬래시만 사용)
+_HELVETICA_WIDTHS = {" ": 278, "/": 278, **{digit: 556 for digit in "0123456789"}}
+
+# 섹션별 DOM과 CSS 규칙을 모으는 스크립트
+# 규칙이 어느 섹션의 요소에만 적용되면 그 섹션에, 섹션 밖(헤더, body 등)에도 적용되거나
+# @font-face/@keyframes처럼 요소와 무관한 규칙이면 공통으로 분류
+SECTION_SNAPSHOT_SCRIPT = """
+(selector) => {
+    const sections = Array.from(document.querySelectorAll(selector));
+    const owner = (element) => sections.findIndex((section) => section.contains(element));
+    const perSection = sections.map(() => []);
+    const shared = [];
+    const dynamic = /::?(before|after|first-line|first-letter|placeholder|marker|selection)|:(hover|focus|focus-visible|focus-within|active|visited)/g;
+
+    const visit = (rules, prefix) => {
+        for (const rule of rules) {
+            if (!(rule instanceof CSSStyleRule) && rule.cssRules) {
+                visit(rule.cssRules, prefix + rule.cssText.split('{')[0]);
+                continue;
             }
-            
-            .nav-menu {
-                display: flex !important;
+            const text = prefix + rule.cssText;
+            if (!(rule instanceof CSSStyleRule)) {
+                shared.push(text);
+                continue;
+            }
+            let owners;
+            try {
+                const matched = document.querySelectorAll(rule.selectorText.replace(dynamic, '') || '*');
+                owners = new Set(Array.from(matched, owner));
+            } catch (e) {
+                shared.push(text);
+                continue;
+            }
+            if (owners.has(-1)) {
+                shared.push(text);
+            } else {
+                owners.forEach((index) => perSection[index].push(text));
             }
         }
-        
-        /* 배경 그라데이션 유지 */
-        .hero {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }
-        
-        .process {
-            background: #f8fafc;
-        }
-        
-        .benefits {
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-            color: white;
-        }
-        
-        .apply {
-            background: #1a1a2e;
-            color: white;
-        }
-        </style>
-        """
-        
-        with sync_playwright() as p:
-            # 브라우저 실행
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            # 가로형에 적합한 뷰포트 설정 (더 큰 크기로)
-            page.set_viewport_size({"width": 1600, "height": 1000})
-            
-            # HTML 파일 읽기
-            with open(html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # CSS 최적화 코드 삽입
-            html_content = html_content.replace('</head>', f'{pdf_optimized_css}</head>')
-            
-            # 수정된 HTML을 임시 파일로 저장
-            temp_html = "temp_landscape.html"
-            with open(temp_html, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            temp_html_path = os.path.abspath(temp_html)
+    };
+
+    for (const sheet of document.styleSheets) {
+        let rules;
+        try {
+            rules = sheet.cssRules;
+        } catch (e) {
+            // 다른 출처의 스타일시트는 규칙을 읽을 수 없으므로 주소로 대신함
+            shared.push('@import ' + sheet.href);
+            continue;
+        }
+        visit(rules, '');
+    }
+
+    const outside = Array.from(document.body.children)
+        .filter((element) => !sections.includes(element) && element.tagName !== 'SCRIPT')
+        .map((element) => element.outerHTML);
+
+    return {
+        shared: {html: outside.join('\\n'), css: shared.join('\\n')},
+        sections: sections.map((section, index) => ({
+            name: section.id || section.className || section.tagName.toLowerCase(),
+            html: section.outerHTML,
+            css: perSection[index].join('\\n'),
+        })),
+    };
+}
+"""
+
+# index번째 섹션만 보이도록 나머지 섹션을 숨김 (앞뒤 강제 페이지 나눔도 해제해 빈 페이지 방지)
+SECTION_ISOLATE_SCRIPT = """
+([selector, index]) => {
+    document.querySelectorAll(selector).forEach((section, i) => {
+        section.style.removeProperty('display');
+        section.style.removeProperty('break-before');
+        section.style.removeProperty('break-after');
+        if (i === index) {
+            section.style.setProperty('break-before', 'auto', 'important');
+            section.style.setProperty('break-after', 'auto', 'important');
+        } else {
+            section.style.setProperty('display', 'none', 'important');
+        }
+    });
+}
+"""
+
+def style_injection_script(css):
+    """DOM 생성 직후 <head>에 CSS를 삽입하는 초기화 스크립트 (임시 HTML 파일 없이 적용)"""
+    return (
+        "document.addEventListener('DOMContentLoaded', () => {"
+        "const style = document.createElement('style');"
+        f"style.textContent = {json.dumps(css)};"
+        "document.head.appendChild(style);"
+        "});"
+    )
+
+def bundle_styles(html_file, resolver=None, tracer=None):
+    """로컬 스타일시트 대신 인쇄용 CSS 번들(PDF_OPTIMIZED_CSS 포함)을 제공하는 resolver 반환
+
+    resolver가 없으면 외부 요청은 그대로 허용하는 resolver를 만듭니다.
+    """
+
+    from css_bundle import css_px, install_bundle
+
+    if resolver is None:
+        resolver = AssetResolver.for_html(html_file, external="allow")
+    with get_tracer(tracer).span("css.bundle") as span:
+        span["bytes"] = install_bundle(resolver, html_file, PDF_OPTIMIZED_CSS, css_px(BUNDLE_MEDIA_WIDTH_MM))
+    return resolver
+
+def render_landscape_pdf(pool, html_file, output_file=None, tracer=None, resolver=None, bundle=False, timeout=None):
+    """브라우저 풀의 페이지에서 HTML 파일을 가로형 PDF로 렌더링 (실패 시 예외 발생)
+    
+    최적화 CSS는 메모리에서 바로 주입하므로 파일을 쓰지 않아 동시에 여러 변환을 실행해도 안전합니다.
+    output_file: 파일 경로, 바이너리 스트림, 또는 None (None이면 PDF 바이트 반환)
+    tracer: 단계별 시간을 기록할 render_trace.Tracer
+    resolver: 로컬 리소스만 제공하고 외부 요청을 막을 asset_resolver.AssetResolver
+    bundle: styles.css와 최적화 CSS 대신 인쇄용 CSS 번들 사용 (bundle_styles)
+    timeout: 렌더링 전체 시간 제한(초) - 페이지 로드와 대기 단계에 남은 시간을 넘기고, 넘으면 TimeoutError
+    """
+    
+    tracer = get_tracer(tracer)
+    deadline = deadline_after(timeout)
+    html_file_path = os.path.abspath(html_file)
+    
+    with tracer.span("render", profile="landscape", input=html_file_path) as render_span:
+        if bundle:
+            resolver = bundle_styles(html_file_path, resolver, tracer)
+        
+        # 가로형에 적합한 뷰포트 설정 (더 큰 크기로)
+        with pool.page(viewport=VIEWPORT) as page:
+            # CSS 최적화 코드 삽입 (원본 HTML은 수정하지 않음, 번들에는 이미 포함)
+            if not bundle:
+                page.add_init_script(style_injection_script(PDF_OPTIMIZED_CSS))
+            # script.js 인쇄 모드 (스크롤/애니메이션 처리 생략)
+            page.add_init_script(PRINT_MODE_SCRIPT)
             
             # HTML 파일 로드
-            page.goto(f"file:///{temp_html_path.replace(os.sep, '/')}")
+            with tracer.span("page.goto"):
+                page.goto(prepare_page(page, html_file_path, resolver), timeout=time_left_ms(deadline))
             
             # 페이지가 완전히 로드될 때까지 대기
-            page.wait_for_load_state('networkidle')
+            with tracer.span("page.wait_networkidle"):
+                page.wait_for_load_state('networkidle', timeout=time_left_ms(deadline))
             
-            # 애니메이션 완료를 위한 추가 대기
-            page.wait_for_timeout(3000)  # 3초 대기
+            # 애니메이션 완료 신호 대기 (script.js의 렌더 준비 신호)
+            with tracer.span("page.wait_render_ready") as span:
+                span["ready"] = wait_for_render_ready(page, time_left_ms(deadline, DEFAULT_TIMEOUT_MS))
             
-            # PDF 생성 (가로형)
-            page.pdf(
-                path=output_file,
-                format='A4',
-                landscape=True,  # 가로형 설정
-                margin={
-                    'top': '10mm',    # 상단 여백 줄임
-                    'right': '15mm', 
-                    'bottom': '15mm',
-                    'left': '15mm'
-                },
-                print_background=True,
-                prefer_css_page_size=True,
-                display_header_footer=True,
-                header_template='<div style="font-size:9px; text-align:center; width:100%; color:#666; margin-top:5mm;">음원 마케팅 체험단</div>',
-                footer_template='<div style="font-size:9px; text-align:center; width:100%; color:#666; margin-bottom:5mm;"><span class="pageNumber"></span> / <span class="totalPages"></span></div>'
-            )
+            # PDF 생성 (가로형, 경로 없이 바이트로 받아 출력 대상에 전달, page.pdf에는 timeout이 없어 시작 전에만 확인)
+            with tracer.span("page.pdf") as span:
+                time_left_ms(deadline)
+                pdf_bytes = page.pdf(**PDF_OPTIONS)
+                span["bytes"] = render_span["bytes"] = len(pdf_bytes)
             
-            browser.close()
-            
-            # 임시 파일 삭제
-            if os.path.exists(temp_html):
-                os.remove(temp_html)
+            with tracer.span("output.write"):
+                return deliver(pdf_bytes, output_file)
+
+def section_keys(snapshot, offline=False, html_file=None):
+    """섹션별 캐시 키 목록 (섹션 DOM/CSS/리소스 + 공통 DOM/CSS/리소스 + PDF 옵션 + 렌더러 버전의 sha256)
+
+    offline: 외부 리소스(웹 폰트 등)를 막고 렌더링하는지 여부 (결과가 달라지므로 키에 포함)
+    html_file: 주어지면 섹션이 참조하는 로컬 이미지/폰트 파일의 수정 시각/크기도 키에 포함
+               (같은 주소의 파일만 바뀌어도 다시 렌더링)
+    """
+
+    from render_cache import package_version
+    from snapshot import resource_dirs, resource_fingerprint
+
+    base_dirs = resource_dirs(os.path.abspath(html_file)) if html_file is not None else []
+
+    def resources(part):
+        return resource_fingerprint(part["html"] + "\n" + part["css"], base_dirs) if base_dirs else []
+
+    base = hashlib.sha256()
+    base.update(json.dumps({
+        "shared": snapshot["shared"],
+        "shared_resources": resources(snapshot["shared"]),
+        "pdf_options": SECTION_PDF_OPTIONS,
+        "viewport": VIEWPORT,
+        "renderer": f"playwright=={package_version('playwright')}",
+        "offline": offline,
+    }, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+    keys = []
+    for section in snapshot["sections"]:
+        digest = base.copy()
+        digest.update(json.dumps([section["html"], section["css"], resources(section)],
+                                 ensure_ascii=False).encode('utf-8'))
+        keys.append(digest.hexdigest())
+    return keys
+
+def _page_number_stream(pdf, page, font, text):
+    """페이지 아래 가운데에 text를 그리는 콘텐츠 스트림"""
+
+    import pikepdf
+
+    font_name = page.add_resource(font, pikepdf.Name.Font, pikepdf.Name("/PageNumber"))
+
+    left, _, right, _ = (float(value) for value in page.mediabox)
+    width = sum(_HELVETICA_WIDTHS.get(char, 556) for char in text) * PAGE_NUMBER_FONT_SIZE / 1000
+    x = left + (right - left - width) / 2
+
+    return pikepdf.Stream(pdf, (
+        f"q {PAGE_NUMBER_GRAY} g BT {font_name} {PAGE_NUMBER_FONT_SIZE} Tf "
+        f"{x:.2f} {PAGE_NUMBER_BASELINE} Td ({text}) Tj ET Q"
+    ).encode('ascii'))
+
+def merge_section_pdfs(section_pdfs):
+    """섹션 PDF(바이트) 목록을 순서대로 합치고 전체 기준 페이지 번호(n / 전체)를 찍어 바이트로 반환"""
+
+    try:
+        import pikepdf
+    except ImportError:
+        raise ImportError("섹션 PDF를 합치려면 pikepdf가 필요합니다: pip install pikepdf")
+
+    from pdf_optimize import deduplicate
+
+    merged = pikepdf.new()
+    sources = []
+    try:
+        for data in section_pdfs:
+            source = pikepdf.open(io.BytesIO(data))
+            sources.append(source)
+            if hasattr(merged, "add_pages_from"):
+                # pikepdf 10 이상: 페이지 안 링크의 이름 있는 목적지도 함께 복사
+                merged.add_pages_from(source)
+            else:
+                merged.pages.extend(source.pages)
+
+        font = merged.make_indirect(pikepdf.Dictionary(
+            Type=pikepdf.Name.Font, Subtype=pikepdf.Name.Type1, BaseFont=pikepdf.Name.Helvetica,
+            Encoding=pikepdf.Name.WinAnsiEncoding,
+        ))
+        total = len(merged.pages)
+        for number, page in enumerate(merged.pages, 1):
+            # 기존 콘텐츠의 그래픽 상태가 번호에 영향을 주지 않도록 감쌈
+            page.contents_add(pikepdf.Stream(merged, b"q"), prepend=True)
+            page.contents_add(pikepdf.Stream(merged, b"Q"))
+            page.contents_add(_page_number_stream(merged, page, font, f"{number} / {total}"))
+
+        # 섹션 PDF마다 따로 들어 있는 같은 이미지/글리프를 하나로 합침
+        deduplicate(merged)
+
+        output = io.BytesIO()
+        merged.save(output, compress_streams=True)
+        return output.getvalue()
+    finally:
+        for source in sources:
+            source.close()
+        merged.close()
+
+def render_landscape_sections(pool, html_file, output_file=None, cache=None, tracer=None, resolver=None,
+                              bundle=False, timeout=None):
+    """섹션별로 렌더링하고 캐시된 섹션은 재사용하여 가로형 PDF를 만듦 (실패 시 예외 발생)
+
+    페이지는 한 번만 로드하고, 캐시에 없는 섹션만 나머지 섹션을 숨긴 채 page.pdf로 렌더링합니다.
+    cache: 섹션 PDF를 저장할 render_cache.RenderCache (없으면 SECTION_CACHE_DIR 사용)
+    resolver: 로컬 리소스만 제공하고 외부 요청을 막을 asset_resolver.AssetResolver
+    output_file: 파일 경로, 바이너리 스트림, 또는 None (None이면 PDF 바이트 반환)
+    bundle: styles.css와 최적화 CSS 대신 인쇄용 CSS 번들 사용 (bundle_styles)
+    timeout: 렌더링 전체 시간 제한(초) - 페이지 로드와 대기 단계에 남은 시간을 넘기고, 넘으면 TimeoutError
+    """
+
+    deadline = deadline_after(timeout)
+    if cache is None:
+        from render_cache import RenderCache
+        cache = RenderCache(SECTION_CACHE_DIR)
+
+    tracer = get_tracer(tracer)
+    html_file_path = os.path.abspath(html_file)
+
+    with tracer.span("render", profile="landscape-sections", input=html_file_path) as render_span:
+        if bundle:
+            resolver = bundle_styles(html_file_path, resolver, tracer)
+
+        with pool.page(viewport=VIEWPORT) as page:
+            if not bundle:
+                page.add_init_script(style_injection_script(PDF_OPTIMIZED_CSS))
+            page.add_init_script(PRINT_MODE_SCRIPT)
+
+            with tracer.span("page.goto"):
+                page.goto(prepare_page(page, html_file_path, resolver), timeout=time_left_ms(deadline))
+
+            with tracer.span("page.wait_networkidle"):
+                page.wait_for_load_state('networkidle', timeout=time_left_ms(deadline))
+
+            with tracer.span("page.wait_render_ready") as span:
+                span["ready"] = wait_for_render_ready(page, time_left_ms(deadline, DEFAULT_TIMEOUT_MS))
+
+            with tracer.span("sections.snapshot") as span:
+                snapshot = page.evaluate(SECTION_SNAPSHOT_SCRIPT, SECTION_SELECTOR)
+                keys = section_keys(snapshot, offline=resolver is not None, html_file=html_file_path)
+                span["sections"] = len(keys)
+
+            section_pdfs = []
+            rendered = 0
+            for index, (section, key) in enumerate(zip(snapshot["sections"], keys)):
+                with tracer.span("section.render", section=section["name"], index=index) as span:
+                    pdf_bytes = cache.read(key, ".pdf")
+                    span["cached"] = pdf_bytes is not None
+                    if pdf_bytes is None:
+                        # page.pdf에는 timeout이 없어 섹션마다 시작 전에 확인
+                        time_left_ms(deadline)
+                        page.evaluate(SECTION_ISOLATE_SCRIPT, [SECTION_SELECTOR, index])
+                        pdf_bytes = page.pdf(**SECTION_PDF_OPTIONS)
+                        cache.write(key, ".pdf", pdf_bytes)
+                        rendered += 1
+                    span["bytes"] = len(pdf_bytes)
+                section_pdfs.append(pdf_bytes)
+
+        render_span["rendered_sections"] = rendered
+
+        with tracer.span("sections.merge") as span:
+            pdf_bytes = merge_section_pdfs(section_pdfs)
+            span["bytes"] = render_span["bytes"] = len(pdf_bytes)
+
+        with tracer.span("output.write"):
+            return deliver(pdf_bytes, output_file)
+
+def create_landscape_pdf_bytes(html_file="index.html", pool=None, tracer=None, offline=False, bundle=False):
+    """HTML 웹페이지를 가로형 PDF로 변환하여 바이트로 반환 (실패 시 예외 발생, offline: 외부 요청 차단)"""
+    
+    resolver = AssetResolver.for_html(html_file) if offline else None
+    if pool is None:
+        with BrowserPool(size=1, tracer=tracer) as own_pool:
+            return render_landscape_pdf(own_pool, html_file, tracer=tracer, resolver=resolver, bundle=bundle)
+    return render_landscape_pdf(pool, html_file, tracer=tracer, resolver=resolver, bundle=bundle)
+
+def create_landscape_pdf(html_file="index.html", output_file="음원_마케팅_체험단_가로형.pdf", pool=None, tracer=None,
+                         sections=False, cache=None, offline=False, bundle=False):
+    """HTML 웹페이지를 가로형 PDF로 변환 (섹션별 페이지 분할, pool: 재사용할 BrowserPool, tracer: 단계별 시간 기록)
+    
+    sections가 True이면 섹션별로 캐시하여 바뀐 섹션만 다시 렌더링 (cache: 섹션 캐시 RenderCache)
+    offline이 True이면 외부 요청(폰트 CDN 등)을 막고 로컬 리소스만 메모리에서 제공
+    bundle이 True이면 인쇄용 CSS 번들 사용 (css_bundle)
+    """
+    
+    print("🎬 가로형 PDF 변환을 시작합니다...")
+    
+    # HTML 파일 확인
+    if not os.path.exists(html_file):
+        print(f"❌ {html_file} 파일을 찾을 수 없습니다.")
+        return False
+    
+    try:
+        print("📄 playwright를 사용하여 가로형 PDF를 생성합니다...")
         
+        resolver = AssetResolver.for_html(html_file) if offline else None
+        if sections:
+            from render_cache import RenderCache
+            cache = cache if cache is not None else RenderCache(SECTION_CACHE_DIR)
+            hits = cache.hits
+            render = lambda p: render_landscape_sections(p, html_file, output_file, cache, tracer, resolver, bundle)
+        else:
+            render = lambda p: render_landscape_pdf(p, html_file, output_file, tracer, resolver, bundle)
+        
+        if pool is None:
+            # 풀이 주어지지 않으면 이번 변환에만 쓰는 브라우저를 실행
+            with BrowserPool(size=1, tracer=tracer) as own_pool:
+                render(own_pool)
+        else:
+            render(pool)
+        
+        if sections:
+            print(f"🗄️ 섹션 캐시 재사용 {cache.hits - hits}개 (바뀐 섹션만 다시 렌더링)")
         print(f"✅ 수정된 가로형 PDF 파일이 생성되었습니다: {output_file}")
-        print(f"📁 파일 위치: {os.path.abspath(output_file)}")
+        if not is_stream(output_file):
+            print(f"📁 파일 위치: {os.path.abspath(output_file)}")
         
         # 페이지 구성 안내
         print("\n📄 수정된 PDF 페이지 구성:")
@@ -390,11 +736,27 @@ def create_landscape_pdf():
         print(f"❌ PDF 생성 중 오류가 발생했습니다: {e}")
         return False
 
-if __name__ == "__main__":
-    success = create_landscape_pdf()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTML 웹페이지를 섹션별 페이지로 나눈 가로형 PDF로 변환합니다.")
+    parser.add_argument("--sections", action="store_true", help="섹션별로 캐시하여 바뀐 섹션만 다시 렌더링")
+    parser.add_argument("--cache-dir", default=SECTION_CACHE_DIR, help=f"섹션 캐시 폴더 (기본 {SECTION_CACHE_DIR})")
+    parser.add_argument("--offline", action="store_true", help="외부 요청(폰트 CDN 등)을 막고 로컬 리소스만 사용")
+    parser.add_argument("--bundle-css", action="store_true", help="인쇄에 필요한 규칙만 남긴 CSS 번들 사용")
+    args = parser.parse_args(argv)
+    
+    cache = None
+    if args.sections:
+        from render_cache import RenderCache
+        cache = RenderCache(args.cache_dir)
+    
+    success = create_landscape_pdf(sections=args.sections, cache=cache, offline=args.offline, bundle=args.bundle_css)
     
     if success:
         print("🎉 성공적으로 수정된 가로형 PDF 파일이 생성되었습니다!")
         print("🔧 네이버 카드 잘림과 제목 잘림 문제가 해결되었습니다.")
     else:
-        print("❌ PDF 생성에 실패했습니다.") 
\ No newline at end of file
+        print("❌ PDF 생성에 실패했습니다.")
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    sys.exit(main()) 
\ No newline at end of file
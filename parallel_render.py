@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 CPU 코어에서 동시에 렌더링하는 병렬 스케줄러
+워커 프로세스마다 브라우저 풀을 하나씩 띄워 두고(워밍업) 매니페스트의 작업을 나눠 처리합니다.
+
+- 워커 수: --workers (기본값: CPU 코어 수)
+- 작업 큐 크기 제한: --max-pending (큐가 가득 차면 다음 작업은 자리가 날 때까지 대기)
+- 작업별 시간 제한: --timeout (초과한 워커는 종료하고 새 워커로 교체)
+- 프로필: batch_render와 동일 (portrait, landscape, weasyprint, pptx)
+- 렌더링 캐시: --cache-dir (모든 워커가 같은 캐시 폴더를 공유)
+- PDF 용량 최적화: --optimize (각 워커에서 pdf_optimize 실행)
+- 외부 요청 차단: --offline (로컬 리소스만 사용, asset_resolver)
+- 인쇄용 CSS 번들: --bundle-css (landscape/weasyprint 프로필, css_bundle)
+
+사용법:
+    python parallel_render.py manifest.json --workers 32 [--report report.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+from batch_render import PLAYWRIGHT_PROFILES, BatchRenderer, load_manifest, summarize
+
+DEFAULT_JOB_TIMEOUT = 120  # 초
+
+def _worker_main(worker_id, job_queue, result_queue, max_renders, warm, cache_options, optimize=False,
+                 offline=False, bundle_css=False):
+    """워커 프로세스: 큐에서 작업을 꺼내 렌더링하고 결과를 돌려보냄"""
+
+    cache = None
+    if cache_options:
+        from render_cache import RenderCache
+        cache = RenderCache(**cache_options)
+
+    renderer = BatchRenderer(pool_size=1, max_renders=max_renders, cache=cache, optimize=optimize,
+                             offline=offline, bundle_css=bundle_css)
+    try:
+        if warm:
+            # 첫 작업 전에 브라우저를 미리 실행 (실패해도 작업별로 다시 시도하고 오류를 보고)
+            try:
+                renderer.pool
+            except Exception:
+                pass
+
+        while True:
+            item = job_queue.get()
+            if item is None:
+                break
+
+            job_id, job = item
+            result_queue.put(("start", worker_id, job_id))
+
+            started = time.perf_counter()
+            error = None
+            cached = False
+            try:
+                cached = renderer.render(job)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+
+            result_queue.put(("done", worker_id, job_id, time.perf_counter() - started, cached, error))
+    finally:
+        renderer.close()
+
+class ParallelRenderer:
+    """프로세스 풀 기반 병렬 렌더러
+
+    - workers: 워커 프로세스 수
+    - max_pending: 워커에 넘기기 전 대기할 수 있는 최대 작업 수
+    - job_timeout: 작업 하나의 최대 소요 시간(초)
+    - max_renders: 워커별 브라우저 재시작 전 최대 렌더링 수
+    - cache_options: 워커마다 만들 RenderCache 인자 (예: {"cache_dir": ".render_cache"})
+    - optimize: PDF 결과물을 pdf_optimize로 최적화
+    - offline: playwright 프로필에서 외부 요청을 막고 로컬 리소스만 사용
+    - bundle_css: landscape/weasyprint 프로필에서 인쇄용 CSS 번들 사용
+    """
+
+    def __init__(self, workers=None, max_pending=None, job_timeout=DEFAULT_JOB_TIMEOUT, max_renders=100,
+                 cache_options=None, optimize=False, offline=False, bundle_css=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self.job_timeout = job_timeout
+        self.max_renders = max_renders
+        self.cache_options = cache_options
+        self.optimize = optimize
+        self.offline = offline
+        self.bundle_css = bundle_css
+
+        # playwright는 fork된 프로세스에서 안전하지 않으므로 spawn 사용
+        self._context = multiprocessing.get_context("spawn")
+        self._job_queue = None
+        self._result_queue = None
+        self._processes = {}
+        self._next_worker_id = 0
+        self._warm = False
+
+    def _spawn_worker(self):
+        worker_id = self._next_worker_id
+        self._next_worker_id += 1
+
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, self._job_queue, self._result_queue, self.max_renders, self._warm, self.cache_options,
+                  self.optimize, self.offline, self.bundle_css),
+            daemon=True,
+        )
+        process.start()
+        self._processes[worker_id] = process
+
+    def _replace_worker(self, worker_id):
+        """멈추거나 죽은 워커를 종료하고 새 워커로 교체"""
+        process = self._processes.pop(worker_id)
+        if process.is_alive():
+            process.terminate()
+        process.join(timeout=5)
+        self._spawn_worker()
+
+    def run(self, jobs):
+        """작업 목록을 병렬로 렌더링하고 입력 순서대로 작업별 결과 목록 반환"""
+
+        self._job_queue = self._context.Queue(maxsize=self.max_pending)
+        self._result_queue = self._context.Queue()
+        self._warm = any(job["profile"] in PLAYWRIGHT_PROFILES for job in jobs)
+
+        results = [None] * len(jobs)
+        running = {}  # worker_id -> (job_id, 시작 시각)
+        next_job = 0
+        finished = 0
+        total = len(jobs)
+
+        for _ in range(min(self.workers, max(total, 1))):
+            self._spawn_worker()
+
+        try:
+            while finished < total:
+                # 큐에 자리가 있는 만큼만 작업 투입
+                while next_job < total:
+                    try:
+                        self._job_queue.put_nowait((next_job, jobs[next_job]))
+                    except queue.Full:
+                        break
+                    next_job += 1
+
+                try:
+                    message = self._result_queue.get(timeout=0.1)
+                except queue.Empty:
+                    message = None
+
+                if message is not None and message[0] == "start":
+                    _, worker_id, job_id = message
+                    running[worker_id] = (job_id, time.perf_counter())
+                elif message is not None:
+                    _, worker_id, job_id, elapsed, cached, error = message
+                    running.pop(worker_id, None)
+                    if results[job_id] is None:
+                        results[job_id] = self._record(jobs, job_id, worker_id, elapsed, error, finished + 1, cached)
+                        finished += 1
+
+                # 시간 초과 또는 비정상 종료된 워커 처리
+                now = time.perf_counter()
+                for worker_id, (job_id, started) in list(running.items()):
+                    process = self._processes.get(worker_id)
+                    timed_out = now - started > self.job_timeout
+                    crashed = process is None or not process.is_alive()
+                    if not (timed_out or crashed):
+                        continue
+
+                    if timed_out:
+                        error = f"TimeoutError: {self.job_timeout}초 안에 끝나지 않았습니다."
+                    else:
+                        error = f"WorkerError: 워커 프로세스가 종료되었습니다 (exitcode={process.exitcode if process else None})."
+
+                    running.pop(worker_id)
+                    self._replace_worker(worker_id)
+                    if results[job_id] is None:
+                        results[job_id] = self._record(jobs, job_id, worker_id, now - started, error, finished + 1)
+                        finished += 1
+
+                # 작업 없이 종료된 워커도 교체
+                for worker_id, process in list(self._processes.items()):
+                    if worker_id not in running and not process.is_alive():
+                        self._replace_worker(worker_id)
+        finally:
+            self._shutdown()
+
+        return results
+
+    def _record(self, jobs, job_id, worker_id, elapsed, error, done_count, cached=False):
+        job = jobs[job_id]
+        if error is None:
+            source = ", 캐시" if cached else ""
+            print(f"✅ [{done_count}/{len(jobs)}] {job['output']} ({job['profile']}{source}, 워커 {worker_id}, {elapsed:.2f}초)")
+        else:
+            print(f"❌ [{done_count}/{len(jobs)}] {job['output']} ({job['profile']}, 워커 {worker_id}, {elapsed:.2f}초): {error}")
+        return {**job, "ok": error is None, "cached": cached, "seconds": round(elapsed, 4), "error": error,
+                "worker": worker_id}
+
+    def _shutdown(self):
+        """워커 종료 신호를 보내고 정리"""
+        for _ in self._processes:
+            try:
+                self._job_queue.put(None, timeout=1)
+            except queue.Full:
+                break
+
+        for process in self._processes.values():
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._processes = {}
+
+def run_parallel(jobs, workers=None, max_pending=None, job_timeout=DEFAULT_JOB_TIMEOUT, max_renders=100,
+                 cache_options=None, optimize=False, offline=False, bundle_css=False):
+    """작업 목록을 병렬로 렌더링 (ParallelRenderer 간편 함수)"""
+
+    renderer = ParallelRenderer(workers=workers, max_pending=max_pending, job_timeout=job_timeout,
+                                max_renders=max_renders, cache_options=cache_options, optimize=optimize,
+                                offline=offline, bundle_css=bundle_css)
+    return renderer.run(jobs)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="매니페스트의 작업을 여러 워커 프로세스에서 병렬로 렌더링합니다.")
+    parser.add_argument("manifest", help="작업 목록 (JSON 또는 CSV, batch_render와 동일한 형식)")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--max-pending", type=int, default=None, help="작업 큐 최대 크기 (기본: 워커 수 x 2)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_JOB_TIMEOUT, help=f"작업별 시간 제한(초, 기본 {DEFAULT_JOB_TIMEOUT})")
+    parser.add_argument("--max-renders", type=int, default=100, help="워커별 브라우저 재시작 전 최대 렌더링 수 (기본 100)")
+    parser.add_argument("--cache-dir", help="렌더링 캐시 폴더 (지정하지 않으면 캐시 사용 안 함)")
+    parser.add_argument("--cache-max-mb", type=int, default=500, help="렌더링 캐시 최대 크기(MB, 기본 500)")
+    parser.add_argument("--optimize", action="store_true", help="PDF 폰트 서브셋/중복 객체 제거로 용량 줄이기")
+    parser.add_argument("--offline", action="store_true", help="외부 요청(폰트 CDN 등)을 막고 로컬 리소스만 사용")
+    parser.add_argument("--bundle-css", action="store_true", help="인쇄에 필요한 규칙만 남긴 CSS 번들 사용 (landscape/weasyprint)")
+    parser.add_argument("--report", help="작업별 결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"❌ 매니페스트를 읽을 수 없습니다: {e}")
+        return 2
+
+    renderer = ParallelRenderer(
+        workers=args.workers,
+        max_pending=args.max_pending,
+        job_timeout=args.timeout,
+        max_renders=args.max_renders,
+        cache_options={"cache_dir": args.cache_dir, "max_bytes": args.cache_max_mb * 1024 * 1024} if args.cache_dir else None,
+        optimize=args.optimize,
+        offline=args.offline,
+        bundle_css=args.bundle_css,
+    )
+
+    print(f"🎬 병렬 변환을 시작합니다... ({len(jobs)}건, 워커 {renderer.workers}개)")
+    started = time.perf_counter()
+    results = renderer.run(jobs)
+    wall_seconds = time.perf_counter() - started
+    summary = {**summarize(results), "workers": renderer.workers, "wall_seconds": round(wall_seconds, 4)}
+
+    print(f"\n📊 완료: 성공 {summary['succeeded']}건 / 실패 {summary['failed']}건 "
+          f"(경과 {wall_seconds:.2f}초, 작업 평균 {summary['average_seconds']:.2f}초)")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({"summary": summary, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"📁 결과 파일: {os.path.abspath(args.report)}")
+
+    return 0 if summary["failed"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 PDF를 하나의 책자로 합치는 스트리밍 병합기
+원본 PDF를 한 번에 하나씩만 열고, 페이지와 그 페이지가 참조하는 객체를 새 번호로 바로 출력에 씁니다.
+1,000개 문서를 합쳐도 메모리에는 원본 하나와 객체 번호/해시 표만 남습니다.
+
+- 같은 내용의 스트림(폰트 파일, 이미지 등)과 폰트 객체는 문서가 달라도 한 번만 씀 (sha256 비교)
+- 원본마다 책갈피 하나를 만들고, 원본에 있던 책갈피는 그 아래에 붙임
+- 원본의 이름 있는 목적지(내부 링크)는 원본별 접두어를 붙여 그대로 동작하도록 옮김
+- 상위 /Pages에서 상속되는 속성(Resources, MediaBox, CropBox, Rotate)은 페이지에 직접 기록
+
+pikepdf가 필요합니다: pip install pikepdf
+
+사용법:
+    python pdf_merge.py -o 캠페인_모음.pdf a.pdf b.pdf c.pdf [--title "캠페인 A" ...]
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import sys
+from decimal import Decimal
+
+from pdf_optimize import is_dedupe_candidate
+from render_output import is_stream
+
+# 상위 /Pages 노드에서 상속될 수 있는 페이지 속성
+INHERITABLE_PAGE_KEYS = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+PDF_HEADER = b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n"
+
+def _pdf_string(text):
+    """PDF 문자열 (ASCII가 아니면 UTF-16BE 16진수 문자열)"""
+
+    try:
+        data = text.encode('ascii')
+    except UnicodeEncodeError:
+        return b"<feff" + text.encode('utf-16-be').hex().encode('ascii') + b">"
+    escaped = data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    return b"(" + escaped + b")"
+
+def _number(value):
+    if isinstance(value, float):
+        value = Decimal(repr(value))
+    text = format(value, 'f')
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return (text or "0").encode('ascii')
+
+class _OutlineItem:
+    def __init__(self, title, page_number, children=None):
+        self.title = title
+        self.page_number = page_number
+        self.children = children or []
+
+class PdfMergeWriter:
+    """원본 PDF를 하나씩 받아 출력에 바로 쓰는 병합기
+
+    output: 파일 경로 또는 쓰기 가능한 바이너리 스트림 (위치 이동이 필요 없음)
+    dedupe: 같은 내용의 스트림/폰트 객체를 한 번만 씀
+    """
+
+    def __init__(self, output, dedupe=True):
+        try:
+            import pikepdf
+        except ImportError:
+            raise ImportError("PDF 병합에는 pikepdf가 필요합니다: pip install pikepdf")
+
+        self._pikepdf = pikepdf
+        self._own_output = not is_stream(output)
+        self._output = open(output, 'wb') if self._own_output else output
+        self.dedupe = dedupe
+
+        self._position = 0
+        self._offsets = [None]  # 객체 번호 -> 출력 위치 (0번은 사용 안 함)
+        self._catalog = self._allocate()
+        self._pages_root = self._allocate()
+        self._page_numbers = []  # 출력 페이지 객체 번호 목록
+        self._outline = []
+        self._dests = {}  # 접두어를 붙인 목적지 이름 -> 직렬화된 목적지 배열
+        self._digests = {}  # 내용 해시 -> 객체 번호 (원본이 달라도 공유)
+        self._closed = False
+
+        self.sources = 0
+        self.duplicates = 0
+
+        self._write(PDF_HEADER)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._own_output:
+            self._output.close()
+
+    # 출력
+
+    def _write(self, data):
+        self._output.write(data)
+        self._position += len(data)
+
+    def _allocate(self):
+        self._offsets.append(None)
+        return len(self._offsets) - 1
+
+    def _write_object(self, number, body, stream_data=None):
+        self._offsets[number] = self._position
+        self._write(f"{number} 0 obj\n".encode('ascii'))
+        self._write(body)
+        if stream_data is not None:
+            self._write(b"\nstream\n")
+            self._write(stream_data)
+            self._write(b"\nendstream")
+        self._write(b"\nendobj\n")
+
+    # 원본 추가
+
+    def add(self, source, title=None):
+        """원본 PDF 하나의 모든 페이지를 출력에 추가 (source: 파일 경로, 바이트, 또는 바이너리 스트림)
+
+        title: 이 원본의 책갈피 제목 (없으면 파일 이름 또는 "문서 N")
+        """
+
+        pikepdf = self._pikepdf
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        if title is None:
+            title = (os.path.splitext(os.path.basename(source))[0]
+                     if isinstance(source, (str, os.PathLike)) else f"문서 {self.sources + 1}")
+
+        with pikepdf.open(source) as pdf:
+            self.sources += 1
+            copier = _SourceCopier(self, pdf, prefix=f"s{self.sources}-")
+
+            # 링크/책갈피가 다른 페이지를 가리킬 수 있으므로 페이지 번호를 먼저 모두 정함
+            page_numbers = [copier.reserve(page.obj) for page in pdf.pages]
+            for page in pdf.pages:
+                copier.copy_page(page.obj)
+            self._page_numbers.extend(page_numbers)
+
+            copier.copy_dests()
+            children = copier.outline_items()
+
+        first_page = page_numbers[0] if page_numbers else None
+        if first_page is not None:
+            self._outline.append(_OutlineItem(title, first_page, children))
+        return len(page_numbers)
+
+    # 마무리
+
+    def close(self):
+        """페이지 트리, 책갈피, 목적지, 카탈로그와 상호 참조 표를 쓰고 출력을 닫음"""
+
+        if self._closed:
+            return
+        self._closed = True
+
+        kids = b" ".join(f"{number} 0 R".encode('ascii') for number in self._page_numbers)
+        self._write_object(self._pages_root, b"<< /Type /Pages /Kids [" + kids
+                           + f"] /Count {len(self._page_numbers)} >>".encode('ascii'))
+
+        catalog = [b"<< /Type /Catalog", f" /Pages {self._pages_root} 0 R".encode('ascii')]
+        if self._outline:
+            outline_root = self._write_outline()
+            catalog.append(f" /Outlines {outline_root} 0 R /PageMode /UseOutlines".encode('ascii'))
+        if self._dests:
+            dests = self._allocate()
+            self._write_object(dests, b"<<" + b"".join(
+                name + b" " + value for name, value in sorted(self._dests.items())) + b">>")
+            catalog.append(f" /Dests {dests} 0 R".encode('ascii'))
+        catalog.append(b" >>")
+        self._write_object(self._catalog, b"".join(catalog))
+
+        # 상호 참조 표
+        xref_position = self._position
+        lines = [f"xref\n0 {len(self._offsets)}\n".encode('ascii'), b"0000000000 65535 f \n"]
+        for offset in self._offsets[1:]:
+            lines.append(f"{offset:010d} 00000 n \n".encode('ascii'))
+        self._write(b"".join(lines))
+        self._write(f"trailer\n<< /Size {len(self._offsets)} /Root {self._catalog} 0 R >>\n"
+                    f"startxref\n{xref_position}\n%%EOF\n".encode('ascii'))
+
+        if self._own_output:
+            self._output.close()
+
+    def _write_outline(self):
+        """책갈피 트리를 쓰고 /Outlines 객체 번호 반환"""
+
+        root = self._allocate()
+        count = self._write_outline_level(self._outline, root)
+        self._write_object(root, self._outline_body(root, None, self._outline, count))
+        return root
+
+    def _outline_body(self, number, item, children, count, parent=None, prev=None, next_=None):
+        parts = [b"<<"]
+        if item is not None:
+            parts.append(b" /Title " + _pdf_string(item.title))
+            parts.append(f" /Parent {parent} 0 R".encode('ascii'))
+            parts.append(f" /Dest [{item.page_number} 0 R /Fit]".encode('ascii'))
+            if prev is not None:
+                parts.append(f" /Prev {prev} 0 R".encode('ascii'))
+            if next_ is not None:
+                parts.append(f" /Next {next_} 0 R".encode('ascii'))
+        else:
+            parts.append(b" /Type /Outlines")
+        if children:
+            parts.append(f" /First {children[0].number} 0 R /Last {children[-1].number} 0 R".encode('ascii'))
+            parts.append(f" /Count {count}".encode('ascii'))
+        parts.append(b" >>")
+        return b"".join(parts)
+
+    def _write_outline_level(self, items, parent):
+        """같은 단계의 책갈피를 쓰고 보이는 항목 수 반환 (하위 항목은 원본 첫 단계만 펼침)"""
+
+        for item in items:
+            item.number = self._allocate()
+
+        count = len(items)
+        for index, item in enumerate(items):
+            child_count = self._write_outline_level(item.children, item.number)
+            prev = items[index - 1].number if index > 0 else None
+            next_ = items[index + 1].number if index + 1 < len(items) else None
+            # 원본별 책갈피는 접힌 상태로 둠 (음수 Count)
+            body = self._outline_body(item.number, item, item.children, -child_count, parent, prev, next_)
+            self._write_object(item.number, body)
+        return count
+
+class _SourceCopier:
+    """원본 PDF 하나의 객체를 새 번호로 직렬화하여 PdfMergeWriter에 씀"""
+
+    def __init__(self, writer, pdf, prefix):
+        self.writer = writer
+        self.pdf = pdf
+        self.prefix = prefix
+        self.pikepdf = writer._pikepdf
+        self._numbers = {}  # 원본 objgen -> 출력 객체 번호
+        self._in_progress = set()
+        self._pages = set()
+
+    def reserve(self, page):
+        number = self.writer._allocate()
+        self._numbers[page.objgen] = number
+        self._pages.add(page.objgen)
+        return number
+
+    def copy_page(self, page):
+        """페이지 사전을 씀 (/Parent는 새 페이지 트리로, 상속 속성은 페이지에 직접)"""
+
+        entries = {key: value for key, value in page.items() if key != "/Parent"}
+        node = page.get("/Parent")
+        while node is not None and any(key not in entries for key in INHERITABLE_PAGE_KEYS):
+            for key in INHERITABLE_PAGE_KEYS:
+                if key not in entries and key in node:
+                    entries[key] = node[key]
+            node = node.get("/Parent")
+
+        body = [b"<<", f" /Parent {self.writer._pages_root} 0 R".encode('ascii')]
+        for key in sorted(entries):
+            body.append(b" " + self.pikepdf.Name(key).unparse() + b" " + self.serialize(entries[key], key))
+        body.append(b" >>")
+        self.writer._write_object(self._numbers[page.objgen], b"".join(body))
+
+    def serialize(self, value, key=None, goto=False):
+        """값을 PDF 문법으로 직렬화 (간접 참조는 새 번호로, 목적지 이름에는 원본 접두어)"""
+
+        pikepdf = self.pikepdf
+
+        if isinstance(value, pikepdf.Object) and value.is_indirect:
+            return f"{self.copy_object(value)} 0 R".encode('ascii')
+        if isinstance(value, bool):
+            return b"true" if value else b"false"
+        if isinstance(value, int):
+            return str(value).encode('ascii')
+        if isinstance(value, (float, Decimal)):
+            return _number(value)
+        if value is None:
+            return b"null"
+        if isinstance(value, (pikepdf.Name, pikepdf.String)):
+            # 링크(/Dest, GoTo 동작의 /D)의 이름 있는 목적지는 원본별로 이름을 구분
+            if key == "/Dest" or (key == "/D" and goto):
+                return self._dest_name(value)
+            return value.unparse()
+        if isinstance(value, pikepdf.Array):
+            return b"[" + b" ".join(self.serialize(item) for item in value) + b"]"
+        if isinstance(value, (pikepdf.Dictionary, pikepdf.Stream)):
+            return self._serialize_dict(value)
+        return value.unparse()
+
+    def _serialize_dict(self, value, skip=("/Length",)):
+        is_goto = value.get("/S") == "/GoTo"
+        parts = [b"<<"]
+        for key, item in sorted(value.items()):
+            if isinstance(value, self.pikepdf.Stream) and key in skip:
+                continue
+            parts.append(b" " + self.pikepdf.Name(key).unparse() + b" " + self.serialize(item, key, is_goto))
+        parts.append(b" >>")
+        return b"".join(parts)
+
+    def _dest_name(self, value):
+        if isinstance(value, self.pikepdf.Name):
+            return self.pikepdf.Name("/" + self.prefix + str(value)[1:]).unparse()
+        return self.pikepdf.Name("/" + self.prefix + str(value)).unparse()
+
+    def copy_object(self, obj):
+        """간접 객체를 출력에 쓰고 새 번호 반환 (순환 참조가 있으면 중복 제거 없이 번호를 먼저 정함)"""
+
+        objgen = obj.objgen
+        if objgen in self._numbers:
+            return self._numbers[objgen]
+
+        if objgen in self._in_progress:
+            # 순환 참조: 번호를 먼저 정하고 바깥 호출에서 이 번호로 씀
+            number = self.writer._allocate()
+            self._numbers[objgen] = number
+            return number
+
+        self._in_progress.add(objgen)
+        try:
+            if isinstance(obj, self.pikepdf.Stream):
+                data = obj.read_raw_bytes()
+                body = self._serialize_dict(obj)
+                body = body[:-2] + f"/Length {len(data)} >>".encode('ascii')
+            else:
+                data = None
+                body = self.serialize_direct(obj)
+        finally:
+            self._in_progress.discard(objgen)
+
+        if objgen in self._numbers:
+            # 순환 참조로 번호가 먼저 정해진 객체
+            number = self._numbers[objgen]
+            self.writer._write_object(number, body, data)
+            return number
+
+        digest = None
+        if self.writer.dedupe and is_dedupe_candidate(obj):
+            digest = hashlib.sha256(body + b"\0" + (data or b"")).digest()
+            if digest in self.writer._digests:
+                self.writer.duplicates += 1
+                number = self._numbers[objgen] = self.writer._digests[digest]
+                return number
+
+        number = self._numbers[objgen] = self.writer._allocate()
+        self.writer._write_object(number, body, data)
+        if digest is not None:
+            self.writer._digests[digest] = number
+        return number
+
+    def serialize_direct(self, obj):
+        """간접 객체 자체의 내용을 직렬화 (자기 자신을 참조로 바꾸지 않음)"""
+
+        pikepdf = self.pikepdf
+        if isinstance(obj, pikepdf.Dictionary):
+            return self._serialize_dict(obj)
+        if isinstance(obj, pikepdf.Array):
+            return b"[" + b" ".join(self.serialize(item) for item in obj) + b"]"
+        return obj.unparse()
+
+    def copy_dests(self):
+        """원본의 이름 있는 목적지(/Dests 사전, /Names /Dests 트리)를 접두어를 붙여 옮김"""
+
+        pikepdf = self.pikepdf
+        root = self.pdf.Root
+        entries = []
+        if "/Dests" in root:
+            entries.extend(root.Dests.items())
+        names = root.get("/Names")
+        if names is not None and "/Dests" in names:
+            entries.extend(pikepdf.NameTree(names.Dests).items())
+
+        for name, dest in entries:
+            if isinstance(dest, pikepdf.Dictionary):
+                dest = dest.get("/D")
+            if not isinstance(dest, pikepdf.Array) or len(dest) == 0:
+                continue
+            page = dest[0]
+            if not (isinstance(page, pikepdf.Object) and page.is_indirect and page.objgen in self._pages):
+                continue
+            key = self._dest_name(pikepdf.Name("/" + str(name).lstrip("/")))
+            self.writer._dests[key] = self.serialize(dest)
+
+    def _dest_page(self, item):
+        """책갈피 항목이 가리키는 출력 페이지 번호 (찾을 수 없으면 None)"""
+
+        pikepdf = self.pikepdf
+        dest = item.destination
+        if dest is None and item.action is not None and item.action.get("/S") == "/GoTo":
+            dest = item.action.get("/D")
+        if isinstance(dest, (pikepdf.Name, pikepdf.String)):
+            name = str(dest).lstrip("/")
+            root = self.pdf.Root
+            resolved = None
+            if "/Dests" in root and "/" + name in root.Dests:
+                resolved = root.Dests["/" + name]
+            elif "/Names" in root and "/Dests" in root.Names:
+                resolved = pikepdf.NameTree(root.Names.Dests).get(name)
+            dest = resolved.get("/D") if isinstance(resolved, pikepdf.Dictionary) else resolved
+        if isinstance(dest, pikepdf.Array) and len(dest) > 0:
+            page = dest[0]
+            if isinstance(page, pikepdf.Object) and page.is_indirect:
+                return self._numbers.get(page.objgen)
+            if isinstance(page, int) and page < len(self.pdf.pages):
+                return self._numbers.get(self.pdf.pages[page].obj.objgen)
+        return None
+
+    def outline_items(self):
+        """원본 책갈피를 출력 페이지 기준 _OutlineItem 목록으로 변환"""
+
+        def convert(items):
+            converted = []
+            for item in items:
+                page_number = self._dest_page(item)
+                children = convert(item.children)
+                if page_number is None:
+                    # 목적지가 없는 항목은 하위 항목만 살림
+                    converted.extend(children)
+                    continue
+                converted.append(_OutlineItem(item.title, page_number, children))
+            return converted
+
+        with self.pdf.open_outline() as outline:
+            return convert(outline.root)
+
+def merge_pdfs(sources, output_file, titles=None, dedupe=True):
+    """여러 PDF를 순서대로 합쳐 output_file에 쓰고 보고서 반환
+
+    sources: 파일 경로/바이트/스트림의 이터러블 (생성기를 넘기면 렌더링하면서 바로 합칠 수 있음)
+    titles: 원본별 책갈피 제목 목록 (없으면 파일 이름)
+    """
+
+    titles = list(titles) if titles is not None else []
+    pages = 0
+    with PdfMergeWriter(output_file, dedupe=dedupe) as writer:
+        for index, source in enumerate(sources):
+            pages += writer.add(source, titles[index] if index < len(titles) else None)
+    return {
+        "sources": writer.sources,
+        "pages": pages,
+        "objects": len(writer._offsets) - 1,
+        "duplicates_removed": writer.duplicates,
+        "bytes": writer._position,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 PDF를 하나의 책자로 합칩니다 (원본을 하나씩 스트리밍).")
+    parser.add_argument("inputs", nargs="+", help="합칠 PDF 파일 (순서대로)")
+    parser.add_argument("-o", "--output", required=True, help="결과 PDF 파일")
+    parser.add_argument("--title", action="append", default=[], help="원본별 책갈피 제목 (입력 순서대로 반복 지정)")
+    parser.add_argument("--no-dedupe", action="store_true", help="같은 폰트/이미지 객체 합치기 생략")
+    args = parser.parse_args(argv)
+
+    for path in args.inputs:
+        if not os.path.exists(path):
+            print(f"❌ {path} 파일을 찾을 수 없습니다.")
+            return 2
+
+    print(f"📚 PDF {len(args.inputs)}개를 합칩니다...")
+    try:
+        report = merge_pdfs(args.inputs, args.output, titles=args.title, dedupe=not args.no_dedupe)
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"✅ {report['pages']}페이지, {report['bytes']:,} bytes (중복 객체 {report['duplicates_removed']}개 생략)")
+    print(f"📁 파일 위치: {os.path.abspath(args.output)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
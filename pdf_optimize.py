@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF 결과물 용량 최적화 (playwright / weasyprint 출력 후처리)
+    - 폰트 서브셋: 임베드된 TrueType 폰트(Identity-H)를 본문에서 실제로 쓰는 글리프만 남기도록 줄임
+    - 중복 제거: 내용이 같은 스트림(폰트 파일, 이미지, Type3 글리프, 폼 XObject)과 폰트 객체를 하나로 합침
+    - 최적화 전/후 크기 보고
+
+pikepdf와 fontTools가 필요합니다: pip install pikepdf fonttools
+
+사용법:
+    python pdf_optimize.py 음원_마케팅_체험단_가로형.pdf [-o 최적화.pdf]
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import sys
+
+from render_output import deliver
+
+# 글리프 코드를 담고 있는 텍스트 표시 연산자
+_TEXT_OPERATORS = ("Tj", "TJ", "'", '"')
+
+def _is_type0_identity_truetype(font):
+    """Identity-H 인코딩 + CIDToGIDMap Identity인 TrueType(CIDFontType2) 폰트인지 확인"""
+
+    if font.get("/Subtype") != "/Type0" or font.get("/Encoding") != "/Identity-H":
+        return False
+    descendants = font.get("/DescendantFonts")
+    if not descendants:
+        return False
+    cid_font = descendants[0]
+    cid_to_gid = cid_font.get("/CIDToGIDMap")
+    descriptor = cid_font.get("/FontDescriptor")
+    return (cid_font.get("/Subtype") == "/CIDFontType2"
+            and (cid_to_gid is None or cid_to_gid == "/Identity")
+            and descriptor is not None and "/FontFile2" in descriptor)
+
+def _font_file(font):
+    return font.DescendantFonts[0].FontDescriptor.FontFile2
+
+class _GlyphUsage:
+    """콘텐츠 스트림을 따라가며 폰트별로 사용한 글리프 id를 모음"""
+
+    def __init__(self, pikepdf):
+        self.pikepdf = pikepdf
+        self.glyphs = {}  # FontFile2 objgen -> {gid}
+        self.seen_fonts = set()  # Tf로 실제 선택된 Type0 폰트 objgen
+        self._visited = set()
+
+    def scan_document(self, pdf):
+        for page in pdf.pages:
+            self.scan(page.obj, page.obj.get("/Resources"))
+            for annotation in page.obj.get("/Annots", []):
+                appearance = annotation.get("/AP")
+                normal = appearance.get("/N") if appearance is not None else None
+                if isinstance(normal, self.pikepdf.Stream):
+                    self.scan(normal, normal.get("/Resources"))
+
+    def scan(self, content, resources):
+        """content(페이지 또는 폼/패턴/글리프 스트림)를 resources 기준으로 해석"""
+
+        key = (content.objgen, resources.objgen if resources is not None and resources.is_indirect else id(resources))
+        if content.objgen != (0, 0) and key in self._visited:
+            return
+        self._visited.add(key)
+
+        resources = resources if resources is not None else self.pikepdf.Dictionary()
+        fonts = resources.get("/Font", {})
+        xobjects = resources.get("/XObject", {})
+        patterns = resources.get("/Pattern", {})
+        current_font = None
+
+        for operands, operator in self.pikepdf.parse_content_stream(content):
+            op = str(operator)
+            if op == "Tf":
+                current_font = fonts.get(str(operands[0]))
+                if current_font is not None:
+                    self._select_font(current_font, resources)
+            elif op in _TEXT_OPERATORS:
+                if current_font is None or not _is_type0_identity_truetype(current_font):
+                    continue
+                gids = self.glyphs.setdefault(_font_file(current_font).objgen, set())
+                strings = operands[0] if op == "TJ" else operands[-1:]
+                for item in strings:
+                    if isinstance(item, self.pikepdf.String):
+                        data = bytes(item)
+                        gids.update(int.from_bytes(data[i:i + 2], "big") for i in range(0, len(data) - 1, 2))
+            elif op == "Do":
+                xobject = xobjects.get(str(operands[0]))
+                if xobject is not None and xobject.get("/Subtype") == "/Form":
+                    self.scan(xobject, xobject.get("/Resources", resources))
+            elif op in ("scn", "SCN") and operands and isinstance(operands[-1], self.pikepdf.Name):
+                pattern = patterns.get(str(operands[-1]))
+                if isinstance(pattern, self.pikepdf.Stream) and pattern.get("/PatternType") == 1:
+                    self.scan(pattern, pattern.get("/Resources", resources))
+
+    def _select_font(self, font, resources):
+        if font.is_indirect:
+            self.seen_fonts.add(font.objgen)
+        if font.get("/Subtype") == "/Type3":
+            # Type3 글리프 안에서도 다른 폰트를 쓸 수 있음
+            for char_proc in font.get("/CharProcs", {}).values():
+                self.scan(char_proc, font.get("/Resources", resources))
+
+def subset_fonts(pdf):
+    """사용한 글리프만 남도록 TrueType 폰트 파일을 서브셋하고 서브셋한 폰트 수 반환"""
+
+    import pikepdf
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    usage = _GlyphUsage(pikepdf)
+    try:
+        usage.scan_document(pdf)
+    except pikepdf.PdfError:
+        # 해석할 수 없는 콘텐츠가 있으면 글리프 사용 정보를 믿을 수 없으므로 건너뜀
+        return 0
+
+    # 폰트 파일을 참조하는 Type0 폰트가 모두 콘텐츠에서 확인된 경우에만 서브셋
+    referenced_by = {}
+    for obj in pdf.objects:
+        if isinstance(obj, pikepdf.Dictionary) and obj.get("/Type") == "/Font" and _is_type0_identity_truetype(obj):
+            referenced_by.setdefault(_font_file(obj).objgen, []).append(obj)
+
+    count = 0
+    for objgen, fonts in referenced_by.items():
+        if not all(font.is_indirect and font.objgen in usage.seen_fonts for font in fonts):
+            continue
+
+        font_file = _font_file(fonts[0])
+        original = font_file.read_bytes()
+        try:
+            font = TTFont(io.BytesIO(original))
+            options = subset.Options()
+            # PDF의 글리프 코드가 곧 글리프 id이므로 id를 유지
+            options.retain_gids = True
+            options.notdef_outline = True
+            options.layout_features = []
+            options.name_IDs = ["*"]
+            subsetter = subset.Subsetter(options)
+            subsetter.populate(gids=sorted(usage.glyphs.get(objgen, set()) | {0}))
+            subsetter.subset(font)
+
+            output = io.BytesIO()
+            font.save(output)
+        except Exception:
+            # fontTools가 처리하지 못하는 폰트는 그대로 둠
+            continue
+
+        data = output.getvalue()
+        if len(data) < len(original):
+            font_file.write(data)
+            font_file.Length1 = len(data)
+            count += 1
+
+    return count
+
+def _canonical(obj, canonical_ids, depth=0):
+    """중복 비교용 객체 표현 (간접 참조는 대표 객체 번호로 표시)"""
+
+    import pikepdf
+
+    if depth and getattr(obj, "is_indirect", False):
+        return f"R{canonical_ids.get(obj.objgen, obj.objgen)}"
+    if isinstance(obj, pikepdf.Dictionary) or isinstance(obj, pikepdf.Stream):
+        items = obj.items()
+        return "<<" + " ".join(f"{key} {_canonical(value, canonical_ids, depth + 1)}"
+                               for key, value in sorted(items) if key != "/Length") + ">>"
+    if isinstance(obj, pikepdf.Array):
+        return "[" + " ".join(_canonical(item, canonical_ids, depth + 1) for item in obj) + "]"
+    if isinstance(obj, pikepdf.String):
+        return "(" + bytes(obj).hex() + ")"
+    return repr(obj)
+
+def is_dedupe_candidate(obj):
+    """중복 제거 대상인지 확인 (스트림, 폰트/폰트 설명/그래픽 상태 사전)"""
+
+    import pikepdf
+
+    if isinstance(obj, pikepdf.Stream):
+        return True
+    return isinstance(obj, pikepdf.Dictionary) and obj.get("/Type") in ("/Font", "/FontDescriptor", "/ExtGState")
+
+def deduplicate(pdf):
+    """내용이 같은 스트림/폰트 객체를 하나로 합치고 제거한 중복 수 반환"""
+
+    import pikepdf
+
+    canonical_ids = {}  # 중복 objgen -> 대표 objgen
+    representatives = {}  # objgen -> 대표 객체
+
+    # Type3 글리프 → 폰트처럼 참조 관계를 따라 중복이 드러나므로 변화가 없을 때까지 반복
+    while True:
+        seen = {}
+        changed = False
+        for obj in pdf.objects:
+            if not is_dedupe_candidate(obj) or obj.objgen in canonical_ids:
+                continue
+            digest = hashlib.sha256(_canonical(obj, canonical_ids).encode("utf-8"))
+            if isinstance(obj, pikepdf.Stream):
+                digest.update(obj.read_raw_bytes())
+            key = digest.hexdigest()
+
+            if key in seen:
+                canonical_ids[obj.objgen] = seen[key].objgen
+                changed = True
+            else:
+                seen[key] = obj
+                representatives[obj.objgen] = obj
+        if not changed:
+            break
+
+    if not canonical_ids:
+        return 0
+
+    def resolve(objgen):
+        while objgen in canonical_ids:
+            objgen = canonical_ids[objgen]
+        return representatives[objgen]
+
+    def replace_references(container):
+        if isinstance(container, (pikepdf.Dictionary, pikepdf.Stream)):
+            keys = list(container.keys())
+            for key in keys:
+                value = container[key]
+                if getattr(value, "is_indirect", False):
+                    if value.objgen in canonical_ids:
+                        container[key] = resolve(value.objgen)
+                elif isinstance(value, (pikepdf.Dictionary, pikepdf.Array)):
+                    replace_references(value)
+        elif isinstance(container, pikepdf.Array):
+            for index, value in enumerate(container):
+                if getattr(value, "is_indirect", False):
+                    if value.objgen in canonical_ids:
+                        container[index] = resolve(value.objgen)
+                elif isinstance(value, (pikepdf.Dictionary, pikepdf.Array)):
+                    replace_references(value)
+
+    for obj in pdf.objects:
+        if isinstance(obj, (pikepdf.Dictionary, pikepdf.Stream, pikepdf.Array)):
+            replace_references(obj)
+    replace_references(pdf.trailer)
+
+    # 참조가 끊긴 중복 객체는 저장할 때 빠짐
+    return len(canonical_ids)
+
+def optimize_pdf_bytes(data, subset=True, dedupe=True):
+    """PDF 바이트를 최적화하여 (결과 바이트, 보고서) 반환"""
+
+    try:
+        import pikepdf
+    except ImportError:
+        raise ImportError("PDF 최적화에는 pikepdf와 fonttools가 필요합니다: pip install pikepdf fonttools")
+
+    with pikepdf.open(io.BytesIO(data)) as pdf:
+        fonts_subset = subset_fonts(pdf) if subset else 0
+        duplicates = deduplicate(pdf) if dedupe else 0
+
+        output = io.BytesIO()
+        pdf.save(output, compress_streams=True, object_stream_mode=pikepdf.ObjectStreamMode.generate)
+
+    optimized = output.getvalue()
+    if len(optimized) >= len(data):
+        # 줄어들지 않았으면 원본 유지
+        optimized = data
+
+    report = {
+        "before_bytes": len(data),
+        "after_bytes": len(optimized),
+        "saved_bytes": len(data) - len(optimized),
+        "fonts_subset": fonts_subset,
+        "duplicates_removed": duplicates,
+    }
+    return optimized, report
+
+def optimize_pdf(input_file, output_file=None, subset=True, dedupe=True):
+    """PDF 파일을 최적화하여 output_file(없으면 원본 파일)에 쓰고 보고서 반환
+
+    output_file: 파일 경로 또는 바이너리 스트림
+    """
+
+    with open(input_file, 'rb') as f:
+        data = f.read()
+
+    optimized, report = optimize_pdf_bytes(data, subset=subset, dedupe=dedupe)
+    deliver(optimized, output_file if output_file is not None else input_file)
+    return report
+
+def format_report(report):
+    before = report["before_bytes"]
+    after = report["after_bytes"]
+    ratio = (1 - after / before) * 100 if before else 0.0
+    return (f"{before:,} bytes → {after:,} bytes ({ratio:.1f}% 감소, "
+            f"폰트 서브셋 {report['fonts_subset']}개, 중복 객체 {report['duplicates_removed']}개 제거)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PDF의 폰트를 서브셋하고 중복 객체를 합쳐 용량을 줄입니다.")
+    parser.add_argument("input", help="최적화할 PDF 파일")
+    parser.add_argument("-o", "--output", help="결과 파일 (기본: 원본 파일 덮어쓰기)")
+    parser.add_argument("--no-subset", action="store_true", help="폰트 서브셋 생략")
+    parser.add_argument("--no-dedupe", action="store_true", help="중복 객체 제거 생략")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        print(f"❌ {args.input} 파일을 찾을 수 없습니다.")
+        return 2
+
+    print(f"🔧 PDF 최적화를 시작합니다: {args.input}")
+    try:
+        report = optimize_pdf(args.input, args.output, subset=not args.no_subset, dedupe=not args.no_dedupe)
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"✅ {format_report(report)}")
+    print(f"📁 파일 위치: {os.path.abspath(args.output or args.input)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF 렌더링 백엔드 레지스트리
+작업마다 정책에 따라 시도할 백엔드 순서를 정하고, weasyprint, pdfkit(wkhtmltopdf), playwright(Chromium)의
+사용 가능 여부는 대체(fallback) 순서에서 해당 백엔드 차례가 왔을 때 처음 한 번만 확인합니다.
+(앞선 백엔드가 성공하면 뒤 백엔드는 가져오지도 않음)
+실패하면 import 시도나 HTML 파일 읽기를 반복하지 않고 바로 다음 백엔드로 넘어갑니다.
+브라우저 실행에 실패한 playwright는 프로세스 안에서 사용할 수 없는 것으로 기록하고,
+렌더링에 연속으로 FAILURE_LIMIT번 실패한 백엔드는 레지스트리에서 더 이상 시도하지 않습니다.
+
+정책:
+    fastest  - 문서당 평균 렌더링 시간이 짧은 순서 (benchmark.py 결과 파일이 있으면 초기값으로 사용하고,
+               렌더링할 때마다 측정값으로 갱신)
+    faithful - 브라우저 화면과 가까운 순서 (playwright → weasyprint → pdfkit)
+    explicit - backends로 지정한 순서 그대로 (기본: weasyprint → pdfkit → playwright)
+
+사용법:
+    python render_backends.py     # 백엔드 상태와 정책별 순서 출력
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+from render_output import deliver
+from render_trace import get_tracer
+
+BACKENDS = ("weasyprint", "pdfkit", "playwright")
+DEFAULT_ORDER = ("weasyprint", "pdfkit", "playwright")
+FIDELITY_ORDER = ("playwright", "weasyprint", "pdfkit")
+POLICIES = ("fastest", "faithful", "explicit")
+
+# 측정값이 없을 때 사용하는 문서당 예상 렌더링 시간(초)
+DEFAULT_COSTS = {"weasyprint": 2.0, "pdfkit": 1.5, "playwright": 3.0}
+
+# 측정 시간 지수 이동 평균의 새 값 가중치
+COST_SMOOTHING = 0.3
+
+# 연속으로 이만큼 렌더링에 실패한 백엔드는 건너뜀 (느린 실패가 매 작업을 늦추지 않도록)
+FAILURE_LIMIT = 2
+
+# benchmark.py가 기본으로 쓰는 결과 파일
+BENCHMARK_RESULTS = "benchmark_results.json"
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class NoBackendAvailable(Exception):
+    """모든 후보 백엔드가 없거나 실패함 (errors: [(백엔드, 원인)])"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        details = ", ".join(f"{name}: {reason}" for name, reason in errors) or "후보 백엔드 없음"
+        super().__init__(f"PDF를 만들 수 있는 백엔드가 없습니다 ({details})")
+
+class BackendProbe:
+    """백엔드 사용 가능 여부 확인 결과 (handle: 확인하면서 얻은 재사용 객체)"""
+
+    def __init__(self, name, available, reason=None, handle=None, seconds=0.0):
+        self.name = name
+        self.available = available
+        self.reason = reason
+        self.handle = handle
+        self.seconds = seconds
+
+def _probe_weasyprint():
+    # 파이썬 패키지가 있어도 pango 등 시스템 라이브러리가 없으면 OSError 발생
+    import weasyprint  # noqa: F401
+    return None
+
+def _probe_pdfkit():
+    import pdfkit
+    # wkhtmltopdf 실행 파일이 없으면 OSError 발생
+    return pdfkit.configuration()
+
+def _probe_playwright():
+    # Chromium을 미리 실행해 보면 콜드 스타트 비용이 드므로 패키지만 확인하고,
+    # 브라우저 설치 여부는 첫 렌더링이 확인함 (실행 실패는 렌더링 실패로 처리되어 다음 백엔드로 넘어감)
+    import playwright.sync_api  # noqa: F401
+    return None
+
+_PROBES = {
+    "weasyprint": _probe_weasyprint,
+    "pdfkit": _probe_pdfkit,
+    "playwright": _probe_playwright,
+}
+
+_probe_results = {}
+_probe_lock = threading.Lock()
+
+def probe(name, refresh=False):
+    """백엔드 사용 가능 여부 (프로세스당 한 번만 확인하고 캐시)"""
+
+    if name not in _PROBES:
+        raise ValueError(f"알 수 없는 백엔드: {name} (가능: {', '.join(BACKENDS)})")
+
+    with _probe_lock:
+        if refresh or name not in _probe_results:
+            started = time.perf_counter()
+            try:
+                result = BackendProbe(name, True, handle=_PROBES[name]())
+            except Exception as e:
+                result = BackendProbe(name, False, reason=f"{type(e).__name__}: {e}".splitlines()[0])
+            result.seconds = time.perf_counter() - started
+            _probe_results[name] = result
+        return _probe_results[name]
+
+def mark_unavailable(name, error):
+    """확인은 통과했지만 실제로 쓸 수 없는 백엔드 기록 (예: playwright는 있지만 Chromium 실행 실패)"""
+
+    with _probe_lock:
+        _probe_results[name] = BackendProbe(name, False, reason=f"{type(error).__name__}: {error}".splitlines()[0])
+
+def probe_all(refresh=False):
+    """모든 백엔드의 확인 결과 {이름: BackendProbe}"""
+
+    return {name: probe(name, refresh) for name in BACKENDS}
+
+def load_measured_costs(results_file=None):
+    """benchmark.py 결과 파일에서 1배 문서의 p50 시간을 읽어 {백엔드: 초} 반환 (파일이 없으면 빈 사전)"""
+
+    results_file = results_file or os.path.join(_BASE_DIR, BENCHMARK_RESULTS)
+    try:
+        with open(results_file, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    costs = {}
+    for result in report.get("results", []):
+        if (result.get("backend") in BACKENDS and result.get("scale") == 1
+                and result.get("status") == "ok" and result.get("p50_seconds")):
+            costs[result["backend"]] = result["p50_seconds"]
+    return costs
+
+class BackendRegistry:
+    """백엔드 선택과 대체(fallback)를 담당하는 레지스트리
+
+    - tracer: 단계별 시간을 기록할 render_trace.Tracer
+    - costs: 백엔드별 예상 시간(초) 초기값 (없으면 벤치마크 결과 → DEFAULT_COSTS 순서로 사용)
+    - verbose: 백엔드 시도/실패를 출력
+    - pool: playwright 백엔드가 사용할 BrowserPool (없으면 처음 필요할 때 실행하고 close()에서 종료)
+
+    playwright 브라우저 풀을 공유하므로 레지스트리 하나는 한 스레드에서만 사용해야 합니다.
+    """
+
+    def __init__(self, tracer=None, costs=None, verbose=False, pool=None):
+        self.tracer = get_tracer(tracer)
+        self.verbose = verbose
+        self.costs = {**DEFAULT_COSTS, **load_measured_costs(), **(costs or {})}
+        self.failures = {name: 0 for name in BACKENDS}  # 연속 실패 횟수 (성공하면 0)
+        self._pool = pool
+        self._own_pool = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._own_pool and self._pool is not None:
+            self._pool.close()
+        if self._own_pool:
+            self._pool = None
+            self._own_pool = False
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            from browser_pool import BrowserPool
+            self._pool = BrowserPool(size=1, tracer=self.tracer).start()
+            self._own_pool = True
+        return self._pool
+
+    def order(self, policy="fastest", backends=None):
+        """정책에 따른 시도 순서 (사용할 수 없는 백엔드는 제외, 모든 후보를 확인함)"""
+
+        return [name for name in self.ranked(policy, backends) if self._probe(name).available]
+
+    def ranked(self, policy="fastest", backends=None):
+        """정책에 따른 시도 순서 (사용 가능 여부는 확인하지 않음)"""
+
+        if policy not in POLICIES:
+            raise ValueError(f"알 수 없는 정책: {policy} (가능: {', '.join(POLICIES)})")
+
+        requested = list(backends) if backends else list(DEFAULT_ORDER)
+        for name in requested:
+            if name not in BACKENDS:
+                raise ValueError(f"알 수 없는 백엔드: {name} (가능: {', '.join(BACKENDS)})")
+
+        if policy == "fastest":
+            requested.sort(key=lambda name: self.costs[name])
+        elif policy == "faithful":
+            requested.sort(key=FIDELITY_ORDER.index)
+
+        return requested
+
+    def _probe(self, name):
+        with self.tracer.span("backend.probe", backend=name) as span:
+            result = probe(name)
+            span["available"] = result.available
+        return result
+
+    def _record_cost(self, name, seconds):
+        self.costs[name] = (1 - COST_SMOOTHING) * self.costs[name] + COST_SMOOTHING * seconds
+
+    def render(self, html_file, output_file=None, policy="fastest", backends=None):
+        """HTML 파일을 PDF로 렌더링하고 (사용한 백엔드, 결과) 반환
+
+        output_file: 파일 경로, 바이너리 스트림, 또는 None (None이면 결과로 PDF 바이트 반환)
+        백엔드 사용 가능 여부는 차례가 왔을 때 확인하며, 모든 후보가 실패하면 NoBackendAvailable 발생
+        """
+
+        errors = []
+        html_file = os.path.abspath(html_file)
+        html_content = None
+
+        for name in self.ranked(policy, backends):
+            result = self._probe(name)
+            if not result.available:
+                errors.append((name, result.reason))
+                continue
+            if self.failures[name] >= FAILURE_LIMIT:
+                errors.append((name, f"연속 {self.failures[name]}회 실패하여 건너뜀"))
+                continue
+
+            if self.verbose:
+                print(f"📄 {name}를 사용하여 PDF를 생성합니다...")
+
+            started = time.perf_counter()
+            try:
+                with self.tracer.span("backend.attempt", backend=name, policy=policy):
+                    if name == "weasyprint":
+                        # HTML은 한 번만 읽어 두고 재사용
+                        if html_content is None:
+                            with open(html_file, 'r', encoding='utf-8') as f:
+                                html_content = f.read()
+                        pdf_bytes = self._render_weasyprint(html_file, html_content)
+                    elif name == "pdfkit":
+                        pdf_bytes = self._render_pdfkit(html_file)
+                    else:
+                        pdf_bytes = self._render_playwright(html_file)
+            except Exception as e:
+                self.failures[name] += 1
+                errors.append((name, f"{type(e).__name__}: {e}".splitlines()[0]))
+                if self.verbose:
+                    print(f"❌ {name}로 PDF 생성 실패: {e}")
+                continue
+
+            self.failures[name] = 0
+            self._record_cost(name, time.perf_counter() - started)
+            # 실패한 백엔드가 출력 파일을 반쯤 쓰지 않도록 성공한 결과만 전달
+            return name, deliver(pdf_bytes, output_file)
+
+        raise NoBackendAvailable(errors)
+
+    def _render_weasyprint(self, html_file, html_content):
+        from create_pdf import render_pdf_with_weasyprint
+        return render_pdf_with_weasyprint(html_file, tracer=self.tracer, html_content=html_content)
+
+    def _render_pdfkit(self, html_file):
+        from create_pdf import render_pdf_with_pdfkit
+        return render_pdf_with_pdfkit(html_file, tracer=self.tracer, configuration=probe("pdfkit").handle)
+
+    def _render_playwright(self, html_file):
+        from create_pdf import _render_with_pool
+
+        try:
+            pool = self.pool
+        except Exception as e:
+            # Chromium이 설치되지 않았으면 이후 작업에서도 실행을 다시 시도하지 않음
+            mark_unavailable("playwright", e)
+            raise
+        return _render_with_pool(pool, html_file, tracer=self.tracer)
+
+def main():
+    print("🔍 PDF 렌더링 백엔드 상태를 확인합니다...")
+
+    for name, result in probe_all().items():
+        if result.available:
+            print(f"✅ {name} (확인 {result.seconds:.2f}초)")
+        else:
+            print(f"❌ {name}: {result.reason}")
+
+    registry = BackendRegistry()
+    print("\n📊 예상 시간(초): " + ", ".join(f"{name} {registry.costs[name]:.2f}" for name in BACKENDS))
+    for policy in POLICIES:
+        order = registry.order(policy)
+        print(f"   {policy}: {' → '.join(order) if order else '(사용 가능한 백엔드 없음)'}")
+
+    return 0 if any(result.available for result in probe_all().values()) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더링 결과(PDF/PPTX) 캐시
+입력 HTML, 연결된 로컬 리소스(CSS/JS/이미지/폰트), 렌더링 스크립트 소스(주입 CSS와 페이지 옵션 포함),
+렌더러 라이브러리 버전을 모두 해시한 키로 결과 파일을 디스크에 저장합니다.
+입력이 바뀌지 않은 문서는 렌더링 없이 캐시에서 바로 복사합니다.
+
+캐시 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다(LRU).
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import stat
+import sys
+import tempfile
+
+# 캐시 형식이 바뀌면 올려서 기존 항목을 무효화
+CACHE_VERSION = "1"
+
+DEFAULT_CACHE_DIR = ".render_cache"
+
+# 캐시 항목 파일 이름 ({sha256}{확장자}) - 같은 폴더의 다른 파일/폴더는 건드리지 않음
+_ENTRY_NAME = re.compile(r'^[0-9a-f]{64}(\.[A-Za-z0-9]+)?$')
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024  # 500MB
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 프로필별 렌더링 스크립트(주입 CSS, 페이지 옵션이 들어 있음)와 렌더러 패키지
+# (오프라인 리소스 제공(asset_resolver)과 CSS 번들(css_bundle)도 결과에 영향을 주므로 포함)
+PROFILE_SOURCES = {
+    "portrait": (["simple_pdf.py", "render_ready.py", "asset_resolver.py"], "playwright"),
+    "landscape": (["landscape_pdf.py", "render_ready.py", "asset_resolver.py", "css_bundle.py"], "playwright"),
+    "weasyprint": (["create_pdf.py", "css_bundle.py"], "weasyprint"),
+    "pptx": (["create_ppt.py"], "python-pptx"),
+}
+
+PROFILE_EXTENSIONS = {
+    "portrait": ".pdf",
+    "landscape": ".pdf",
+    "weasyprint": ".pdf",
+    "pptx": ".pptx",
+}
+
+_HTML_REF_PATTERN = re.compile(r'''(?:href|src)\s*=\s*["']([^"']+)["']''', re.IGNORECASE)
+_CSS_REF_PATTERN = re.compile(r'''url\(\s*["']?([^"')]+)["']?\s*\)''', re.IGNORECASE)
+
+def is_local_reference(ref):
+    ref = ref.strip()
+    return bool(ref) and not (
+        ref.startswith(("#", "//", "data:", "mailto:", "tel:", "javascript:"))
+        or re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*://', ref)
+    )
+
+def collect_local_assets(html_file):
+    """HTML이 참조하는 로컬 리소스 파일 경로 목록 (CSS 안의 url()도 한 단계 포함)"""
+
+    base_dir = os.path.dirname(os.path.abspath(html_file))
+    with open(html_file, 'r', encoding='utf-8', errors='replace') as f:
+        html_content = f.read()
+
+    assets = []
+    seen = set()
+
+    def add(ref, relative_to):
+        path = os.path.normpath(os.path.join(relative_to, ref.split('#')[0].split('?')[0]))
+        if path not in seen and os.path.isfile(path):
+            seen.add(path)
+            assets.append(path)
+            return path
+        return None
+
+    for ref in _HTML_REF_PATTERN.findall(html_content):
+        if not is_local_reference(ref):
+            continue
+        path = add(ref, base_dir)
+        if path and path.lower().endswith('.css'):
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                for css_ref in _CSS_REF_PATTERN.findall(f.read()):
+                    if is_local_reference(css_ref):
+                        add(css_ref, os.path.dirname(path))
+
+    return sorted(assets)
+
+_package_versions = {}
+
+def package_version(name):
+    """설치된 패키지 버전 (없으면 "missing")"""
+
+    if name not in _package_versions:
+        _package_versions[name] = _find_package_version(name)
+    return _package_versions[name]
+
+def _find_package_version(name):
+    # importlib.metadata는 가져오는 데만 수십 ms가 걸리므로 먼저 sys.path의 *.dist-info 이름에서 찾음
+    prefix = re.sub(r'[-_.]+', '_', name).lower() + "-"
+    for entry in sys.path:
+        try:
+            names = os.listdir(entry or ".")
+        except OSError:
+            continue
+        for dist in names:
+            if dist.endswith(".dist-info") and dist.lower().startswith(prefix):
+                return dist[len(prefix):-len(".dist-info")]
+
+    from importlib import metadata
+
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "missing"
+
+def compute_key(profile, html_file=None, extra=None):
+    """렌더링 입력 전체에 대한 캐시 키(sha256 hex)"""
+
+    if profile not in PROFILE_SOURCES:
+        raise ValueError(f"알 수 없는 프로필: {profile}")
+
+    sources, package = PROFILE_SOURCES[profile]
+    digest = hashlib.sha256()
+
+    def update(label, data):
+        digest.update(label.encode('utf-8'))
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+
+    update("cache-version", CACHE_VERSION.encode())
+    update("profile", profile.encode())
+    update("renderer", f"{package}=={package_version(package)}".encode())
+
+    for source in sources:
+        with open(os.path.join(_BASE_DIR, source), 'rb') as f:
+            update(f"source:{source}", f.read())
+
+    if html_file is not None:
+        with open(html_file, 'rb') as f:
+            update("html", f.read())
+
+        base_dir = os.path.dirname(os.path.abspath(html_file))
+        for asset in collect_local_assets(html_file):
+            with open(asset, 'rb') as f:
+                update(f"asset:{os.path.relpath(asset, base_dir)}", f.read())
+
+    if extra:
+        update("extra", repr(sorted(extra.items())).encode())
+
+    return digest.hexdigest()
+
+class RenderCache:
+    """디스크 기반 렌더링 결과 캐시 (크기 기준 LRU 삭제, 적중/실패 통계)"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key, extension):
+        return os.path.join(self.cache_dir, f"{key}{extension}")
+
+    def key_for(self, profile, html_file=None, extra=None):
+        return compute_key(profile, html_file, extra)
+
+    def get(self, key, extension, output_file):
+        """캐시에 있으면 output_file로 복사하고 True, 없으면 False"""
+
+        path = self._path(key, extension)
+        try:
+            shutil.copyfile(path, output_file)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+
+        # LRU 순서를 위해 마지막 사용 시각 갱신
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return True
+
+    def contains(self, key, extension):
+        """캐시에 항목이 있는지 확인 (적중/실패 통계에는 반영하지 않음)"""
+
+        return os.path.exists(self._path(key, extension))
+
+    def read(self, key, extension):
+        """캐시에 있으면 저장된 바이트, 없으면 None"""
+
+        path = self._path(key, extension)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return data
+
+    def put(self, key, extension, source_file):
+        """렌더링된 파일을 캐시에 저장하고 필요하면 오래된 항목 삭제"""
+
+        self._store(key, extension, lambda temp_path: shutil.copyfile(source_file, temp_path))
+
+    def write(self, key, extension, data):
+        """렌더링된 바이트를 캐시에 저장하고 필요하면 오래된 항목 삭제"""
+
+        def write_data(temp_path):
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+
+        self._store(key, extension, write_data)
+
+    def _store(self, key, extension, fill):
+        path = self._path(key, extension)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            fill(temp_path)
+            # 여러 프로세스가 같은 캐시를 써도 반쯤 쓴 파일이 보이지 않도록 교체
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self.evict()
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not _ENTRY_NAME.match(name):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if not stat.S_ISREG(info.st_mode):
+                continue
+            entries.append((info.st_mtime, info.st_size, path))
+        return entries
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목 삭제"""
+
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        """적중/실패 횟수와 저장 크기"""
+
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+통합 렌더링 CLI (필요한 백엔드만 필요한 시점에 가져옴)
+시작할 때는 표준 라이브러리만 가져오고, 캐시에 없는 작업을 실제로 렌더링할 때만
+해당 프로필의 백엔드(playwright, weasyprint, python-pptx)를 가져오면서 걸린 시간을 보고합니다.
+캐시 적중과 --dry-run은 백엔드를 전혀 가져오지 않습니다.
+
+프로필: portrait, landscape, weasyprint, pptx (batch_render와 동일)
+
+사용법:
+    python render_cli.py landscape index.html -o 가로형.pdf [--cache-dir .render_cache]
+    python render_cli.py pptx -o 음원_마케팅_체험단.pptx
+    python render_cli.py portrait index.html -o out.pdf --dry-run
+"""
+
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse
+import importlib
+import os
+import sys
+
+from batch_render import PROFILES, BatchRenderer
+
+# 프로필별로 렌더링에 필요한 모듈 (가져오는 순서대로)
+BACKEND_MODULES = {
+    "portrait": ("playwright.sync_api", "simple_pdf"),
+    "landscape": ("playwright.sync_api", "landscape_pdf"),
+    "weasyprint": ("weasyprint", "create_pdf"),
+    "pptx": ("pptx", "create_ppt"),
+}
+
+DEFAULT_OUTPUTS = {
+    "portrait": "음원_마케팅_체험단.pdf",
+    "landscape": "음원_마케팅_체험단_가로형.pdf",
+    "weasyprint": "음원_마케팅_체험단.pdf",
+    "pptx": "음원_마케팅_체험단.pptx",
+}
+
+def import_backend(profile):
+    """프로필의 백엔드 모듈을 가져오고 [(모듈, 초)] 반환 (이미 가져온 모듈은 제외)"""
+
+    timings = []
+    for name in BACKEND_MODULES[profile]:
+        if name in sys.modules:
+            continue
+        started = time.perf_counter()
+        importlib.import_module(name)
+        timings.append((name, time.perf_counter() - started))
+    return timings
+
+def _ms(seconds):
+    return f"{seconds * 1000:.1f}ms"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTML을 PDF/PPTX로 변환합니다 (필요한 백엔드만 가져옴).")
+    parser.add_argument("profile", choices=PROFILES, help="렌더링 프로필")
+    parser.add_argument("input", nargs="?", default="index.html", help="입력 HTML (pptx는 사용하지 않음, 기본 index.html)")
+    parser.add_argument("-o", "--output", help="결과 파일 (기본: 프로필별 기본 파일명)")
+    parser.add_argument("--cache-dir", help="렌더링 캐시 폴더 (지정하지 않으면 캐시 사용 안 함)")
+    parser.add_argument("--optimize", action="store_true", help="PDF 폰트 서브셋/중복 객체 제거로 용량 줄이기")
+    parser.add_argument("--offline", action="store_true", help="외부 요청(폰트 CDN 등)을 막고 로컬 리소스만 사용")
+    parser.add_argument("--bundle-css", action="store_true", help="인쇄에 필요한 규칙만 남긴 CSS 번들 사용 (landscape/weasyprint)")
+    parser.add_argument("--dry-run", action="store_true", help="렌더링하지 않고 캐시 적중 여부와 가져올 백엔드만 출력")
+    args = parser.parse_args(argv)
+
+    job = {
+        "input": None if args.profile == "pptx" else os.path.abspath(args.input),
+        "output": args.output or DEFAULT_OUTPUTS[args.profile],
+        "profile": args.profile,
+    }
+    if job["input"] is not None and not os.path.exists(job["input"]):
+        print(f"❌ {args.input} 파일을 찾을 수 없습니다.")
+        return 2
+
+    cache = None
+    if args.cache_dir:
+        from render_cache import RenderCache
+        cache = RenderCache(args.cache_dir)
+
+    renderer = BatchRenderer(cache=cache, optimize=args.optimize, offline=args.offline, bundle_css=args.bundle_css)
+    entry = renderer.cache_entry(job)
+    cached = entry is not None and cache.contains(*entry)
+
+    if args.dry_run:
+        needed = [name for name in BACKEND_MODULES[args.profile] if name not in sys.modules]
+        print(f"🔍 {args.profile}: {job['input'] or '(입력 없음)'} → {job['output']}")
+        print(f"🗄️ 캐시: {'적중' if cached else '없음' if entry else '사용 안 함'}")
+        print(f"📦 가져올 백엔드: {'없음 (캐시 적중)' if cached else ', '.join(needed) or '없음'}")
+        print(f"⏱️ 준비 시간: {_ms(time.perf_counter() - _STARTED)}")
+        return 0
+
+    if not cached:
+        try:
+            for name, seconds in import_backend(args.profile):
+                print(f"📦 {name} 가져오기: {_ms(seconds)}")
+        except (ImportError, OSError) as e:
+            # weasyprint는 시스템 라이브러리(pango)가 없으면 OSError 발생
+            print(f"❌ {args.profile} 백엔드를 가져올 수 없습니다: {e}".splitlines()[0])
+            return 1
+
+    try:
+        with renderer:
+            renderer.render(job)
+    except Exception as e:
+        print(f"❌ 렌더링 중 오류가 발생했습니다: {e}")
+        return 1
+
+    source = " (캐시)" if cached else ""
+    print(f"✅ {job['output']}{source} - 총 {_ms(time.perf_counter() - _STARTED)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더링 결과 출력 도우미
+렌더링 함수의 출력 대상(output)은 다음 중 하나입니다.
+    - 파일 경로 (str / os.PathLike)
+    - 바이너리 스트림 (write()가 있는 객체: BytesIO, 소켓 파일, 업로드 스트림 등)
+    - None (결과를 bytes로 반환)
+"""
+
+def is_stream(output):
+    """쓰기 가능한 바이너리 스트림인지 확인"""
+    return hasattr(output, "write")
+
+def deliver(data, output=None):
+    """렌더링된 바이트를 출력 대상에 전달 (output이 None이면 바이트 반환, 아니면 None 반환)"""
+
+    if output is None:
+        return data
+
+    if is_stream(output):
+        output.write(data)
+    else:
+        with open(output, 'wb') as f:
+            f.write(data)
+    return None
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더 준비 신호 대기 도우미
+script.js는 load 이벤트, 히어로/카운터/스크롤 애니메이션, 폰트 로딩이 끝나면
+window.__renderReady를 true로 설정하고 'render-ready' 이벤트를 보냅니다.
+PDF 변환 스크립트는 고정 시간 대기 대신 이 신호를 기다립니다.
+
+렌더러는 PRINT_MODE_SCRIPT를 초기화 스크립트로 넣어 script.js의 인쇄/렌더 모드를 켭니다.
+인쇄 모드에서는 스크롤/애니메이션 처리를 건너뛰므로 load 이벤트와 폰트 로딩이 끝나면 바로 신호가 옵니다.
+
+렌더링 전체 시간 제한은 deadline_after로 마감 시각을 정하고, 각 playwright 호출에
+time_left_ms로 남은 시간을 timeout으로 넘겨 지킵니다.
+"""
+
+import time
+
+READY_EXPRESSION = "window.__renderReady === true"
+
+# page.add_init_script로 넣으면 script.js가 애니메이션 없이 최종 상태로 표시
+PRINT_MODE_SCRIPT = "window.__PRINT_MODE__ = true;"
+
+# 신호를 보내지 않는 페이지(script.js가 없는 HTML 등)를 위한 최대 대기 시간
+DEFAULT_TIMEOUT_MS = 5000
+
+def deadline_after(timeout):
+    """timeout초 뒤의 마감 시각 (time.monotonic() 기준, timeout이 None이면 None)"""
+
+    return None if timeout is None else time.monotonic() + timeout
+
+def time_left_ms(deadline, limit=None):
+    """마감 시각까지 남은 밀리초 (limit보다 길면 limit, deadline이 None이면 limit)
+
+    이미 마감을 넘겼으면 TimeoutError 발생 (playwright는 timeout=0을 '제한 없음'으로 취급하므로 0을 넘기지 않음)
+    """
+
+    if deadline is None:
+        return limit
+    left = (deadline - time.monotonic()) * 1000
+    if left <= 0:
+        raise TimeoutError("렌더링 시간 제한을 넘었습니다")
+    return left if limit is None else min(left, limit)
+
+def wait_for_render_ready(page, timeout=DEFAULT_TIMEOUT_MS):
+    """렌더 준비 신호를 기다림 (신호가 오면 True, 시간 초과 시 False를 반환하고 그대로 진행)"""
+
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        page.wait_for_function(READY_EXPRESSION, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+async def async_wait_for_render_ready(page, timeout=DEFAULT_TIMEOUT_MS):
+    """wait_for_render_ready의 playwright.async_api 버전"""
+
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        await page.wait_for_function(READY_EXPRESSION, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더링 HTTP 서비스 (표준 라이브러리 ThreadingHTTPServer)
+요청마다 `python landscape_pdf.py`를 실행하는 대신, 브라우저를 띄워 둔 워커 스레드들이
+작업 큐에서 HTML을 꺼내 PDF/PPTX로 변환합니다.
+
+- 워커 스레드마다 자기 브라우저 풀을 가짐 (playwright sync API는 스레드를 넘나들 수 없음)
+- 작업 큐 크기 제한: 가득 차면 바로 429 Too Many Requests (Retry-After 포함)
+- 작업별 시간 제한: 넘으면 504 Gateway Timeout
+  playwright 단계(페이지 로드, 대기)에는 남은 시간을 timeout으로 넘겨 렌더링 자체를 멈추고,
+  시간 제한이 없는 단계(page.pdf, weasyprint, pptx)에서 멈춘 워커는 새 워커로 대신한 뒤
+  작업이 실제로 끝나면 종료 (끝날 때까지 처리 중인 작업으로 집계)
+- GET /metrics: 큐 길이, 처리 중인 작업 수, 프로필별 처리 시간(p50/p95/p99) 등 JSON
+- 네트워크 없이 렌더링: 요청 HTML과 --base-dir의 리소스만 가상 주소 http://render.local/ 에서 제공하고
+  외부 요청(폰트 CDN 등)은 빈 응답으로 대체하거나(--external stub) 차단(--external block), 또는 허용(--external allow)
+  weasyprint 프로필도 같은 처리기를 거치므로 --base-dir 밖의 로컬 파일은 읽지 않음
+
+요청:
+    POST /render?profile=landscape   (본문: HTML, profile: portrait/landscape/weasyprint/pptx)
+    GET  /metrics
+    GET  /healthz
+
+본문 HTML은 파일로 쓰지 않고 --base-dir(기본: 이 스크립트 폴더)에 있는 것처럼 제공하므로
+styles.css, script.js 같은 상대 경로 리소스를 그대로 사용할 수 있습니다.
+단, --base-dir의 파일 중 --site-page(기본 index.html)가 참조하는 로컬 리소스만 제공하고
+그 밖의 파일(소스 코드, .git 등)은 404로 응답합니다. pptx 프로필은 본문을 쓰지 않습니다.
+
+사용법:
+    python render_service.py [--port 8000] [--workers 2] [--max-pending 8] [--timeout 60]
+    curl --data-binary @index.html "http://127.0.0.1:8000/render?profile=landscape" -o out.pdf
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from asset_resolver import EXTERNAL_POLICIES, AssetResolver
+from batch_render import PROFILES
+from render_trace import get_tracer
+
+DEFAULT_PORT = 8000
+DEFAULT_JOB_TIMEOUT = 60  # 초
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024  # 10MB
+DEFAULT_SITE_PAGE = "index.html"
+
+# 지연 시간 통계에 사용할 프로필별 최근 작업 수
+LATENCY_WINDOW = 1000
+
+CONTENT_TYPES = {
+    "portrait": "application/pdf",
+    "landscape": "application/pdf",
+    "weasyprint": "application/pdf",
+    "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+}
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class QueueFull(Exception):
+    """작업 큐가 가득 참 (429)"""
+
+class JobTimeout(Exception):
+    """작업이 시간 제한 안에 끝나지 않음 (504)"""
+
+class ServiceClosed(Exception):
+    """서비스가 종료되어 작업을 처리할 수 없음 (503)"""
+
+class _Job:
+    """큐에 들어가는 렌더링 작업 하나"""
+
+    def __init__(self, profile, html, timeout):
+        self.profile = profile
+        self.html = html
+        self.enqueued = time.perf_counter()
+        self.deadline = self.enqueued + timeout
+        self.started = None
+        self.replaced = False  # 시간 제한을 넘겨 다른 워커가 대신하고 있음
+        self.done = threading.Event()
+        self.cancelled = False
+        self.result = None
+        self.error = None
+
+def site_assets(base_dir, site_page):
+    """site_page가 참조하는 base_dir 안의 로컬 리소스 경로 목록 (페이지가 없으면 빈 목록)"""
+
+    from asset_resolver import is_within
+    from render_cache import collect_local_assets
+
+    page = os.path.join(base_dir, site_page)
+    if not os.path.isfile(page):
+        return []
+    return [path for path in collect_local_assets(page) if is_within(path, base_dir)]
+
+def _percentile(values, percent):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return round(ordered[index], 4)
+
+class RenderService:
+    """워커 스레드와 작업 큐를 관리하는 렌더링 서비스
+
+    - workers: 워커 스레드 수 (스레드마다 브라우저 하나)
+    - max_pending: 워커를 기다릴 수 있는 최대 작업 수 (넘으면 QueueFull)
+    - job_timeout: 큐 대기 시간을 포함한 작업 하나의 최대 소요 시간(초)
+    - max_renders: 워커별 브라우저 재시작 전 최대 렌더링 수
+    - base_dir: 요청 HTML의 상대 경로 리소스 기준 폴더
+    - site_page: base_dir에서 제공할 리소스를 정하는 페이지 (이 페이지가 참조하는 로컬 리소스만 제공)
+    - warm: 시작할 때 워커마다 브라우저를 미리 실행
+    - external: 외부 요청 처리 방식 (asset_resolver.EXTERNAL_POLICIES)
+    """
+
+    def __init__(self, workers=2, max_pending=8, job_timeout=DEFAULT_JOB_TIMEOUT, max_renders=100,
+                 base_dir=_BASE_DIR, warm=True, tracer=None, external="stub", site_page=DEFAULT_SITE_PAGE):
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다.")
+
+        self.workers = workers
+        self.max_pending = max_pending
+        self.job_timeout = job_timeout
+        self.max_renders = max_renders
+        self.base_dir = base_dir
+        self.allowed_assets = site_assets(base_dir, site_page)
+        self.warm = warm
+        self.tracer = get_tracer(tracer)
+        self.external = external
+
+        self._jobs = queue.Queue(maxsize=max_pending)
+        self._stopping = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stuck = 0  # 시간 제한을 넘긴 작업을 아직 처리 중인 (대체된) 워커 수
+        self._next_worker_id = workers
+        self._counters = {"accepted": 0, "completed": 0, "failed": 0, "rejected": 0, "timed_out": 0}
+        self._latency = {profile: deque(maxlen=LATENCY_WINDOW) for profile in PROFILES}
+        self._queue_wait = deque(maxlen=LATENCY_WINDOW)
+        self._started_at = None
+
+    def start(self):
+        for worker_id in range(self.workers):
+            self._spawn_worker(worker_id)
+        self._started_at = time.time()
+        return self
+
+    def _spawn_worker(self, worker_id):
+        thread = threading.Thread(target=self._worker_main, args=(worker_id,),
+                                  name=f"render-worker-{worker_id}", daemon=True)
+        thread.start()
+        with self._lock:
+            self._threads.append(thread)
+
+    def close(self):
+        # 큐가 가득 차 있어도 막히지 않도록 종료는 Event로 알리고, 대기 중인 작업은 바로 실패 처리
+        self._stopping.set()
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                self._fail_closed(job)
+
+        with self._lock:
+            threads, self._threads = self._threads, []
+        # 큐에서 기다리는 워커를 깨움 (그 사이 큐가 다시 찼으면 워커가 꺼낸 작업에서 종료를 확인함)
+        for _ in threads:
+            try:
+                self._jobs.put_nowait(None)
+            except queue.Full:
+                break
+        for thread in threads:
+            thread.join(timeout=self.job_timeout)
+
+    @staticmethod
+    def _fail_closed(job):
+        job.error = ServiceClosed("렌더링 서비스가 종료되었습니다")
+        job.done.set()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, profile, html=None):
+        """작업을 큐에 넣고 끝날 때까지 기다려 결과 바이트 반환
+
+        큐가 가득 차면 QueueFull, 시간 제한을 넘기면 JobTimeout, 종료 중이면 ServiceClosed,
+        렌더링 실패 시 해당 예외 발생
+        """
+
+        if profile not in PROFILES:
+            raise ValueError(f"알 수 없는 프로필: {profile} (가능: {', '.join(PROFILES)})")
+        if profile != "pptx" and not html:
+            raise ValueError("HTML 본문이 비어 있습니다.")
+
+        if self._stopping.is_set():
+            raise ServiceClosed("렌더링 서비스가 종료되었습니다")
+
+        job = _Job(profile, html, self.job_timeout)
+        try:
+            self._jobs.put_nowait(job)
+        except queue.Full:
+            self._count("rejected")
+            raise QueueFull(f"작업 큐가 가득 찼습니다 (최대 {self.max_pending}건)")
+        self._count("accepted")
+
+        if not job.done.wait(self.job_timeout):
+            # 아직 큐에 있으면 워커가 건너뛰고, 처리 중이면 결과를 버리고 워커를 대신함
+            job.cancelled = True
+            self._count("timed_out")
+            self._replace_worker(job)
+            raise JobTimeout(f"{self.job_timeout}초 안에 렌더링이 끝나지 않았습니다")
+
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _replace_worker(self, job):
+        """처리 중에 시간 제한을 넘긴 작업의 워커 대신 새 워커를 띄움 (멈춘 워커는 작업이 끝나면 종료)
+
+        멈춘 워커가 workers개를 넘으면 더 띄우지 않음 (스레드/브라우저가 끝없이 늘지 않도록)
+        """
+
+        with self._lock:
+            if job.started is None or job.done.is_set() or self._stuck >= self.workers:
+                return
+            job.replaced = True
+            self._stuck += 1
+            worker_id = self._next_worker_id
+            self._next_worker_id += 1
+        self._spawn_worker(worker_id)
+
+    def _worker_main(self, worker_id):
+        pool = None
+        weasy_renderer = None
+
+        def get_pool():
+            nonlocal pool
+            if pool is None:
+                from browser_pool import BrowserPool
+                pool = BrowserPool(size=1, max_renders=self.max_renders, tracer=self.tracer).start()
+            return pool
+
+        def get_weasy_renderer():
+            # 워커마다 따로 두어 멈춘 렌더링이 다른 워커의 렌더러 잠금을 붙잡지 않도록 함
+            nonlocal weasy_renderer
+            if weasy_renderer is None:
+                from create_pdf import WeasyRenderer
+                resolver = AssetResolver(self.base_dir, external=self.external, allowed=self.allowed_assets)
+                weasy_renderer = WeasyRenderer(tracer=self.tracer, resolver=resolver)
+            return weasy_renderer
+
+        if self.warm:
+            # 실패해도 작업별로 다시 시도하고 오류를 응답으로 돌려줌
+            try:
+                get_pool()
+            except Exception:
+                pass
+
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                if self._stopping.is_set():
+                    self._fail_closed(job)
+                    break
+                if job.cancelled or time.perf_counter() >= job.deadline:
+                    continue
+
+                with self._lock:
+                    job.started = time.perf_counter()
+                    self._in_flight += 1
+                    self._queue_wait.append(job.started - job.enqueued)
+
+                try:
+                    job.result = self._render(job, get_pool, get_weasy_renderer)
+                except Exception as e:
+                    job.error = e
+                finally:
+                    elapsed = time.perf_counter() - job.started
+                    with self._lock:
+                        self._in_flight -= 1
+                        self._counters["failed" if job.error is not None else "completed"] += 1
+                        self._latency[job.profile].append(elapsed)
+                        replaced = job.replaced
+                        if replaced:
+                            self._stuck -= 1
+                        job.done.set()
+
+                if replaced:
+                    # 이미 다른 워커가 대신하고 있으므로 브라우저를 닫고 종료
+                    break
+                if job.cancelled and pool is not None:
+                    # 시간 제한을 넘긴 작업 뒤에는 멈췄을 수 있는 브라우저를 새로 띄움
+                    pool.close()
+                    pool = None
+        finally:
+            if pool is not None:
+                pool.close()
+
+    def _render(self, job, get_pool, get_weasy_renderer):
+        if job.profile == "pptx":
+            from create_ppt import create_music_marketing_ppt_bytes
+            return create_music_marketing_ppt_bytes(tracer=self.tracer)
+
+        # base_dir에 있는 것처럼 다루지만 파일로 쓰지는 않음 (상대 경로 리소스 기준)
+        name = f".render_job_{uuid.uuid4().hex}.html"
+        html_file = os.path.join(self.base_dir, name)
+
+        if job.profile == "weasyprint":
+            # 요청 HTML이 file:// 주소로 base_dir 밖의 파일을 읽거나 외부 요청을 보내지 못하도록 resolver로 제한
+            from create_pdf import render_pdf_with_weasyprint
+            return render_pdf_with_weasyprint(html_file, tracer=self.tracer, html_content=job.html,
+                                              renderer=get_weasy_renderer())
+
+        # 요청 HTML은 메모리 리소스로, 나머지는 base_dir 파일로 제공하고 외부 요청은 막음
+        # 렌더링도 남은 시간 안에 끝나도록 playwright 단계마다 timeout을 넘김
+        resolver = AssetResolver(self.base_dir, assets={name: job.html}, external=self.external,
+                                 allowed=self.allowed_assets)
+        timeout = job.deadline - time.perf_counter()
+        if job.profile == "portrait":
+            from simple_pdf import render_pdf
+            return render_pdf(get_pool(), html_file, tracer=self.tracer, resolver=resolver, timeout=timeout)
+
+        from landscape_pdf import render_landscape_pdf
+        return render_landscape_pdf(get_pool(), html_file, tracer=self.tracer, resolver=resolver, timeout=timeout)
+
+    def metrics(self):
+        """큐 길이, 처리 중인 작업 수, 누적 건수, 프로필별 처리 시간 통계"""
+
+        with self._lock:
+            latency = {profile: list(values) for profile, values in self._latency.items()}
+            queue_wait = list(self._queue_wait)
+            counters = dict(self._counters)
+            in_flight = self._in_flight
+            stuck = self._stuck
+
+        return {
+            "uptime_seconds": round(time.time() - self._started_at, 3) if self._started_at else 0.0,
+            "workers": self.workers,
+            "queue_depth": self._jobs.qsize(),
+            "max_pending": self.max_pending,
+            "in_flight": in_flight,
+            "stuck_workers": stuck,
+            **counters,
+            "queue_wait_seconds": {
+                "p50": _percentile(queue_wait, 50),
+                "p95": _percentile(queue_wait, 95),
+            },
+            "latency_seconds": {
+                profile: {
+                    "count": len(values),
+                    "p50": _percentile(values, 50),
+                    "p95": _percentile(values, 95),
+                    "p99": _percentile(values, 99),
+                }
+                for profile, values in latency.items() if values
+            },
+        }
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """POST /render, GET /metrics, GET /healthz 처리 (self.server.service: RenderService)"""
+
+    server_version = "RenderService/1.0"
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/metrics":
+            self._send_json(200, self.server.service.metrics())
+        elif path == "/healthz":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": f"알 수 없는 경로: {path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/render":
+            self._send_json(404, {"error": f"알 수 없는 경로: {url.path}"})
+            return
+
+        profile = parse_qs(url.query).get("profile", ["landscape"])[0]
+        if profile not in PROFILES:
+            self._send_json(400, {"error": f"알 수 없는 프로필: {profile} (가능: {', '.join(PROFILES)})"})
+            return
+
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self._send_json(411, {"error": "Content-Length가 필요합니다."})
+            return
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # 음수면 rfile.read(-1)이 연결이 닫힐 때까지 읽으므로 거부
+            self._send_json(400, {"error": "Content-Length가 올바르지 않습니다."})
+            return
+        if length > self.server.max_body_bytes:
+            self._send_json(413, {"error": f"본문이 너무 큽니다 (최대 {self.server.max_body_bytes} bytes)"})
+            return
+        html = self.rfile.read(length).decode('utf-8', errors='replace')
+
+        started = time.perf_counter()
+        try:
+            data = self.server.service.submit(profile, html)
+        except QueueFull as e:
+            self._send_json(429, {"error": str(e)}, {"Retry-After": "1"})
+            return
+        except JobTimeout as e:
+            self._send_json(504, {"error": str(e)})
+            return
+        except ServiceClosed as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}".splitlines()[0]})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES[profile])
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("X-Render-Seconds", f"{time.perf_counter() - started:.4f}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def create_server(service, host="127.0.0.1", port=DEFAULT_PORT, max_body_bytes=DEFAULT_MAX_BODY_BYTES,
+                  verbose=False):
+    """service를 사용하는 HTTP 서버 생성 (port=0이면 빈 포트 자동 선택, server.server_address로 확인)"""
+
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.max_body_bytes = max_body_bytes
+    server.verbose = verbose
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTML을 PDF/PPTX로 변환하는 HTTP 렌더링 서비스를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본 {DEFAULT_PORT})")
+    parser.add_argument("--workers", type=int, default=2, help="워커 스레드 수 (기본 2)")
+    parser.add_argument("--max-pending", type=int, default=8, help="작업 큐 최대 크기 (넘으면 429, 기본 8)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_JOB_TIMEOUT, help=f"작업별 시간 제한(초, 기본 {DEFAULT_JOB_TIMEOUT})")
+    parser.add_argument("--max-renders", type=int, default=100, help="워커별 브라우저 재시작 전 최대 렌더링 수 (기본 100)")
+    parser.add_argument("--base-dir", default=_BASE_DIR, help="요청 HTML의 상대 경로 리소스 기준 폴더")
+    parser.add_argument("--site-page", default=DEFAULT_SITE_PAGE,
+                        help=f"--base-dir에서 이 페이지가 참조하는 리소스만 제공 (기본 {DEFAULT_SITE_PAGE})")
+    parser.add_argument("--external", choices=EXTERNAL_POLICIES, default="stub",
+                        help="외부 요청 처리 방식 (stub: 빈 응답, block: 차단, allow: 허용, 기본 stub)")
+    parser.add_argument("--no-warm", action="store_true", help="시작할 때 브라우저를 미리 실행하지 않음")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args(argv)
+
+    service = RenderService(workers=args.workers, max_pending=args.max_pending, job_timeout=args.timeout,
+                            max_renders=args.max_renders, base_dir=args.base_dir, warm=not args.no_warm,
+                            site_page=args.site_page,
+                            external=args.external)
+    server = create_server(service, args.host, args.port, verbose=args.verbose)
+
+    with service:
+        host, port = server.server_address[:2]
+        print(f"🚀 렌더링 서비스 시작: http://{host}:{port} (워커 {args.workers}개, 큐 {args.max_pending}건)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n🛑 렌더링 서비스를 종료합니다...")
+        finally:
+            server.server_close()
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더링 단계별 시간 측정 (트레이스)
+브라우저 실행, page.goto, networkidle 대기, 렌더 준비 신호 대기, page.pdf,
+weasyprint 폰트 설정/레이아웃, prs.save 등 단계마다 span 하나를 기록합니다.
+
+span 기록 (JSON-lines 파일의 한 줄, 콜백에 전달되는 사전):
+    {"trace": "3f2a...", "span": "page.pdf", "parent": "render", "start": 1718000000.123,
+     "duration_ms": 812.4, "bytes": 48213}
+
+사용 예:
+    tracer = Tracer(callback=print, trace_file="render_trace.jsonl")
+    simple_pdf.create_pdf("index.html", tracer=tracer)
+
+tracer를 넘기지 않아도 환경 변수 RENDER_TRACE_FILE에 파일 경로를 지정하면 해당 파일에 기록합니다.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+TRACE_FILE_ENV = "RENDER_TRACE_FILE"
+
+# 현재 열려 있는 span (스레드/asyncio 작업마다 따로 유지)
+_current_span = ContextVar("render_trace_current_span", default=None)
+
+class Tracer:
+    """단계별 span을 콜백과 JSON-lines 파일로 내보내는 트레이서
+
+    - callback: span이 끝날 때마다 기록 사전을 받아 호출할 함수
+    - trace_file: span을 한 줄씩 추가할 JSON-lines 파일 경로
+    """
+
+    def __init__(self, callback=None, trace_file=None):
+        self.callback = callback
+        self.trace_file = trace_file
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name, **attributes):
+        """단계 하나를 측정 (yield된 사전에 bytes 등 값을 추가하면 함께 기록됨)"""
+
+        parent = _current_span.get()
+        record = {
+            "trace": parent["trace"] if parent else uuid.uuid4().hex[:16],
+            "span": name,
+            "parent": parent["span"] if parent else None,
+            "start": round(time.time(), 6),
+            **attributes,
+        }
+
+        token = _current_span.set(record)
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            _current_span.reset(token)
+            self._emit(record)
+
+    def _emit(self, record):
+        if self.callback is not None:
+            self.callback(record)
+
+        if self.trace_file:
+            line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            with self._lock:
+                with open(self.trace_file, 'a', encoding='utf-8') as f:
+                    f.write(line)
+
+class _NullTracer:
+    """아무것도 기록하지 않는 트레이서 (트레이스를 켜지 않았을 때 사용)"""
+
+    @contextmanager
+    def span(self, name, **attributes):
+        yield {}
+
+NULL_TRACER = _NullTracer()
+
+_env_tracer = None
+
+def get_tracer(tracer=None):
+    """사용할 트레이서 반환 (tracer가 없으면 RENDER_TRACE_FILE 설정에 따라 파일 트레이서 또는 NULL_TRACER)"""
+
+    global _env_tracer
+
+    if tracer is not None:
+        return tracer
+
+    trace_file = os.environ.get(TRACE_FILE_ENV)
+    if not trace_file:
+        return NULL_TRACER
+
+    if _env_tracer is None or _env_tracer.trace_file != trace_file:
+        _env_tracer = Tracer(trace_file=trace_file)
+    return _env_tracer
+
+def output_size(output_file):
+    """출력 파일 크기 (스트림이거나 파일이 없으면 None)"""
+
+    if output_file is None or hasattr(output_file, "write"):
+        return None
+    try:
+        return os.path.getsize(output_file)
+    except OSError:
+        return None
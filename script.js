@@ -1,5 +1,72 @@
+// 렌더 준비 신호
+// PDF 변환 스크립트는 window.__renderReady === true 또는 'render-ready' 이벤트를 기다립니다.
+// load 이벤트, 진행 중인 애니메이션, 폰트 로딩이 모두 끝나면 신호를 보냅니다.
+const renderReady = {
+    pending: 0,
+    loaded: false,
+    fired: false,
+    
+    hold() {
+        this.pending++;
+    },
+    
+    release() {
+        this.pending = Math.max(0, this.pending - 1);
+        this.check();
+    },
+    
+    // 정해진 시간 뒤에 끝나는 애니메이션 등록
+    holdFor(ms) {
+        this.hold();
+        setTimeout(() => this.release(), ms);
+    },
+    
+    check() {
+        if (this.fired || !this.loaded || this.pending > 0) {
+            return;
+        }
+        
+        const fontsReady = document.fonts ? document.fonts.ready : Promise.resolve();
+        fontsReady.then(() => {
+            if (this.fired || this.pending > 0) {
+                return;
+            }
+            this.fired = true;
+            window.__renderReady = true;
+            document.dispatchEvent(new Event('render-ready'));
+        });
+    }
+};
+
+window.__renderReady = false;
+window.addEventListener('load', () => {
+    renderReady.loaded = true;
+    renderReady.check();
+});
+
+// 인쇄/렌더 모드
+// ?print (또는 ?render) 쿼리, window.__PRINT_MODE__ = true, print 미디어 중 하나라도 해당하면 켜집니다.
+// 스크롤/패럴랙스/애니메이션 처리를 모두 건너뛰고 최종 상태로 바로 표시하므로
+// 헤드리스 렌더러는 load 이벤트와 폰트 로딩만 기다리면 됩니다.
+const printMode = (() => {
+    const params = new URLSearchParams(window.location.search);
+    return window.__PRINT_MODE__ === true
+        || ['print', 'render'].some(name => params.has(name) && params.get(name) !== '0')
+        || (window.matchMedia !== undefined && window.matchMedia('print').matches);
+})();
+
+if (printMode) {
+    // CSS 애니메이션/트랜지션도 끄고 최종 상태로 고정
+    document.documentElement.classList.add('print-mode');
+}
+
 // DOM이 로드된 후 실행
 document.addEventListener('DOMContentLoaded', function() {
+    // 인쇄/렌더 모드에서는 화면 효과를 설치하지 않음 (요소는 처음부터 최종 상태)
+    if (printMode) {
+        return;
+    }
+    
     // 헤더 스크롤 효과
     handleHeaderScroll();
     
@@ -100,9 +167,14 @@ function handleSmoothScroll() {
 // 스크롤 애니메이션
 function handleScrollAnimations() {
     const animationElements = document.querySelectorAll('.about-item, .program-card, .benefit-item');
+    const observedElements = new WeakSet();
     
     const observer = new IntersectionObserver((entries) => {
         entries.forEach(entry => {
+            // 요소별 첫 관찰 결과가 나오면 렌더 대기 해제 (화면 밖 요소는 기다리지 않음)
+            const isFirstObservation = !observedElements.has(entry.target);
+            observedElements.add(entry.target);
+            
             if (entry.isIntersecting) {
                 entry.target.classList.add('fade-in-up');
                 
@@ -110,6 +182,15 @@ function handleScrollAnimations() {
                 const cards = Array.from(entry.target.parentNode.children);
                 const index = cards.indexOf(entry.target);
                 entry.target.style.animationDelay = `${index * 0.1}s`;
+                
+                if (isFirstObservation) {
+                    // fadeInUp 애니메이션(0.6초)이 끝날 때까지 대기
+                    renderReady.holdFor(index * 100 + 600);
+                }
+            }
+            
+            if (isFirstObservation) {
+                renderReady.release();
             }
         });
     }, {
@@ -118,6 +199,7 @@ function handleScrollAnimations() {
     });
     
     animationElements.forEach(element => {
+        renderReady.hold();
         observer.observe(element);
     });
 }
@@ -234,12 +316,14 @@ function animateHeroSection() {
     const heroDescription = document.querySelector('.hero-description');
     const heroButtons = document.querySelector('.hero-buttons');
     const floatingCards = document.querySelectorAll('.floating-card');
+    const transitionMs = 800;
     
     // 텍스트 애니메이션
     if (heroTitle) {
         heroTitle.style.opacity = '0';
         heroTitle.style.transform = 'translateY(50px)';
         
+        renderReady.holdFor(200 + transitionMs);
         setTimeout(() => {
             heroTitle.style.transition = 'all 0.8s ease';
             heroTitle.style.opacity = '1';
@@ -251,6 +335,7 @@ function animateHeroSection() {
         heroDescription.style.opacity = '0';
         heroDescription.style.transform = 'translateY(30px)';
         
+        renderReady.holdFor(400 + transitionMs);
         setTimeout(() => {
             heroDescription.style.transition = 'all 0.8s ease';
             heroDescription.style.opacity = '1';
@@ -262,6 +347,7 @@ function animateHeroSection() {
         heroButtons.style.opacity = '0';
         heroButtons.style.transform = 'translateY(20px)';
         
+        renderReady.holdFor(600 + transitionMs);
         setTimeout(() => {
             heroButtons.style.transition = 'all 0.8s ease';
             heroButtons.style.opacity = '1';
@@ -274,6 +360,7 @@ function animateHeroSection() {
         card.style.opacity = '0';
         card.style.transform = 'translateY(100px)';
         
+        renderReady.holdFor(800 + (index * 200) + transitionMs);
         setTimeout(() => {
             card.style.transition = 'all 0.8s ease';
             card.style.opacity = '1';
@@ -284,9 +371,15 @@ function animateHeroSection() {
 
 // 카운터 애니메이션 (통계 표시용)
 function animateCounter(element, target, duration = 2000) {
+    if (printMode) {
+        element.textContent = target;
+        return;
+    }
+    
     let start = 0;
     const increment = target / (duration / 16);
     
+    renderReady.hold();
     const timer = setInterval(() => {
         start += increment;
         element.textContent = Math.floor(start);
@@ -294,12 +387,17 @@ function animateCounter(element, target, duration = 2000) {
         if (start >= target) {
             element.textContent = target;
             clearInterval(timer);
+            renderReady.release();
         }
     }, 16);
 }
 
 // 패럴랙스 효과 (선택사항)
 function handleParallax() {
+    if (printMode) {
+        return;
+    }
+    
     const heroSection = document.querySelector('.hero');
     
     window.addEventListener('scroll', () => {
@@ -355,6 +453,13 @@ style.textContent = `
         }
     }
     
+    .print-mode *,
+    .print-mode *::before,
+    .print-mode *::after {
+        animation: none !important;
+        transition: none !important;
+    }
+    
     .notification-content {
         display: flex;
         align-items: center;
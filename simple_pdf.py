@@ -5,15 +5,87 @@
 """
 
 import os
-from playwright.sync_api import sync_playwright
+from asset_resolver import AssetResolver, prepare_page
+from browser_pool import BrowserPool
+from render_output import deliver, is_stream
+from render_ready import DEFAULT_TIMEOUT_MS, PRINT_MODE_SCRIPT, deadline_after, time_left_ms, wait_for_render_ready
+from render_trace import get_tracer
 
-def create_pdf():
-    """HTML 웹페이지를 PDF로 변환"""
+VIEWPORT = {"width": 1200, "height": 800}
+
+PDF_OPTIONS = {
+    'format': 'A4',
+    'margin': {
+        'top': '15mm',
+        'right': '15mm', 
+        'bottom': '15mm',
+        'left': '15mm'
+    },
+    'print_background': True,
+    'prefer_css_page_size': False,
+    'display_header_footer': True,
+    'header_template': '<div style="font-size:10px; text-align:center; width:100%;">음원 마케팅 체험단</div>',
+    'footer_template': '<div style="font-size:10px; text-align:center; width:100%;"><span class="pageNumber"></span> / <span class="totalPages"></span></div>'
+}
+
+def render_pdf(pool, html_file_path, output_file=None, tracer=None, resolver=None, timeout=None):
+    """브라우저 풀의 페이지에서 HTML 파일을 PDF로 렌더링 (실패 시 예외 발생)
+    
+    output_file: 파일 경로, 바이너리 스트림, 또는 None (None이면 PDF 바이트 반환)
+    tracer: 단계별 시간을 기록할 render_trace.Tracer
+    resolver: 로컬 리소스만 제공하고 외부 요청을 막을 asset_resolver.AssetResolver
+    timeout: 렌더링 전체 시간 제한(초) - 페이지 로드와 대기 단계에 남은 시간을 넘기고, 넘으면 TimeoutError
+    """
+    
+    tracer = get_tracer(tracer)
+    deadline = deadline_after(timeout)
+    
+    with tracer.span("render", profile="portrait", input=html_file_path) as render_span:
+        # 뷰포트 설정 (데스크톱 크기)
+        with pool.page(viewport=VIEWPORT) as page:
+            # script.js 인쇄 모드 (스크롤/애니메이션 처리 생략)
+            page.add_init_script(PRINT_MODE_SCRIPT)
+            
+            # HTML 파일 로드
+            with tracer.span("page.goto"):
+                page.goto(prepare_page(page, html_file_path, resolver), timeout=time_left_ms(deadline))
+            
+            # 페이지가 완전히 로드될 때까지 대기
+            with tracer.span("page.wait_networkidle"):
+                page.wait_for_load_state('networkidle', timeout=time_left_ms(deadline))
+            
+            # 애니메이션 완료 신호 대기 (script.js의 렌더 준비 신호)
+            with tracer.span("page.wait_render_ready") as span:
+                span["ready"] = wait_for_render_ready(page, time_left_ms(deadline, DEFAULT_TIMEOUT_MS))
+            
+            # PDF 생성 (경로 없이 바이트로 받아 출력 대상에 전달, page.pdf에는 timeout이 없어 시작 전에만 확인)
+            with tracer.span("page.pdf") as span:
+                time_left_ms(deadline)
+                pdf_bytes = page.pdf(**PDF_OPTIONS)
+                span["bytes"] = render_span["bytes"] = len(pdf_bytes)
+            
+            with tracer.span("output.write"):
+                return deliver(pdf_bytes, output_file)
+
+def create_pdf_bytes(html_file="index.html", pool=None, tracer=None, offline=False):
+    """HTML 웹페이지를 PDF로 변환하여 바이트로 반환 (실패 시 예외 발생, offline: 외부 요청 차단)"""
+    
+    html_file_path = os.path.abspath(html_file)
+    resolver = AssetResolver.for_html(html_file_path) if offline else None
+    if pool is None:
+        with BrowserPool(size=1, tracer=tracer) as own_pool:
+            return render_pdf(own_pool, html_file_path, tracer=tracer, resolver=resolver)
+    return render_pdf(pool, html_file_path, tracer=tracer, resolver=resolver)
+
+def create_pdf(html_file="index.html", output_file="음원_마케팅_체험단.pdf", pool=None, tracer=None, offline=False):
+    """HTML 웹페이지를 PDF로 변환 (pool: 재사용할 BrowserPool, 없으면 새로 실행, tracer: 단계별 시간 기록)
+    
+    offline이 True이면 외부 요청(폰트 CDN 등)을 막고 로컬 리소스만 메모리에서 제공
+    """
     
     print("🎬 HTML to PDF 변환을 시작합니다...")
     
     # HTML 파일 확인
-    html_file = "index.html"
     if not os.path.exists(html_file):
         print(f"❌ {html_file} 파일을 찾을 수 없습니다.")
         return False
@@ -22,46 +94,18 @@ def create_pdf():
         print("📄 playwright를 사용하여 PDF를 생성합니다...")
         
         html_file_path = os.path.abspath(html_file)
-        output_file = "음원_마케팅_체험단.pdf"
+        resolver = AssetResolver.for_html(html_file_path) if offline else None
         
-        with sync_playwright() as p:
-            # 브라우저 실행
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            # 뷰포트 설정 (데스크톱 크기)
-            page.set_viewport_size({"width": 1200, "height": 800})
-            
-            # HTML 파일 로드
-            page.goto(f"file:///{html_file_path.replace(os.sep, '/')}")
-            
-            # 페이지가 완전히 로드될 때까지 대기
-            page.wait_for_load_state('networkidle')
-            
-            # 애니메이션 완료를 위한 추가 대기
-            page.wait_for_timeout(2000)  # 2초 대기
-            
-            # PDF 생성
-            page.pdf(
-                path=output_file,
-                format='A4',
-                margin={
-                    'top': '15mm',
-                    'right': '15mm', 
-                    'bottom': '15mm',
-                    'left': '15mm'
-                },
-                print_background=True,
-                prefer_css_page_size=False,
-                display_header_footer=True,
-                header_template='<div style="font-size:10px; text-align:center; width:100%;">음원 마케팅 체험단</div>',
-                footer_template='<div style="font-size:10px; text-align:center; width:100%;"><span class="pageNumber"></span> / <span class="totalPages"></span></div>'
-            )
-            
-            browser.close()
+        if pool is None:
+            # 풀이 주어지지 않으면 이번 변환에만 쓰는 브라우저를 실행
+            with BrowserPool(size=1, tracer=tracer) as own_pool:
+                render_pdf(own_pool, html_file_path, output_file, tracer, resolver)
+        else:
+            render_pdf(pool, html_file_path, output_file, tracer, resolver)
         
         print(f"✅ PDF 파일이 생성되었습니다: {output_file}")
-        print(f"📁 파일 위치: {os.path.abspath(output_file)}")
+        if not is_stream(output_file):
+            print(f"📁 파일 위치: {os.path.abspath(output_file)}")
         return True
         
     except Exception as e:
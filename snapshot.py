@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+섹션별 미리보기 이미지(PNG/WebP) 생성 스크립트 (SNS 미리보기용)
+PDF를 만든 뒤 이미지로 변환하는 대신, 페이지를 한 번 로드해서 섹션마다 스크린샷을 찍고
+지정한 너비들로 줄여 PNG/WebP로 저장합니다.
+
+- 스크린샷은 브라우저 스레드에서 순서대로 찍고, 크기 조절/인코딩은 스레드 풀에서 동시에 처리
+- 섹션 DOM, 그 섹션에 적용되는 CSS, 섹션이 참조하는 로컬 리소스(이미지, 배경, 폰트)의 수정 시각/크기를
+  해시해 출력 폴더의 .snapshot_state.json에 기록해 두고, 바뀌지 않은 섹션은 스크린샷부터 건너뜀
+- 너비/형식이 바뀌거나 섹션이 사라져 더 이상 만들지 않는 이전 이미지 파일은 삭제
+
+Pillow가 필요합니다: pip install pillow
+
+사용법:
+    python snapshot.py [index.html] [--output snapshots] [--width 1200 --width 600] [--format png --format webp]
+"""
+
+import argparse
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+from asset_resolver import VIRTUAL_HOST, AssetResolver, prepare_page
+from browser_pool import BrowserPool
+from landscape_pdf import SECTION_SNAPSHOT_SCRIPT, VIEWPORT, style_injection_script
+from render_ready import PRINT_MODE_SCRIPT, wait_for_render_ready
+from render_trace import get_tracer
+
+SNAPSHOT_DIR = "snapshots"
+STATE_FILE = ".snapshot_state.json"
+
+# 미리보기를 만들 섹션 (이름, 선택자) - 페이지에 없는 섹션은 건너뜀
+# 신청 섹션은 .hero 클래스도 가지므로 히어로 선택자에서 제외
+SNAPSHOT_SECTIONS = (
+    ("hero", "section.hero:not(.apply-section)"),
+    ("process", "section.process"),
+    ("programs", "section.programs"),
+    ("benefits", "section.benefits"),
+    ("apply", "#apply"),
+)
+
+DEFAULT_WIDTHS = (1200, 600)
+DEFAULT_FORMATS = ("png", "webp")
+DEVICE_SCALE_FACTOR = 2  # 가장 큰 너비도 선명하도록 2배로 찍고 줄임
+WEBP_QUALITY = 85
+
+# 형식별 Pillow 저장 옵션
+ENCODE_OPTIONS = {
+    "png": {"format": "PNG", "optimize": True},
+    "webp": {"format": "WEBP", "quality": WEBP_QUALITY, "method": 4},
+}
+
+# 고정 헤더(내비게이션)가 섹션 스크린샷 위를 덮지 않도록 숨김
+SNAPSHOT_CSS = ".header { display: none !important; }"
+
+# 섹션 HTML/CSS 안의 리소스 참조 (src, poster, href, srcset, url())
+_RESOURCE_REF = re.compile(
+    r'''\b(?:src|poster|href)\s*=\s*["']([^"']+)["']|\bsrcset\s*=\s*["']([^"']+)["']|url\(\s*["']?([^"')]+?)["']?\s*\)''',
+    re.IGNORECASE)
+
+# 선택자별로 SECTION_SNAPSHOT_SCRIPT 결과(문서 순서)에서의 위치를 찾음 (없으면 -1)
+SECTION_INDEX_SCRIPT = """
+([union, selectors]) => {
+    const sections = Array.from(document.querySelectorAll(union));
+    return selectors.map((selector) => sections.indexOf(document.querySelector(selector)));
+}
+"""
+
+def _resource_refs(text):
+    for src, srcset, url in _RESOURCE_REF.findall(text):
+        if srcset:
+            for candidate in srcset.split(","):
+                yield from candidate.split()[:1]
+        else:
+            yield src or url
+
+def resource_fingerprint(text, base_dirs):
+    """text(HTML/CSS)가 참조하는 로컬 리소스 파일의 [(경로, 수정 시각, 크기)]
+
+    같은 주소의 이미지/폰트 파일만 바뀌어도 해시가 달라지도록 섹션 해시에 포함합니다.
+    base_dirs: 상대 경로를 풀 기준 폴더 목록 (첫 번째는 HTML 폴더 = render.local 기준, 나머지는 스타일시트 폴더)
+    """
+
+    from render_cache import is_local_reference
+
+    entries = set()
+    for ref in _resource_refs(text):
+        ref = html.unescape(ref).split('#')[0].split('?')[0]
+        parsed = urlparse(ref)
+        if parsed.scheme == "file":
+            candidates = [url2pathname(parsed.path)]
+        elif parsed.netloc == VIRTUAL_HOST:
+            candidates = [os.path.join(base_dirs[0], *unquote(parsed.path).lstrip("/").split("/"))]
+        elif is_local_reference(ref):
+            candidates = [os.path.join(base_dir, unquote(ref)) for base_dir in base_dirs]
+        else:
+            continue
+
+        for path in candidates:
+            path = os.path.normpath(path)
+            if os.path.isfile(path):
+                stat = os.stat(path)
+                entries.add((path, stat.st_mtime_ns, stat.st_size))
+    return sorted(entries)
+
+def snapshot_keys(snapshot, indexes, options, base_dirs=()):
+    """섹션 이름별 해시 (섹션 DOM/CSS/리소스 + 공통 DOM/CSS/리소스 + 이미지 옵션 + 렌더러 버전)
+
+    base_dirs: 리소스 상대 경로 기준 폴더 목록 (비어 있으면 리소스 파일은 확인하지 않음)
+    """
+
+    from render_cache import package_version
+
+    def resources(part):
+        return resource_fingerprint(part["html"] + "\n" + part["css"], base_dirs) if base_dirs else []
+
+    base = hashlib.sha256()
+    base.update(json.dumps({
+        "shared": snapshot["shared"],
+        "shared_resources": resources(snapshot["shared"]),
+        "options": options,
+        "renderer": f"playwright=={package_version('playwright')}",
+    }, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+    keys = {}
+    for name, index in indexes.items():
+        section = snapshot["sections"][index]
+        digest = base.copy()
+        digest.update(json.dumps([section["html"], section["css"], resources(section)],
+                                 ensure_ascii=False).encode('utf-8'))
+        keys[name] = digest.hexdigest()
+    return keys
+
+def resource_dirs(html_file):
+    """리소스 상대 경로 기준 폴더 (HTML 폴더 + 로컬 스타일시트 폴더)"""
+
+    from render_cache import collect_local_assets
+
+    dirs = [os.path.dirname(html_file)]
+    for path in collect_local_assets(html_file):
+        if path.lower().endswith(".css") and os.path.dirname(path) not in dirs:
+            dirs.append(os.path.dirname(path))
+    return dirs
+
+def encode_snapshot(png_bytes, output_dir, name, widths, formats):
+    """스크린샷(PNG 바이트)을 너비별/형식별로 줄여 저장하고 파일 경로 목록 반환 (스레드 풀에서 실행)
+
+    원본보다 큰 너비는 원본 크기로 저장합니다.
+    """
+
+    from PIL import Image
+
+    paths = []
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        image.load()
+        for width in widths:
+            if width < image.width:
+                height = max(1, round(image.height * width / image.width))
+                resized = image.resize((width, height), Image.LANCZOS)
+            else:
+                resized = image
+            for image_format in formats:
+                path = os.path.join(output_dir, f"{name}-{width}.{image_format}")
+                buffer = io.BytesIO()
+                resized.save(buffer, **ENCODE_OPTIONS[image_format])
+                # 쓰는 도중의 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체
+                temp_path = path + ".tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(buffer.getvalue())
+                os.replace(temp_path, path)
+                paths.append(path)
+    return paths
+
+def _load_state(output_dir):
+    try:
+        with open(os.path.join(output_dir, STATE_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def render_section_snapshots(pool, html_file, output_dir=SNAPSHOT_DIR, widths=DEFAULT_WIDTHS, formats=DEFAULT_FORMATS,
+                             sections=SNAPSHOT_SECTIONS, scale=DEVICE_SCALE_FACTOR, workers=None, force=False,
+                             tracer=None, resolver=None):
+    """페이지를 한 번 로드해 섹션별 미리보기 이미지를 만들고 결과 요약 반환 (실패 시 예외 발생)
+
+    sections: (이름, 선택자) 목록
+    workers: 인코딩 스레드 수 (None이면 ThreadPoolExecutor 기본값)
+    force: 바뀌지 않은 섹션도 다시 생성
+    resolver: 로컬 리소스만 제공하고 외부 요청을 막을 asset_resolver.AssetResolver
+    """
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        raise ImportError("미리보기 이미지를 만들려면 Pillow가 필요합니다: pip install pillow")
+
+    unknown = [image_format for image_format in formats if image_format not in ENCODE_OPTIONS]
+    if unknown:
+        raise ValueError(f"알 수 없는 이미지 형식: {', '.join(unknown)} (가능: {', '.join(ENCODE_OPTIONS)})")
+
+    tracer = get_tracer(tracer)
+    html_file_path = os.path.abspath(html_file)
+    os.makedirs(output_dir, exist_ok=True)
+
+    previous_state = _load_state(output_dir)
+    state = {} if force else previous_state
+    options = {
+        "viewport": VIEWPORT,
+        "scale": scale,
+        "widths": list(widths),
+        "formats": list(formats),
+        "encode": {image_format: ENCODE_OPTIONS[image_format] for image_format in formats},
+        "css": SNAPSHOT_CSS,
+        "offline": resolver is not None,
+    }
+    union = ", ".join(selector for _, selector in sections)
+
+    written = {}
+    skipped = []
+    with tracer.span("render", profile="snapshot", input=html_file_path) as render_span:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            with pool.page(viewport=VIEWPORT, device_scale_factor=scale) as page:
+                page.add_init_script(style_injection_script(SNAPSHOT_CSS))
+                # script.js 인쇄 모드 (애니메이션을 끄고 최종 상태로 표시)
+                page.add_init_script(PRINT_MODE_SCRIPT)
+
+                with tracer.span("page.goto"):
+                    page.goto(prepare_page(page, html_file_path, resolver))
+
+                with tracer.span("page.wait_networkidle"):
+                    page.wait_for_load_state('networkidle')
+
+                with tracer.span("page.wait_render_ready") as span:
+                    span["ready"] = wait_for_render_ready(page)
+
+                with tracer.span("sections.snapshot") as span:
+                    snapshot = page.evaluate(SECTION_SNAPSHOT_SCRIPT, union)
+                    positions = page.evaluate(SECTION_INDEX_SCRIPT, [union, [selector for _, selector in sections]])
+                    indexes = {name: index for (name, _), index in zip(sections, positions) if index >= 0}
+                    keys = snapshot_keys(snapshot, indexes, options, resource_dirs(html_file_path))
+                    span["sections"] = len(keys)
+
+                for name, selector in sections:
+                    if name not in keys:
+                        continue
+                    previous = state.get(name, {})
+                    if previous.get("hash") == keys[name] and all(os.path.exists(path) for path in previous.get("files", [])):
+                        skipped.append(name)
+                        continue
+
+                    with tracer.span("section.screenshot", section=name) as span:
+                        png_bytes = page.locator(selector).first.screenshot(type="png", animations="disabled")
+                        span["bytes"] = len(png_bytes)
+                    # 인코딩은 다음 섹션 스크린샷과 겹쳐서 진행
+                    futures[name] = executor.submit(encode_snapshot, png_bytes, output_dir, name, widths, formats)
+
+            with tracer.span("sections.encode") as span:
+                for name, future in futures.items():
+                    written[name] = future.result()
+                span["files"] = sum(len(paths) for paths in written.values())
+
+        render_span["rendered_sections"] = len(written)
+
+    # 페이지에서 사라진 섹션의 기록은 정리
+    new_state = {name: state[name] for name in skipped}
+    new_state.update({name: {"hash": keys[name], "files": paths} for name, paths in written.items()})
+
+    # 이전에 만들었지만 이번 목록에 없는 파일 (너비/형식 변경, 사라진 섹션) 삭제
+    current = {os.path.abspath(path) for entry in new_state.values() for path in entry["files"]}
+    removed = []
+    for entry in previous_state.values():
+        for path in entry.get("files", []):
+            if (os.path.abspath(path) not in current and os.path.dirname(os.path.abspath(path)) == os.path.abspath(output_dir)
+                    and os.path.isfile(path)):
+                os.remove(path)
+                removed.append(path)
+
+    with open(os.path.join(output_dir, STATE_FILE), 'w', encoding='utf-8') as f:
+        json.dump(new_state, f, ensure_ascii=False, indent=2)
+
+    return {
+        "written": written,
+        "skipped": skipped,
+        "removed": removed,
+        "missing": [name for name, _ in sections if name not in keys],
+    }
+
+def create_section_snapshots(html_file="index.html", output_dir=SNAPSHOT_DIR, widths=DEFAULT_WIDTHS,
+                             formats=DEFAULT_FORMATS, pool=None, tracer=None, offline=False, force=False,
+                             scale=DEVICE_SCALE_FACTOR):
+    """HTML 웹페이지의 섹션별 미리보기 이미지 생성 (pool: 재사용할 BrowserPool, offline: 외부 요청 차단)"""
+
+    print("🎬 섹션 미리보기 이미지 생성을 시작합니다...")
+
+    if not os.path.exists(html_file):
+        print(f"❌ {html_file} 파일을 찾을 수 없습니다.")
+        return False
+
+    try:
+        resolver = AssetResolver.for_html(html_file) if offline else None
+        render = lambda p: render_section_snapshots(p, html_file, output_dir, widths, formats, scale=scale,
+                                                    force=force, tracer=tracer, resolver=resolver)
+        if pool is None:
+            with BrowserPool(size=1, tracer=tracer) as own_pool:
+                result = render(own_pool)
+        else:
+            result = render(pool)
+    except Exception as e:
+        print(f"❌ 미리보기 이미지 생성 중 오류가 발생했습니다: {e}")
+        return False
+
+    for name, paths in result["written"].items():
+        print(f"🖼️ {name}: {len(paths)}개 파일")
+    if result["skipped"]:
+        print(f"🗄️ 바뀌지 않은 섹션 {len(result['skipped'])}개 건너뜀: {', '.join(result['skipped'])}")
+    if result["removed"]:
+        print(f"🧹 더 이상 만들지 않는 이전 파일 {len(result['removed'])}개 삭제")
+    if result["missing"]:
+        print(f"⚠️ 페이지에 없는 섹션: {', '.join(result['missing'])}")
+    print(f"📁 출력 폴더: {os.path.abspath(output_dir)}")
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTML 웹페이지의 섹션별 미리보기 이미지(PNG/WebP)를 생성합니다.")
+    parser.add_argument("input", nargs="?", default="index.html", help="입력 HTML (기본 index.html)")
+    parser.add_argument("--output", default=SNAPSHOT_DIR, help=f"출력 폴더 (기본 {SNAPSHOT_DIR})")
+    parser.add_argument("--width", type=int, action="append", help="이미지 너비(px), 여러 번 지정 가능 (기본 1200, 600)")
+    parser.add_argument("--format", action="append", choices=sorted(ENCODE_OPTIONS),
+                        help="이미지 형식, 여러 번 지정 가능 (기본 png, webp)")
+    parser.add_argument("--scale", type=float, default=DEVICE_SCALE_FACTOR, help=f"스크린샷 배율 (기본 {DEVICE_SCALE_FACTOR})")
+    parser.add_argument("--offline", action="store_true", help="외부 요청(폰트 CDN 등)을 막고 로컬 리소스만 사용")
+    parser.add_argument("--force", action="store_true", help="바뀌지 않은 섹션도 다시 생성")
+    args = parser.parse_args(argv)
+
+    success = create_section_snapshots(
+        args.input, args.output,
+        widths=tuple(args.width or DEFAULT_WIDTHS),
+        formats=tuple(args.format or DEFAULT_FORMATS),
+        offline=args.offline, force=args.force, scale=args.scale,
+    )
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    sys.exit(main())